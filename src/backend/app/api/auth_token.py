@@ -1,7 +1,7 @@
 """FastAPI dependency for API token authentication."""
 
 import hashlib
-import time
+import math
 from datetime import UTC, datetime
 
 from fastapi import Depends, HTTPException, Security
@@ -9,17 +9,47 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.db.engine import get_session
 from app.models import ApiToken
-
-# In-memory cache: token_hash -> (user_id, cached_at)
-_token_cache: dict[str, tuple[str, float]] = {}
+from app.services import invalidation
+from app.services.cache import MISSING, TTLCache
+from app.services.rate_limit import TokenBucketLimiter
+from app.services.token_usage import token_usage
 
 TOKEN_CACHE_TTL = 300  # seconds
+TOKEN_NEGATIVE_CACHE_TTL = 60  # seconds, for unknown or revoked tokens
+TOKEN_CACHE_MAX_SIZE = 10_000
 TOKEN_PREFIX = "fyt_"
 
+# In-memory cache: token_hash -> user_id, or None for unknown/revoked tokens
+_token_cache = TTLCache(
+    "api_token",
+    max_size=TOKEN_CACHE_MAX_SIZE,
+    ttl_seconds=TOKEN_CACHE_TTL,
+    negative_ttl_seconds=TOKEN_NEGATIVE_CACHE_TTL,
+)
+
 _bearer = HTTPBearer()
 
+token_rate_limiter = TokenBucketLimiter(
+    settings.burn_token_rate_limit_per_minute, settings.burn_token_rate_limit_burst
+)
+user_rate_limiter = TokenBucketLimiter(
+    settings.burn_user_rate_limit_per_minute, settings.burn_user_rate_limit_burst
+)
+
+
+def _enforce_rate_limit(limiter: TokenBucketLimiter, key: str) -> None:
+    """Raise HTTP 429 with Retry-After when key's bucket is empty."""
+    retry_after = limiter.acquire(key)
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=429,
+            detail="Rate limit exceeded",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
 
 async def get_api_token_user(
     credentials: HTTPAuthorizationCredentials = Security(_bearer),  # noqa: B008
@@ -28,8 +58,17 @@ async def get_api_token_user(
     """FastAPI dependency that validates a bearer API token and returns user_id.
 
     Raises HTTP 401 for tokens that are missing the expected prefix, not found,
-    revoked, or expired. Uses an in-memory cache with a 300-second TTL to
-    reduce database lookups on repeated requests.
+    revoked, or expired. Uses a bounded in-memory cache with a 300-second TTL
+    (60 seconds for unknown or revoked tokens) to reduce database lookups on
+    repeated requests.
+
+    Raises HTTP 429 (with Retry-After) when the token's or the user's rate
+    limit bucket is empty. The token bucket is checked before any lookup and
+    the user bucket before anything is written, so a cached token that is
+    being throttled never reaches the database.
+
+    Nothing is written in the request path: the use is recorded in memory and
+    last_used_at is flushed in batches by app.services.token_usage.
     """
     token = credentials.credentials
 
@@ -37,13 +76,15 @@ async def get_api_token_user(
         raise HTTPException(status_code=401, detail="Invalid API token")
 
     token_hash = hashlib.sha256(token.encode()).hexdigest()
+    _enforce_rate_limit(token_rate_limiter, token_hash)
 
     cached = _token_cache.get(token_hash)
-    if cached is not None:
-        user_id, cached_at = cached
-        if time.time() - cached_at < TOKEN_CACHE_TTL:
-            return user_id
-        del _token_cache[token_hash]
+    if cached is None:
+        raise HTTPException(status_code=401, detail="Invalid or revoked API token")
+    if cached is not MISSING:
+        _enforce_rate_limit(user_rate_limiter, cached)
+        token_usage.record(token_hash)
+        return cached
 
     stmt = select(ApiToken).where(
         ApiToken.token_hash == token_hash,
@@ -53,24 +94,30 @@ async def get_api_token_user(
     api_token = result.scalar_one_or_none()
 
     if api_token is None:
+        _token_cache.set(token_hash, None)
         raise HTTPException(status_code=401, detail="Invalid or revoked API token")
 
     if api_token.expires_at is not None and api_token.expires_at < datetime.now(UTC):
         raise HTTPException(status_code=401, detail="API token has expired")
 
-    api_token.last_used_at = datetime.now(UTC)
-    await session.commit()
+    _enforce_rate_limit(user_rate_limiter, str(api_token.user_id))
 
     user_id = str(api_token.user_id)
-    _token_cache[token_hash] = (user_id, time.time())
+    _token_cache.set(token_hash, user_id)
+    token_usage.record(token_hash)
 
     return user_id
 
 
 def clear_token_cache(token_hash: str) -> None:
-    """Remove a token hash from the in-memory cache.
+    """Remove a token hash from this process's in-memory cache.
 
-    Call this after revoking a token so subsequent requests are not
-    served from the stale cache entry.
+    Use publish_token_revocation to reach every worker.
     """
-    _token_cache.pop(token_hash, None)
+    _token_cache.invalidate(token_hash)
+
+
+async def publish_token_revocation(session: AsyncSession, token_hash: str) -> None:
+    """Drop a revoked token from the cache of every worker once session commits."""
+    await invalidation.publish(session, _token_cache.name, key=token_hash)
+
@@ -1,22 +1,37 @@
 """Burn ingest REST endpoints — plugin API for recording token burns."""
 
+import json
+from collections.abc import AsyncIterator, Callable
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy import Date, cast, exists, false, func, literal, select, true, union_all
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
 from ulid import ULID
 
 from app.api.auth_token import get_api_token_user
-from app.db.engine import get_session
+from app.config import settings
+from app.db.engine import get_session, get_session_factory
 from app.models.build_activity import BuildActivity
+from app.models.burn_ingest_key import BurnIngestKey
 from app.models.user import User
-from app.services.project_resolution import resolve_project
+from app.models.user_daily_burn import UserDailyBurn
+from app.models.user_weekly_burn import UserWeeklyBurn
+from app.services import burn_service, ingest_keys
+from app.services.burn_buffer import burn_buffer
+from app.services.project_resolution import resolve_project, resolve_projects
 
 router = APIRouter(tags=["burn"])
 
+MAX_BATCH_SIZE = 500
+IMPORT_CHUNK_SIZE = MAX_BATCH_SIZE
+MAX_IMPORT_LINE_BYTES = 64 * 1024
+
 
 class BurnIngestRequest(BaseModel):
     tokens_burned: int = Field(gt=0)
@@ -38,66 +53,96 @@ class BurnIngestResponse(BaseModel):
     day_total: int
 
 
+class BurnIngestBatchRequest(BaseModel):
+    items: list[BurnIngestRequest] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BurnIngestBatchResponse(BaseModel):
+    status: str = "ok"
+    results: list[BurnIngestResponse]
+    day_totals: dict[str, int]
+
+
+def _parse_activity_date(value: str | None) -> date:
+    """Parse an optional YYYY-MM-DD string, defaulting to today."""
+    if not value:
+        return date.today()
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid activity_date format, expected YYYY-MM-DD",
+        ) from None
+
+
 async def _get_day_total(
     session: AsyncSession, user_id: str, target_date: date
 ) -> int:
-    """Sum all tokens burned by a user on a given date."""
-    stmt = select(func.sum(BuildActivity.tokens_burned)).where(
-        BuildActivity.user_id == user_id,
-        BuildActivity.activity_date == target_date,
+    """Total tokens burned by a user on a given date, from the daily rollup."""
+    stmt = select(UserDailyBurn.tokens).where(
+        UserDailyBurn.user_id == user_id,
+        UserDailyBurn.activity_date == target_date,
     )
     result = await session.execute(stmt)
     total = result.scalar_one_or_none()
     return int(total) if total else 0
 
 
-@router.post("/ingest", response_model=BurnIngestResponse)
-async def ingest_burn(
-    body: BurnIngestRequest,
-    user_id: str = Depends(get_api_token_user),  # noqa: B008
-    session: AsyncSession = Depends(get_session),  # noqa: B008
-) -> BurnIngestResponse:
-    """Record a token burn from a plugin, returning cumulative day totals.
+async def _get_day_totals(
+    session: AsyncSession, user_id: str, target_dates: set[date]
+) -> dict[date, int]:
+    """Total tokens burned by a user for each of the given dates in one query."""
+    stmt = select(UserDailyBurn.activity_date, UserDailyBurn.tokens).where(
+        UserDailyBurn.user_id == user_id,
+        UserDailyBurn.activity_date.in_(target_dates),
+    )
+    result = await session.execute(stmt)
+    totals = {row.activity_date: int(row.tokens) for row in result.all()}
+    return {d: totals.get(d, 0) for d in target_dates}
 
-    Idempotent when session_id is provided — repeated calls with the same
-    session_id return the existing record without creating duplicates.
-    """
-    # Idempotency: return existing record for known session_id
-    if body.session_id:
-        existing_stmt = select(BuildActivity).where(
-            BuildActivity.session_id == body.session_id,
-            BuildActivity.user_id == user_id,
-        )
-        result = await session.execute(existing_stmt)
-        existing = result.scalar_one_or_none()
-        if existing is not None:
-            day_total = await _get_day_total(session, user_id, existing.activity_date)
-            return BurnIngestResponse(
-                burn_id=existing.id,
-                project_id=existing.project_id,
-                project_matched=existing.project_id is not None,
-                day_total=day_total,
-            )
 
+async def _replay(session: AsyncSession, user_id: str, session_id: str) -> BurnIngestResponse:
+    """Answer a replayed session_id with its original burn and the current day total."""
+    replays = await ingest_keys.get_replays(session, user_id, [session_id])
+    burn_id, project_id, activity_date = replays[session_id]
+    day_total = await _get_day_total(session, user_id, activity_date)
+    return BurnIngestResponse(
+        burn_id=burn_id,
+        project_id=project_id,
+        project_matched=project_id is not None,
+        day_total=day_total,
+    )
+
+
+async def _ingest_sequential(
+    session: AsyncSession,
+    user_id: str,
+    body: BurnIngestRequest,
+) -> BurnIngestResponse:
+    """Ingest path issuing the key claim, upsert and day total as separate statements."""
     # Resolve project from hint
     project_id: str | None = None
     if body.project_hint:
         project_id = await resolve_project(session, user_id, body.project_hint)
 
-    # Parse activity_date
-    if body.activity_date:
-        try:
-            target_date = date.fromisoformat(body.activity_date)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid activity_date format, expected YYYY-MM-DD",
-            ) from None
-    else:
-        target_date = date.today()
+    target_date = _parse_activity_date(body.activity_date)
+    new_id = str(ULID())
+
+    # Idempotency: claim the session_id, or answer from the ledger if already claimed
+    if body.session_id:
+        claimed = await ingest_keys.claim_keys(session, [{
+            "user_id": user_id,
+            "session_id": body.session_id,
+            "burn_id": new_id,
+            "project_id": project_id,
+            "activity_date": target_date,
+            "source": body.source,
+        }])
+        if not claimed:
+            return await _replay(session, user_id, body.session_id)
 
     # Upsert BuildActivity — additive on tokens_burned for the same day/source
-    new_id = str(ULID())
     stmt = (
         insert(BuildActivity)
         .values(
@@ -128,6 +173,7 @@ async def ingest_burn(
     )
     result = await session.execute(stmt)
     burn_id = result.scalar_one()
+    await burn_service.adjust_burn_rollups(session, {(user_id, target_date): body.tokens_burned})
     await session.commit()
 
     day_total = await _get_day_total(session, user_id, target_date)
@@ -140,6 +186,521 @@ async def ingest_burn(
     )
 
 
+async def _ingest_single_statement(
+    session: AsyncSession,
+    user_id: str,
+    body: BurnIngestRequest,
+) -> BurnIngestResponse:
+    """Ingest path folding the key claim, upsert, rollup and day total into one CTE statement.
+
+    The user_daily_burn increment RETURNING its new value doubles as the day
+    total (user_weekly_burn is bumped alongside it); a replayed session_id is
+    answered from its ledger row and the rollup row for the original day.
+    Only a project resolution cache miss adds a round trip.
+    """
+    project_id: str | None = None
+    if body.project_hint:
+        project_id = await resolve_project(session, user_id, body.project_hint)
+
+    target_date = _parse_activity_date(body.activity_date)
+    new_id = str(ULID())
+
+    table = BuildActivity.__table__
+    keys = BurnIngestKey.__table__
+    claimed = None
+    if body.session_id:
+        claimed = (
+            insert(BurnIngestKey)
+            .values(
+                user_id=user_id,
+                session_id=body.session_id,
+                burn_id=new_id,
+                project_id=project_id,
+                activity_date=target_date,
+                source=body.source,
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", "session_id"])
+            .returning(BurnIngestKey.session_id)
+            .cte("claimed")
+        )
+
+    row_values = {
+        "id": new_id,
+        "user_id": user_id,
+        "project_id": project_id,
+        "activity_date": target_date,
+        "tokens_burned": body.tokens_burned,
+        "source": body.source,
+        "verification": body.verification,
+        "tool": body.tool,
+        "session_id": body.session_id,
+        "token_precision": body.token_precision,
+        "metadata": body.metadata,
+    }
+    new_row = select(
+        *(cast(literal(value), table.c[name].type).label(name) for name, value in row_values.items())
+    )
+    if claimed is not None:
+        new_row = new_row.where(exists(select(claimed.c.session_id)))
+    insert_stmt = insert(BuildActivity).from_select(list(row_values), new_row)
+    upserted = (
+        insert_stmt.on_conflict_do_update(
+            constraint="uq_build_activity_per_day",
+            set_={
+                "tokens_burned": BuildActivity.tokens_burned + insert_stmt.excluded.tokens_burned,
+                "verification": insert_stmt.excluded.verification,
+                "tool": insert_stmt.excluded.tool,
+                "session_id": insert_stmt.excluded.session_id,
+                "token_precision": insert_stmt.excluded.token_precision,
+                "metadata": insert_stmt.excluded["metadata"],
+            },
+        )
+        .returning(
+            BuildActivity.id,
+            BuildActivity.user_id,
+            BuildActivity.project_id,
+            BuildActivity.activity_date,
+        )
+        .cte("upserted")
+    )
+
+    rollup_insert = insert(UserDailyBurn).from_select(
+        ["user_id", "activity_date", "tokens"],
+        select(
+            upserted.c.user_id,
+            upserted.c.activity_date,
+            cast(literal(body.tokens_burned), UserDailyBurn.tokens.type),
+        ),
+    )
+    rolled_up = (
+        rollup_insert.on_conflict_do_update(
+            index_elements=[UserDailyBurn.user_id, UserDailyBurn.activity_date],
+            set_={"tokens": UserDailyBurn.tokens + rollup_insert.excluded.tokens},
+        )
+        .returning(UserDailyBurn.tokens)
+        .cte("rolled_up")
+    )
+    weekly_insert = insert(UserWeeklyBurn).from_select(
+        ["user_id", "week_start", "tokens"],
+        select(
+            upserted.c.user_id,
+            cast(func.date_trunc("week", upserted.c.activity_date), Date),
+            cast(literal(body.tokens_burned), UserWeeklyBurn.tokens.type),
+        ),
+    )
+    weekly_rolled_up = (
+        weekly_insert.on_conflict_do_update(
+            index_elements=[UserWeeklyBurn.user_id, UserWeeklyBurn.week_start],
+            set_={"tokens": UserWeeklyBurn.tokens + weekly_insert.excluded.tokens},
+        )
+        .returning(UserWeeklyBurn.week_start)
+        .cte("weekly_rolled_up")
+    )
+
+    stmt = select(
+        upserted.c.id,
+        upserted.c.project_id,
+        rolled_up.c.tokens.label("day_total"),
+    ).select_from(
+        upserted.join(rolled_up, true()).join(weekly_rolled_up, true())
+    )
+    if claimed is not None:
+        replay_total = (
+            select(UserDailyBurn.tokens)
+            .where(
+                UserDailyBurn.user_id == keys.c.user_id,
+                UserDailyBurn.activity_date == keys.c.activity_date,
+            )
+            .scalar_subquery()
+        )
+        stmt = union_all(
+            select(
+                ingest_keys.resolved_burn_id().label("id"),
+                keys.c.project_id,
+                func.coalesce(replay_total, 0).label("day_total"),
+            ).where(
+                keys.c.user_id == user_id,
+                keys.c.session_id == body.session_id,
+                ~exists(select(claimed.c.session_id)),
+            ),
+            stmt,
+        )
+
+    row = (await session.execute(stmt)).one_or_none()
+    if row is None:
+        # The key was claimed by a concurrent request that committed after
+        # this statement's snapshot was taken; its ledger row is visible now.
+        return await _replay(session, user_id, body.session_id)
+    await session.commit()
+
+    return BurnIngestResponse(
+        burn_id=row.id,
+        project_id=row.project_id,
+        project_matched=row.project_id is not None,
+        day_total=int(row.day_total),
+    )
+
+
+async def _ingest_buffered(
+    session: AsyncSession,
+    user_id: str,
+    body: BurnIngestRequest,
+) -> BurnIngestResponse:
+    """Ingest path adding the increment to the in-process write-behind buffer.
+
+    Only reads hit the database; the write is coalesced with other increments
+    for the same row and persisted, with its ledger key, by the buffer's next
+    flush. day_total is the persisted value plus whatever is still buffered
+    for that day.
+    """
+    if body.session_id:
+        acknowledged = burn_buffer.acknowledged(user_id, body.session_id)
+        if acknowledged is None:
+            replays = await ingest_keys.get_replays(session, user_id, [body.session_id])
+            acknowledged = replays.get(body.session_id)
+        if acknowledged is not None:
+            burn_id, project_id, activity_date = acknowledged
+            day_total = await _get_day_total(session, user_id, activity_date)
+            return BurnIngestResponse(
+                burn_id=burn_id,
+                project_id=project_id,
+                project_matched=project_id is not None,
+                day_total=day_total + burn_buffer.day_total(user_id, activity_date),
+            )
+
+    project_id: str | None = None
+    if body.project_hint:
+        project_id = await resolve_project(session, user_id, body.project_hint)
+
+    target_date = _parse_activity_date(body.activity_date)
+
+    # Persisted day total and, for project rows, the id of the row the
+    # buffered increment will eventually be added to.
+    persisted_total = (
+        select(UserDailyBurn.tokens)
+        .where(
+            UserDailyBurn.user_id == user_id,
+            UserDailyBurn.activity_date == target_date,
+        )
+        .scalar_subquery()
+    )
+    existing_row = (
+        select(BuildActivity.id)
+        .where(
+            BuildActivity.user_id == user_id,
+            BuildActivity.project_id == project_id if project_id is not None else false(),
+            BuildActivity.activity_date == target_date,
+            BuildActivity.source == body.source,
+        )
+        .scalar_subquery()
+    )
+    persisted_stmt = select(
+        func.coalesce(persisted_total, 0).label("total"),
+        existing_row.label("existing_id"),
+    )
+    persisted = (await session.execute(persisted_stmt)).one()
+
+    burn_id = burn_buffer.add(
+        user_id=user_id,
+        project_id=project_id,
+        activity_date=target_date,
+        source=body.source,
+        tokens_burned=body.tokens_burned,
+        verification=body.verification,
+        tool=body.tool,
+        session_id=body.session_id,
+        token_precision=body.token_precision,
+        metadata=body.metadata,
+        persisted_id=persisted.existing_id,
+    )
+
+    return BurnIngestResponse(
+        burn_id=burn_id,
+        project_id=project_id,
+        project_matched=project_id is not None,
+        day_total=int(persisted.total) + burn_buffer.day_total(user_id, target_date),
+    )
+
+
+@router.post("/ingest", response_model=BurnIngestResponse)
+async def ingest_burn(
+    body: BurnIngestRequest,
+    user_id: str = Depends(get_api_token_user),  # noqa: B008
+    session: AsyncSession = Depends(get_session),  # noqa: B008
+) -> BurnIngestResponse:
+    """Record a token burn from a plugin, returning cumulative day totals.
+
+    Idempotent when session_id is provided — repeated calls with the same
+    session_id return the existing record without creating duplicates.
+    The write path is chosen by settings.burn_ingest_mode.
+    """
+    if settings.burn_ingest_mode == "sequential":
+        return await _ingest_sequential(session, user_id, body)
+    if settings.burn_ingest_mode == "buffered":
+        return await _ingest_buffered(session, user_id, body)
+    return await _ingest_single_statement(session, user_id, body)
+
+
+async def _ingest_items(
+    session: AsyncSession,
+    user_id: str,
+    items: list[BurnIngestRequest],
+    target_dates: list[date],
+) -> tuple[list[BurnIngestResponse], dict[date, int]]:
+    """Record validated items with one lookup, one resolution pass, one upsert and one commit.
+
+    Returns the per-item responses and the day totals of every date touched.
+    Items sharing a session_id (with earlier writes or within this call) are
+    acknowledged without being counted twice.
+    """
+    hints = [item.project_hint for item in items if item.project_hint]
+    project_ids = await resolve_projects(session, user_id, hints) if hints else {}
+    item_projects = [
+        project_ids.get(item.project_hint) if item.project_hint else None for item in items
+    ]
+    item_ids = [str(ULID()) for _ in items]
+
+    # Idempotency: claim every session_id in the batch with one ledger insert;
+    # the ones already claimed are answered from the ledger
+    existing: dict[str, ingest_keys.Replay] = {}
+    first_index: dict[str, int] = {}
+    for index, item in enumerate(items):
+        if item.session_id:
+            first_index.setdefault(item.session_id, index)
+    if first_index:
+        claimed = await ingest_keys.claim_keys(session, [
+            {
+                "user_id": user_id,
+                "session_id": session_id,
+                "burn_id": item_ids[index],
+                "project_id": item_projects[index],
+                "activity_date": target_dates[index],
+                "source": items[index].source,
+            }
+            for session_id, index in first_index.items()
+        ])
+        if len(claimed) < len(first_index):
+            existing = await ingest_keys.get_replays(
+                session, user_id, set(first_index) - claimed
+            )
+
+    # Coalesce items that hit the same uq_build_activity_per_day row, since a
+    # single INSERT ... ON CONFLICT cannot update the same row twice. Rows
+    # without a project never conflict (NULLs are distinct), so each item
+    # keeps its own row, exactly as with sequential /ingest calls.
+    rows: dict[tuple, dict] = {}
+    item_keys: list[tuple | None] = []
+    batch_sessions: dict[str, tuple] = {}
+    for index, (item, target_date) in enumerate(zip(items, target_dates, strict=True)):
+        if item.session_id in existing:
+            item_keys.append(None)
+            continue
+        if item.session_id in batch_sessions:
+            item_keys.append(batch_sessions[item.session_id])
+            continue
+
+        project_id = item_projects[index]
+        key = (project_id, target_date, item.source) if project_id is not None else (index,)
+        values = rows.get(key)
+        if values is None:
+            rows[key] = {
+                "id": item_ids[index],
+                "user_id": user_id,
+                "project_id": project_id,
+                "activity_date": target_date,
+                "tokens_burned": item.tokens_burned,
+                "source": item.source,
+                "verification": item.verification,
+                "tool": item.tool,
+                "session_id": item.session_id,
+                "token_precision": item.token_precision,
+                "metadata_": item.metadata,
+            }
+        else:
+            values["tokens_burned"] += item.tokens_burned
+            values.update(
+                verification=item.verification,
+                tool=item.tool,
+                session_id=item.session_id,
+                token_precision=item.token_precision,
+                metadata_=item.metadata,
+            )
+        if item.session_id:
+            batch_sessions[item.session_id] = key
+        item_keys.append(key)
+
+    upserted = await burn_service.upsert_activities(session, list(rows.values()))
+    burn_ids = {
+        key: values["id"] if values["project_id"] is None else upserted[key]
+        for key, values in rows.items()
+    }
+    await session.commit()
+
+    touched: list[tuple[str, str | None, date]] = []
+    for item, key in zip(items, item_keys, strict=True):
+        if key is None:
+            touched.append(existing[item.session_id])
+        else:
+            values = rows[key]
+            touched.append((burn_ids[key], values["project_id"], values["activity_date"]))
+
+    day_totals = await _get_day_totals(session, user_id, {d for _, _, d in touched})
+
+    results = [
+        BurnIngestResponse(
+            burn_id=burn_id,
+            project_id=project_id,
+            project_matched=project_id is not None,
+            day_total=day_totals[target_date],
+        )
+        for burn_id, project_id, target_date in touched
+    ]
+    return results, day_totals
+
+
+@router.post("/ingest/batch", response_model=BurnIngestBatchResponse)
+async def ingest_burn_batch(
+    body: BurnIngestBatchRequest,
+    user_id: str = Depends(get_api_token_user),  # noqa: B008
+    session: AsyncSession = Depends(get_session),  # noqa: B008
+) -> BurnIngestBatchResponse:
+    """Record many token burns in one request, e.g. a plugin backfilling after being offline.
+
+    Same semantics as /ingest applied item by item, but with one idempotency
+    lookup, one project resolution pass, one multi-row upsert and one commit
+    for the whole batch. Items sharing a session_id (with an earlier batch or
+    within this one) are acknowledged without being counted twice.
+    """
+    target_dates = [_parse_activity_date(item.activity_date) for item in body.items]
+    results, day_totals = await _ingest_items(session, user_id, body.items, target_dates)
+
+    return BurnIngestBatchResponse(
+        results=results,
+        day_totals={str(d): total for d, total in sorted(day_totals.items())},
+    )
+
+
+async def _ndjson_lines(request: Request) -> AsyncIterator[tuple[int, bytes | None]]:
+    """Yield (line_number, line) from a streamed body without buffering it whole.
+
+    Blank lines are skipped. A line longer than MAX_IMPORT_LINE_BYTES is
+    discarded as it arrives and yielded as None so it can be reported.
+    """
+    pending = bytearray()
+    line_number = 0
+    overlong = False
+    async for chunk in request.stream():
+        pending += chunk
+        while (newline := pending.find(b"\n")) != -1:
+            line = bytes(pending[:newline]).strip()
+            del pending[: newline + 1]
+            line_number += 1
+            if overlong or len(line) > MAX_IMPORT_LINE_BYTES:
+                overlong = False
+                yield line_number, None
+            elif line:
+                yield line_number, line
+        if len(pending) > MAX_IMPORT_LINE_BYTES:
+            overlong = True
+            pending.clear()
+    line = bytes(pending).strip()
+    if overlong or line:
+        yield line_number + 1, None if overlong or len(line) > MAX_IMPORT_LINE_BYTES else line
+
+
+def _ndjson(event: dict) -> bytes:
+    return json.dumps(event).encode() + b"\n"
+
+
+class _BodyStreamingResponse(StreamingResponse):
+    """StreamingResponse whose generator is still reading the request body.
+
+    StreamingResponse watches for a client disconnect by receiving from the
+    same ASGI channel as request.stream(), which would swallow body chunks
+    the generator is waiting for. This one only sends; a client that goes
+    away surfaces as a failed send or a ClientDisconnect from the body.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError as exc:
+            raise ClientDisconnect() from exc
+        if self.background is not None:
+            await self.background()
+
+
+@router.post("/import")
+async def import_burns(
+    request: Request,
+    user_id: str = Depends(get_api_token_user),  # noqa: B008
+    session_factory: Callable[[], AsyncSession] = Depends(get_session_factory),  # noqa: B008
+) -> StreamingResponse:
+    """Backfill historical burns from a streamed application/x-ndjson body.
+
+    Each line is one BurnIngestRequest. Lines are validated as they arrive and
+    written IMPORT_CHUNK_SIZE at a time through the batch ingest path, so memory
+    stays constant however large the upload. The response is itself NDJSON:
+    an {"line", "error"} event per rejected line, a {"committed", "lines"}
+    progress event after each chunk, and a final {"status": "ok", ...} summary.
+    Chunks already committed stay committed if the upload is cut short.
+
+    The body is read and written while the response streams, after this
+    endpoint has returned, so the generator opens its own session instead of
+    relying on the request's one still being open.
+    """
+
+    async def events() -> AsyncIterator[bytes]:
+        async with session_factory() as session:
+            async for event in _import_events(request, session, user_id):
+                yield event
+
+    return _BodyStreamingResponse(events(), media_type="application/x-ndjson")
+
+
+async def _import_events(
+    request: Request, session: AsyncSession, user_id: str
+) -> AsyncIterator[bytes]:
+    """The NDJSON events of an import, ingesting the body as it is read."""
+    chunk: list[BurnIngestRequest] = []
+    chunk_dates: list[date] = []
+    lines = committed = errors = 0
+
+    async for line_number, line in _ndjson_lines(request):
+        lines = line_number
+        try:
+            if line is None:
+                raise ValueError(f"Line exceeds {MAX_IMPORT_LINE_BYTES} bytes")
+            item = BurnIngestRequest.model_validate_json(line)
+            target_date = _parse_activity_date(item.activity_date)
+        except ValidationError as exc:
+            errors += 1
+            # The input of a line that is not JSON is raw bytes, which json.dumps rejects
+            detail = exc.errors(include_url=False, include_context=False, include_input=False)
+            yield _ndjson({"line": line_number, "error": detail})
+            continue
+        except (ValueError, HTTPException) as exc:
+            errors += 1
+            detail = exc.detail if isinstance(exc, HTTPException) else str(exc)
+            yield _ndjson({"line": line_number, "error": detail})
+            continue
+
+        chunk.append(item)
+        chunk_dates.append(target_date)
+        if len(chunk) == IMPORT_CHUNK_SIZE:
+            await _ingest_items(session, user_id, chunk, chunk_dates)
+            committed += len(chunk)
+            chunk, chunk_dates = [], []
+            yield _ndjson({"committed": committed, "lines": lines})
+
+    if chunk:
+        await _ingest_items(session, user_id, chunk, chunk_dates)
+        committed += len(chunk)
+        yield _ndjson({"committed": committed, "lines": lines})
+
+    yield _ndjson({"status": "ok", "lines": lines, "committed": committed, "errors": errors})
+
+
 @router.get("/verify-token")
 async def verify_token(
     user_id: str = Depends(get_api_token_user),  # noqa: B008
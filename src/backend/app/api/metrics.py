@@ -0,0 +1,47 @@
+"""Prometheus-style metrics endpoint for in-process counters."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.services.cache import cache_metrics
+from app.services.password_hashing import password_hasher
+
+router = APIRouter(tags=["metrics"])
+
+_CACHE_COUNTERS = ("hits", "misses", "evictions", "expirations", "invalidations")
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> str:
+    """Expose cache and password hashing counters in the Prometheus text format."""
+    caches = cache_metrics()
+    lines: list[str] = []
+    for counter in _CACHE_COUNTERS:
+        lines.append(f"# TYPE fyt_cache_{counter}_total counter")
+        lines.extend(
+            f'fyt_cache_{counter}_total{{cache="{name}"}} {stats[counter]}'
+            for name, stats in caches.items()
+        )
+    for gauge in ("size", "max_size"):
+        lines.append(f"# TYPE fyt_cache_{gauge} gauge")
+        lines.extend(
+            f'fyt_cache_{gauge}{{cache="{name}"}} {stats[gauge]}'
+            for name, stats in caches.items()
+        )
+
+    hasher = password_hasher.stats
+    lines += [
+        "# TYPE fyt_password_hash_completed_total counter",
+        f"fyt_password_hash_completed_total {hasher.completed}",
+        "# TYPE fyt_password_hash_failed_total counter",
+        f"fyt_password_hash_failed_total {hasher.failed}",
+        "# TYPE fyt_password_hash_rejected_total counter",
+        f"fyt_password_hash_rejected_total {hasher.rejected}",
+        "# TYPE fyt_password_hash_in_flight gauge",
+        f"fyt_password_hash_in_flight {hasher.in_flight}",
+        "# TYPE fyt_password_hash_queue_depth gauge",
+        f"fyt_password_hash_queue_depth {password_hasher.queue_depth}",
+        "# TYPE fyt_password_hash_max_queue_depth gauge",
+        f"fyt_password_hash_max_queue_depth {hasher.max_queue_depth}",
+    ]
+    return "\n".join(lines) + "\n"
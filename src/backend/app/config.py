@@ -4,6 +4,8 @@ Uses Pydantic Settings to load configuration from environment variables
 with proper typing and defaults.
 """
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -16,6 +18,44 @@ class Settings(BaseSettings):
     secret_key: str = "dev-insecure-key-change-in-production"
     jwt_algorithm: str = "HS256"
 
+    # Burn ingest write path: "single_statement" folds the idempotency check,
+    # upsert and day total into one CTE; "sequential" issues them one by one;
+    # "buffered" coalesces increments in memory and flushes them periodically.
+    burn_ingest_mode: Literal["single_statement", "sequential", "buffered"] = "single_statement"
+    burn_buffer_flush_seconds: float = 5.0
+
+    # Burn history compaction: build_activities rows older than the horizon
+    # are folded into per-week build_activity_periods rows.
+    # An interval of 0 disables the background job (manage.py can still run it).
+    burn_compaction_horizon_days: int = 365
+    burn_compaction_interval_seconds: float = 0
+
+    # Ingest idempotency ledger: session_id keys older than the TTL are swept
+    # every interval (0 disables the background sweep; manage.py can still run it).
+    burn_ingest_key_ttl_days: int = 30
+    burn_ingest_key_sweep_interval_seconds: float = 3600
+
+    # Burn API rate limits: token buckets per API token and per user, refilling
+    # at the per-minute rate up to the burst size. A rate of 0 disables a limit.
+    burn_token_rate_limit_per_minute: float = 60
+    burn_token_rate_limit_burst: int = 30
+    burn_user_rate_limit_per_minute: float = 120
+    burn_user_rate_limit_burst: int = 60
+
+    # API token last_used_at is recorded in memory at auth time and flushed
+    # in batches every interval (0 disables the background flush).
+    api_token_usage_flush_seconds: float = 60
+
+    # Cache invalidations are fanned out to every worker over Postgres
+    # LISTEN/NOTIFY; each worker holds one extra connection for the listener.
+    cache_invalidation_listen: bool = True
+
+    # Password hashing: bcrypt cost factor, and the dedicated thread pool it
+    # runs in (calls beyond workers + max queue are refused as RATE_LIMITED).
+    password_hash_rounds: int = 12
+    password_hash_workers: int = 4
+    password_hash_max_queue: int = 64
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
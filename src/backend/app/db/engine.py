@@ -1,6 +1,6 @@
 """Database engine and session factory for async SQLAlchemy."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
@@ -45,3 +45,14 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
+
+
+def get_session_factory() -> Callable[[], AsyncSession]:
+    """
+    FastAPI dependency returning the session factory itself.
+
+    For work that outlives the endpoint, such as a streamed response, which
+    must open its own session rather than rely on the request's one still
+    being open.
+    """
+    return async_session_factory
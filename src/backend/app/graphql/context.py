@@ -7,15 +7,17 @@ from strawberry.fastapi import BaseContext
 
 from app.config import settings
 from app.db import get_session
+from app.graphql.dataloaders import Loaders
 
 
 class Context(BaseContext):
-    """GraphQL context containing database session and user information."""
+    """GraphQL context containing database session, user information, and dataloaders."""
 
     def __init__(self, session: AsyncSession, current_user_id: str | None = None):
         super().__init__()
         self.session = session
         self.current_user_id = current_user_id
+        self.loaders = Loaders(session)
 
 
 def _extract_user_id(request: Request) -> str | None:
@@ -0,0 +1,292 @@
+"""Request-scoped Strawberry dataloaders that batch per-object lookups into one query.
+
+Every resolver reaches them through ``info.context.loaders`` (a ``Loaders``),
+so related objects requested anywhere in one operation — a project's
+collaborators under a list of projects, a tribe's members under a user — are
+fetched with one query per relationship instead of one per parent.
+
+Loaders dispatch their batches concurrently, but an AsyncSession runs one
+statement at a time, so batch functions take the session's loader lock.
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.dataloader import DataLoader
+
+from app.graphql.types.burn import BurnSummaryType
+from app.models.enums import CollaboratorStatus, MemberRole, MemberStatus
+from app.models.project import Project, project_collaborators
+from app.models.project_milestone import ProjectMilestone
+from app.models.skill import Skill
+from app.models.tribe import Tribe, TribeOpenRole, tribe_members
+from app.models.user import User, user_skills
+from app.services import burn_service
+
+# (user_id, weeks)
+BurnSummaryKey = tuple[str, int]
+
+
+@dataclass
+class Collaborator:
+    """A project_collaborators row with its user."""
+
+    user: User
+    role: str | None
+    status: CollaboratorStatus
+    invited_at: datetime
+    confirmed_at: datetime | None
+
+
+@dataclass
+class TribeMembership:
+    """A tribe_members row with its user."""
+
+    user: User
+    role: MemberRole
+    status: MemberStatus
+    joined_at: datetime | None
+    requested_role_id: str | None
+
+
+def _lock(session: AsyncSession) -> asyncio.Lock:
+    """The lock serializing this session's loader queries."""
+    return session.info.setdefault("dataloader_lock", asyncio.Lock())
+
+
+def _grouped(keys: list[str], pairs: Iterable[tuple[Hashable, object]]) -> list[list]:
+    """Collect (key, value) pairs into one list per requested key, in key order."""
+    groups: dict[Hashable, list] = defaultdict(list)
+    for key, value in pairs:
+        groups[key].append(value)
+    return [groups[key] for key in keys]
+
+
+def burn_summary_loader(session: AsyncSession) -> DataLoader[BurnSummaryKey, BurnSummaryType]:
+    """Batch burn summaries requested in the same tick into one query per window size."""
+
+    async def load(keys: list[BurnSummaryKey]) -> list[BurnSummaryType]:
+        user_ids_by_weeks: dict[int, list[str]] = defaultdict(list)
+        for user_id, weeks in keys:
+            user_ids_by_weeks[weeks].append(user_id)
+
+        summaries: dict[BurnSummaryKey, BurnSummaryType] = {}
+        async with _lock(session):
+            for weeks, user_ids in user_ids_by_weeks.items():
+                data = await burn_service.get_summaries(session, user_ids, weeks=weeks)
+                for user_id, summary in data.items():
+                    summaries[(user_id, weeks)] = BurnSummaryType.from_dict(summary)
+        return [summaries[key] for key in keys]
+
+    return DataLoader(load_fn=load)
+
+
+def user_loader(session: AsyncSession) -> DataLoader[str, User | None]:
+    """Users by id; None for ids that do not exist."""
+
+    async def load(keys: list[str]) -> list[User | None]:
+        async with _lock(session):
+            result = await session.execute(select(User).where(User.id.in_(keys)))
+        by_id = {user.id: user for user in result.scalars()}
+        return [by_id.get(key) for key in keys]
+
+    return DataLoader(load_fn=load)
+
+
+def skills_by_user_loader(session: AsyncSession) -> DataLoader[str, list[Skill]]:
+    """Each user's skills, by name."""
+
+    async def load(keys: list[str]) -> list[list[Skill]]:
+        stmt = (
+            select(user_skills.c.user_id, Skill)
+            .select_from(user_skills)
+            .join(Skill, Skill.id == user_skills.c.skill_id)
+            .where(user_skills.c.user_id.in_(keys))
+            .order_by(Skill.name)
+        )
+        async with _lock(session):
+            result = await session.execute(stmt)
+        return _grouped(keys, result.tuples())
+
+    return DataLoader(load_fn=load)
+
+
+def projects_by_owner_loader(session: AsyncSession) -> DataLoader[str, list[Project]]:
+    """Projects owned by each user, most recently updated first."""
+
+    async def load(keys: list[str]) -> list[list[Project]]:
+        stmt = (
+            select(Project)
+            .where(Project.owner_id.in_(keys))
+            .order_by(Project.updated_at.desc())
+        )
+        async with _lock(session):
+            result = await session.execute(stmt)
+        return _grouped(keys, ((p.owner_id, p) for p in result.scalars()))
+
+    return DataLoader(load_fn=load)
+
+
+def milestones_by_project_loader(
+    session: AsyncSession,
+) -> DataLoader[str, list[ProjectMilestone]]:
+    """Each project's milestones, by date."""
+
+    async def load(keys: list[str]) -> list[list[ProjectMilestone]]:
+        stmt = (
+            select(ProjectMilestone)
+            .where(ProjectMilestone.project_id.in_(keys))
+            .order_by(ProjectMilestone.date)
+        )
+        async with _lock(session):
+            result = await session.execute(stmt)
+        return _grouped(keys, ((m.project_id, m) for m in result.scalars()))
+
+    return DataLoader(load_fn=load)
+
+
+def collaborators_by_project_loader(
+    session: AsyncSession, users: DataLoader[str, User | None]
+) -> DataLoader[str, list[Collaborator]]:
+    """Each project's collaborators with their role and status, in invitation order.
+
+    The users fetched along the way are primed into ``users``.
+    """
+
+    async def load(keys: list[str]) -> list[list[Collaborator]]:
+        stmt = (
+            select(
+                project_collaborators.c.project_id,
+                project_collaborators.c.role,
+                project_collaborators.c.status,
+                project_collaborators.c.invited_at,
+                project_collaborators.c.confirmed_at,
+                User,
+            )
+            .select_from(project_collaborators)
+            .join(User, User.id == project_collaborators.c.user_id)
+            .where(project_collaborators.c.project_id.in_(keys))
+            .order_by(project_collaborators.c.invited_at)
+        )
+        async with _lock(session):
+            rows = (await session.execute(stmt)).all()
+        users.prime_many({row.User.id: row.User for row in rows})
+        return _grouped(
+            keys,
+            (
+                (
+                    row.project_id,
+                    Collaborator(
+                        user=row.User,
+                        role=row.role,
+                        status=row.status,
+                        invited_at=row.invited_at,
+                        confirmed_at=row.confirmed_at,
+                    ),
+                )
+                for row in rows
+            ),
+        )
+
+    return DataLoader(load_fn=load)
+
+
+def members_by_tribe_loader(
+    session: AsyncSession, users: DataLoader[str, User | None]
+) -> DataLoader[str, list[TribeMembership]]:
+    """Each tribe's membership rows (any status), in request order.
+
+    The users fetched along the way are primed into ``users``.
+    """
+
+    async def load(keys: list[str]) -> list[list[TribeMembership]]:
+        stmt = (
+            select(
+                tribe_members.c.tribe_id,
+                tribe_members.c.role,
+                tribe_members.c.status,
+                tribe_members.c.joined_at,
+                tribe_members.c.requested_role_id,
+                User,
+            )
+            .select_from(tribe_members)
+            .join(User, User.id == tribe_members.c.user_id)
+            .where(tribe_members.c.tribe_id.in_(keys))
+            .order_by(tribe_members.c.requested_at)
+        )
+        async with _lock(session):
+            rows = (await session.execute(stmt)).all()
+        users.prime_many({row.User.id: row.User for row in rows})
+        return _grouped(
+            keys,
+            (
+                (
+                    row.tribe_id,
+                    TribeMembership(
+                        user=row.User,
+                        role=row.role,
+                        status=row.status,
+                        joined_at=row.joined_at,
+                        requested_role_id=row.requested_role_id,
+                    ),
+                )
+                for row in rows
+            ),
+        )
+
+    return DataLoader(load_fn=load)
+
+
+def tribes_by_member_loader(session: AsyncSession) -> DataLoader[str, list[Tribe]]:
+    """Tribes each user has a membership row in (any status), in request order."""
+
+    async def load(keys: list[str]) -> list[list[Tribe]]:
+        stmt = (
+            select(tribe_members.c.user_id, Tribe)
+            .select_from(tribe_members)
+            .join(Tribe, Tribe.id == tribe_members.c.tribe_id)
+            .where(tribe_members.c.user_id.in_(keys))
+            .order_by(tribe_members.c.requested_at)
+        )
+        async with _lock(session):
+            result = await session.execute(stmt)
+        return _grouped(keys, result.tuples())
+
+    return DataLoader(load_fn=load)
+
+
+def open_roles_by_tribe_loader(session: AsyncSession) -> DataLoader[str, list[TribeOpenRole]]:
+    """Each tribe's open roles, oldest first."""
+
+    async def load(keys: list[str]) -> list[list[TribeOpenRole]]:
+        stmt = (
+            select(TribeOpenRole)
+            .where(TribeOpenRole.tribe_id.in_(keys))
+            .order_by(TribeOpenRole.id)
+        )
+        async with _lock(session):
+            result = await session.execute(stmt)
+        return _grouped(keys, ((r.tribe_id, r) for r in result.scalars()))
+
+    return DataLoader(load_fn=load)
+
+
+class Loaders:
+    """The dataloaders of one request, all bound to its session."""
+
+    def __init__(self, session: AsyncSession):
+        self.burn_summary = burn_summary_loader(session)
+        self.users = user_loader(session)
+        self.skills_by_user = skills_by_user_loader(session)
+        self.projects_by_owner = projects_by_owner_loader(session)
+        self.milestones_by_project = milestones_by_project_loader(session)
+        self.collaborators_by_project = collaborators_by_project_loader(session, self.users)
+        self.tribes_by_member = tribes_by_member_loader(session)
+        self.members_by_tribe = members_by_tribe_loader(session, self.users)
+        self.open_roles_by_tribe = open_roles_by_tribe_loader(session)
+
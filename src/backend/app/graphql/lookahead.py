@@ -0,0 +1,45 @@
+"""Field lookahead: what a client selected below the field being resolved.
+
+Resolvers use it to skip work for fields nobody asked for — loading a
+relationship or counting rows the client will never see.
+"""
+
+from strawberry.types import Info
+from strawberry.types.nodes import SelectedField, Selection
+
+
+class Lookahead:
+    """The selection tree under a field, keyed by GraphQL field name.
+
+    Fragments are flattened and aliases merged, so a field counts as selected
+    however it was requested.
+    """
+
+    def __init__(self, tree: dict[str, dict] | None = None):
+        self._tree = tree or {}
+
+    @classmethod
+    def from_info(cls, info: Info) -> "Lookahead":
+        """Lookahead for the fields selected under the current resolver."""
+        tree: dict[str, dict] = {}
+        for field in info.selected_fields:
+            _merge(field.selections, tree)
+        return cls(tree)
+
+    def has(self, *path: str) -> bool:
+        """Whether the field at path (e.g. ``"projects", "collaborators"``) was selected."""
+        node = self._tree
+        for name in path:
+            if name not in node:
+                return False
+            node = node[name]
+        return True
+
+
+def _merge(selections: list[Selection], into: dict[str, dict]) -> None:
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            _merge(selection.selections, into.setdefault(selection.name, {}))
+        else:
+            # Fragment spreads and inline fragments select on the same object
+            _merge(selection.selections, into)
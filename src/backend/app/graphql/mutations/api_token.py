@@ -86,9 +86,9 @@ class ApiTokenMutations:
 
         api_token.revoked_at = datetime.now(UTC)
 
-        from app.api.auth_token import clear_token_cache
+        from app.api.auth_token import publish_token_revocation
 
-        clear_token_cache(api_token.token_hash)
+        await publish_token_revocation(session, api_token.token_hash)
         await session.commit()
         return True
 
@@ -7,25 +7,10 @@ from strawberry.types import Info
 
 from app.graphql.context import Context
 from app.graphql.helpers import require_auth
-from app.graphql.types.burn import BurnDayType, BurnSummaryType
+from app.graphql.types.burn import BurnSummaryType
 from app.services import burn_service
 
 
-def _dict_to_burn_summary(data: dict) -> BurnSummaryType:
-    """Convert burn_service dict to BurnSummaryType."""
-    return BurnSummaryType(
-        days_active=data["days_active"],
-        total_tokens=data["total_tokens"],
-        active_weeks=data["active_weeks"],
-        total_weeks=data["total_weeks"],
-        weekly_streak=data["weekly_streak"],
-        daily_activity=[
-            BurnDayType(date=d["date"], tokens=d["tokens"])
-            for d in data["daily_activity"]
-        ],
-    )
-
-
 @strawberry.type
 class BurnMutations:
     """Token burn CRUD mutations."""
@@ -52,7 +37,7 @@ class BurnMutations:
         )
         await session.commit()
         data = await burn_service.get_summary(session, user_id)
-        return _dict_to_burn_summary(data)
+        return BurnSummaryType.from_dict(data)
 
     @strawberry.mutation
     async def update_burn(
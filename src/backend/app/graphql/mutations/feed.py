@@ -9,18 +9,6 @@ from app.graphql.types.feed_event import FeedEventType
 from app.services import feed_service
 
 
-def _event_to_type(event) -> FeedEventType:
-    """Convert FeedEvent model to FeedEventType."""
-    return FeedEventType(
-        id=event.id,
-        event_type=event.event_type,
-        target_type=event.target_type,
-        target_id=event.target_id,
-        metadata=event.event_metadata,
-        created_at=event.created_at,
-    )
-
-
 @strawberry.type
 class FeedMutations:
     """Mutations for user-created feed posts."""
@@ -41,7 +29,7 @@ class FeedMutations:
             target_type=target_type, target_id=str(target_id),
             content=content,
         )
-        return _event_to_type(event)
+        return FeedEventType.from_model(event)
 
     @strawberry.mutation
     async def update_post(
@@ -58,7 +46,7 @@ class FeedMutations:
         )
         if event is None:
             return None
-        return _event_to_type(event)
+        return FeedEventType.from_model(event)
 
     @strawberry.mutation
     async def delete_post(
@@ -27,7 +27,6 @@ class TribeMutations:
         tribe = await tribe_service.create(
             session, owner_id=user_id, name=name, mission=mission, max_members=max_members,
         )
-        tribe = await tribe_service.get_with_details(session, tribe.id)
         return TribeType.from_model(tribe)
 
     @strawberry.mutation
@@ -47,7 +46,6 @@ class TribeMutations:
             session, tribe_id=str(id), user_id=user_id,
             name=name, mission=mission, status=status, max_members=max_members,
         )
-        tribe = await tribe_service.get_with_details(session, tribe.id)
         return TribeType.from_model(tribe)
 
     @strawberry.mutation
@@ -0,0 +1,112 @@
+"""Keyset (cursor) pagination for Relay-style connection fields.
+
+A page is the next ``first`` rows after a cursor in a (sort value, id)
+descending order. The cursor holds the last row's sort value and id, and the
+next page starts with a row-value comparison against it, which a composite
+index on the same two columns answers by seeking straight to that position —
+unlike OFFSET, which reads and discards every earlier row.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import strawberry
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+@strawberry.type
+class PageInfo:
+    """Where a connection page ends and whether there is more after it."""
+
+    has_next_page: bool
+    end_cursor: str | None
+
+
+@dataclass
+class Page[T]:
+    """Rows of one page, each with the cursor that points at it."""
+
+    rows: list[T]
+    cursors: list[str]
+    page_info: PageInfo
+    # Only counted when the client selected totalCount
+    total_count: int | None = None
+
+
+def encode_cursor(value: Any, id: str) -> str:
+    """Opaque cursor for the row with the given sort value and id."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([value, id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, sort_column: InstrumentedAttribute) -> tuple[Any, str]:
+    """The (sort value, id) a cursor points at; ValueError if it is not a cursor for this order."""
+    try:
+        value, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(id, str):
+            raise TypeError(id)
+        if sort_column.type.python_type is datetime:
+            value = datetime.fromisoformat(value)
+        elif sort_column.type.python_type is float:
+            value = float(value)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    return value, id
+
+
+async def fetch_page(
+    session: AsyncSession,
+    stmt: Select,
+    *,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    first: int,
+    after: str | None = None,
+    with_total: bool = False,
+) -> Page:
+    """Fetch the page of ``stmt``'s rows after the cursor, by sort value then id, descending.
+
+    ``stmt`` selects one entity and carries any filters but no ordering; with
+    ``with_total`` the rows matching those filters are counted as well.
+    """
+    if not 0 < first <= MAX_PAGE_SIZE:
+        raise ValueError(f"first must be between 1 and {MAX_PAGE_SIZE}")
+
+    page_stmt = stmt.order_by(sort_column.desc(), id_column.desc()).limit(first + 1)
+    if after is not None:
+        value, last_id = decode_cursor(after, sort_column)
+        page_stmt = page_stmt.where(tuple_(sort_column, id_column) < tuple_(value, last_id))
+
+    # One row past the page tells whether there is a next one
+    rows = list((await session.execute(page_stmt)).scalars())
+    has_next_page = len(rows) > first
+    rows = rows[:first]
+
+    sort_key, id_key = sort_column.key, id_column.key
+    cursors = [encode_cursor(getattr(row, sort_key), getattr(row, id_key)) for row in rows]
+
+    total_count = None
+    if with_total:
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+        total_count = (await session.execute(count_stmt)).scalar_one()
+
+    return Page(
+        rows=rows,
+        cursors=cursors,
+        page_info=PageInfo(
+            has_next_page=has_next_page,
+            end_cursor=cursors[-1] if cursors else None,
+        ),
+        total_count=total_count,
+    )
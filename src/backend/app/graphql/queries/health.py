@@ -2,55 +2,27 @@
 
 import strawberry
 from sqlalchemy import select, text
-from sqlalchemy.orm import selectinload
 from strawberry.types import Info
 
 from app.constants.tags import TAG_SUGGESTIONS
 from app.graphql.context import Context
 from app.graphql.helpers import require_auth
-from app.graphql.types.burn import BurnDayType as _BurnDayType
-from app.graphql.types.burn import BurnReceiptType, BurnSummaryType
+from app.graphql.lookahead import Lookahead
+from app.graphql.pagination import DEFAULT_PAGE_SIZE, fetch_page
+from app.graphql.types.burn import BurnBreakdownType, BurnReceiptType, BurnSummaryType
+from app.graphql.types.connection import Connection
 from app.graphql.types.feed_event import FeedEventType
 from app.graphql.types.project import InviteTokenInfoType, PendingInvitationType, ProjectType
 from app.graphql.types.tribe import TribeType
 from app.graphql.types.user import UserType
 from app.models.enums import ProjectStatus, TribeStatus
 from app.models.feed_event import FeedEvent
-from app.models.project import Project, project_collaborators
+from app.models.project import Project
 from app.models.tribe import Tribe
 from app.models.user import User
 from app.services import burn_service, project_service, tribe_service, user_service
 
 
-def _dict_to_burn_summary(data: dict) -> BurnSummaryType:
-    """Convert a burn_service.get_summary dict to BurnSummaryType."""
-    return BurnSummaryType(
-        days_active=data["days_active"],
-        total_tokens=data["total_tokens"],
-        active_weeks=data["active_weeks"],
-        total_weeks=data["total_weeks"],
-        weekly_streak=data["weekly_streak"],
-        daily_activity=[
-            _BurnDayType(date=d["date"], tokens=d["tokens"])
-            for d in data["daily_activity"]
-        ],
-    )
-
-
-def _dict_to_burn_receipt(data: dict) -> BurnReceiptType:
-    """Convert a burn_service.get_receipt dict to BurnReceiptType."""
-    return BurnReceiptType(
-        project_id=strawberry.ID(data["project_id"]),
-        total_tokens=data["total_tokens"],
-        duration_weeks=data["duration_weeks"],
-        peak_week_tokens=data["peak_week_tokens"],
-        daily_activity=[
-            _BurnDayType(date=d["date"], tokens=d["tokens"])
-            for d in data["daily_activity"]
-        ],
-    )
-
-
 @strawberry.type
 class Query:
     """GraphQL Query type."""
@@ -66,57 +38,20 @@ class Query:
     async def user(
         self, info: Info[Context, None], username: str
     ) -> UserType | None:
-        """Fetch a single user by username with skills, projects, and tribes."""
+        """Fetch a single user by username.
+
+        Skills, projects and tribes resolve lazily through the request's
+        dataloaders, and only if selected.
+        """
         session = info.context.session
-        stmt = (
-            select(User)
-            .where(User.username == username)
-            .options(
-                selectinload(User.skills),
-                selectinload(User.owned_projects).selectinload(Project.collaborators),
-                selectinload(User.tribes).options(
-                    selectinload(Tribe.owner),
-                    selectinload(Tribe.members),
-                    selectinload(Tribe.open_roles),
-                ),
-            )
-        )
+        stmt = select(User).where(User.username == username)
         result = await session.execute(stmt)
         user = result.scalar_one_or_none()
         if user is None:
             return None
-
-        # Load collaborator role/status from association table
-        collab_info: dict[str, dict[str, dict]] = {}
-        project_ids = [p.id for p in user.owned_projects]
-        if project_ids:
-            collab_stmt = (
-                select(
-                    project_collaborators.c.project_id,
-                    project_collaborators.c.user_id,
-                    project_collaborators.c.role,
-                    project_collaborators.c.status,
-                )
-                .where(project_collaborators.c.project_id.in_(project_ids))
-            )
-            collab_rows = (await session.execute(collab_stmt)).fetchall()
-            for row in collab_rows:
-                collab_info.setdefault(row.project_id, {})[row.user_id] = {
-                    "role": row.role,
-                    "status": row.status,
-                }
-
-        # Attach membership data to user's tribes for from_model()
-        if user.tribes:
-            await tribe_service.attach_membership_data(session, user.tribes)
-
-        return UserType.from_model(
-            user,
-            skills=user.skills,
-            projects=user.owned_projects,
-            tribes=user.tribes,
-            collab_info=collab_info,
-        )
+        # Owner of the user's projects, should they be selected
+        info.context.loaders.users.prime(user.id, user)
+        return UserType.from_model(user)
 
     @strawberry.field
     async def builders(
@@ -129,14 +64,34 @@ class Query:
         session = info.context.session
         stmt = (
             select(User)
-            .options(selectinload(User.skills))
             .order_by(User.builder_score.desc())
             .limit(limit)
             .offset(offset)
         )
         result = await session.execute(stmt)
         users = result.scalars().all()
-        return [UserType.from_model(u, skills=u.skills) for u in users]
+        info.context.loaders.users.prime_many({u.id: u for u in users})
+        return [UserType.from_model(u) for u in users]
+
+    @strawberry.field
+    async def builders_connection(
+        self,
+        info: Info[Context, None],
+        first: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+    ) -> Connection[UserType]:
+        """Builders by score descending, paged by (builder_score, id) cursor."""
+        page = await fetch_page(
+            info.context.session,
+            select(User),
+            sort_column=User.builder_score,
+            id_column=User.id,
+            first=first,
+            after=after,
+            with_total=Lookahead.from_info(info).has("totalCount"),
+        )
+        info.context.loaders.users.prime_many({u.id: u for u in page.rows})
+        return Connection.from_page(page, UserType.from_model)
 
     @strawberry.field
     async def burn_summary(
@@ -145,10 +100,24 @@ class Query:
         user_id: strawberry.ID,
         weeks: int = 52,
     ) -> BurnSummaryType | None:
-        """Aggregated burn summary for a user over the specified number of weeks."""
+        """Aggregated burn summary for a user over the specified number of weeks.
+
+        Goes through the request's dataloader so that many summaries requested
+        in one operation are computed with a single query.
+        """
+        return await info.context.loaders.burn_summary.load((str(user_id), weeks))
+
+    @strawberry.field
+    async def burn_breakdown(
+        self,
+        info: Info[Context, None],
+        user_id: strawberry.ID,
+        weeks: int = 52,
+    ) -> BurnBreakdownType:
+        """Token totals by source, tool, project and verification for a user's window."""
         session = info.context.session
-        data = await burn_service.get_summary(session, str(user_id), weeks=weeks)
-        return _dict_to_burn_summary(data)
+        data = await burn_service.get_breakdown(session, str(user_id), weeks=weeks)
+        return BurnBreakdownType.from_dict(data)
 
     @strawberry.field
     async def burn_receipt(
@@ -162,7 +131,7 @@ class Query:
         data = await burn_service.get_receipt(session, str(user_id), str(project_id))
         if data is None:
             return None
-        return _dict_to_burn_receipt(data)
+        return BurnReceiptType.from_dict(data)
 
     @strawberry.field
     async def project(
@@ -170,34 +139,12 @@ class Query:
         info: Info[Context, None],
         id: strawberry.ID,
     ) -> ProjectType | None:
-        """Fetch a single project by ID with owner and collaborators."""
+        """Fetch a single project by ID; owner, collaborators and milestones resolve lazily."""
         session = info.context.session
-        proj = await project_service.get_with_details(session, str(id))
+        proj = await session.get(Project, str(id))
         if proj is None:
             return None
-
-        # Load collaborator details from the association table
-        collab_details: dict[str, dict] = {}
-        if proj.collaborators:
-            collab_stmt = select(
-                project_collaborators.c.user_id,
-                project_collaborators.c.role,
-                project_collaborators.c.status,
-            ).where(project_collaborators.c.project_id == proj.id)
-            collab_rows = (await session.execute(collab_stmt)).fetchall()
-            for row in collab_rows:
-                collab_details[row.user_id] = {
-                    "role": row.role,
-                    "status": row.status,
-                }
-
-        return ProjectType.from_model(
-            proj,
-            owner=proj.owner,
-            collaborators=proj.collaborators,
-            collab_details=collab_details,
-            milestones=proj.milestones,
-        )
+        return ProjectType.from_model(proj)
 
     @strawberry.field
     async def projects(
@@ -211,10 +158,6 @@ class Query:
         session = info.context.session
         stmt = (
             select(Project)
-            .options(
-                selectinload(Project.owner),
-                selectinload(Project.collaborators),
-            )
             .order_by(Project.updated_at.desc())
             .limit(limit)
             .offset(offset)
@@ -224,33 +167,30 @@ class Query:
 
         result = await session.execute(stmt)
         project_list = result.scalars().all()
+        return [ProjectType.from_model(p) for p in project_list]
 
-        # Batch-load collaborator details for all returned projects
-        all_project_ids = [p.id for p in project_list]
-        collab_info: dict[str, dict[str, dict]] = {}
-        if all_project_ids:
-            collab_stmt = select(
-                project_collaborators.c.project_id,
-                project_collaborators.c.user_id,
-                project_collaborators.c.role,
-                project_collaborators.c.status,
-            ).where(project_collaborators.c.project_id.in_(all_project_ids))
-            collab_rows = (await session.execute(collab_stmt)).fetchall()
-            for row in collab_rows:
-                collab_info.setdefault(row.project_id, {})[row.user_id] = {
-                    "role": row.role,
-                    "status": row.status,
-                }
-
-        return [
-            ProjectType.from_model(
-                p,
-                owner=p.owner,
-                collaborators=p.collaborators,
-                collab_details=collab_info.get(p.id),
-            )
-            for p in project_list
-        ]
+    @strawberry.field
+    async def projects_connection(
+        self,
+        info: Info[Context, None],
+        first: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+        status: str | None = None,
+    ) -> Connection[ProjectType]:
+        """Projects by last update, paged by (updated_at, id) cursor, optionally by status."""
+        stmt = select(Project)
+        if status is not None:
+            stmt = stmt.where(Project.status == ProjectStatus(status))
+        page = await fetch_page(
+            info.context.session,
+            stmt,
+            sort_column=Project.updated_at,
+            id_column=Project.id,
+            first=first,
+            after=after,
+            with_total=Lookahead.from_info(info).has("totalCount"),
+        )
+        return Connection.from_page(page, ProjectType.from_model)
 
     @strawberry.field
     async def tribe(
@@ -258,9 +198,9 @@ class Query:
         info: Info[Context, None],
         id: strawberry.ID,
     ) -> TribeType | None:
-        """Fetch a single tribe by ID with owner, members, and open roles."""
+        """Fetch a single tribe by ID; owner, members and open roles resolve lazily."""
         session = info.context.session
-        t = await tribe_service.get_with_details(session, str(id))
+        t = await session.get(Tribe, str(id))
         if t is None:
             return None
         return TribeType.from_model(t)
@@ -277,11 +217,6 @@ class Query:
         session = info.context.session
         stmt = (
             select(Tribe)
-            .options(
-                selectinload(Tribe.owner),
-                selectinload(Tribe.members),
-                selectinload(Tribe.open_roles),
-            )
             .order_by(Tribe.updated_at.desc())
             .limit(limit)
             .offset(offset)
@@ -290,10 +225,32 @@ class Query:
             stmt = stmt.where(Tribe.status == TribeStatus(status))
 
         result = await session.execute(stmt)
-        tribe_list = list(result.scalars().all())
-        await tribe_service.attach_membership_data(session, tribe_list)
+        tribe_list = result.scalars().all()
         return [TribeType.from_model(t) for t in tribe_list]
 
+    @strawberry.field
+    async def tribes_connection(
+        self,
+        info: Info[Context, None],
+        first: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+        status: str | None = None,
+    ) -> Connection[TribeType]:
+        """Tribes by last update, paged by (updated_at, id) cursor, optionally by status."""
+        stmt = select(Tribe)
+        if status is not None:
+            stmt = stmt.where(Tribe.status == TribeStatus(status))
+        page = await fetch_page(
+            info.context.session,
+            stmt,
+            sort_column=Tribe.updated_at,
+            id_column=Tribe.id,
+            first=first,
+            after=after,
+            with_total=Lookahead.from_info(info).has("totalCount"),
+        )
+        return Connection.from_page(page, TribeType.from_model)
+
     @strawberry.field
     async def feed(
         self,
@@ -311,17 +268,30 @@ class Query:
         )
         result = await session.execute(stmt)
         events = result.scalars().all()
-        return [
-            FeedEventType(
-                id=event.id,
-                event_type=event.event_type,
-                target_type=event.target_type,
-                target_id=event.target_id,
-                metadata=event.event_metadata,
-                created_at=event.created_at,
-            )
-            for event in events
-        ]
+        return [FeedEventType.from_model(event) for event in events]
+
+    @strawberry.field
+    async def feed_connection(
+        self,
+        info: Info[Context, None],
+        first: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+    ) -> Connection[FeedEventType]:
+        """Feed events newest first, paged by (created_at, id) cursor.
+
+        Unlike ``feed``'s offset, a cursor seeks straight to its position, so
+        deep pages of an infinite scroll cost the same as the first.
+        """
+        page = await fetch_page(
+            info.context.session,
+            select(FeedEvent),
+            sort_column=FeedEvent.created_at,
+            id_column=FeedEvent.id,
+            first=first,
+            after=after,
+            with_total=Lookahead.from_info(info).has("totalCount"),
+        )
+        return Connection.from_page(page, FeedEventType.from_model)
 
     @strawberry.field
     async def tag_suggestions(
@@ -1,7 +1,15 @@
 """GraphQL types for Strawberry GraphQL schema."""
 
 from app.graphql.types.auth import AuthPayload
-from app.graphql.types.burn import BurnDayType, BurnReceiptType, BurnSummaryType
+from app.graphql.types.burn import (
+    BurnBreakdownEntryType,
+    BurnBreakdownType,
+    BurnDayType,
+    BurnReceiptType,
+    BurnSummaryType,
+    PackedBurnDaysType,
+)
+from app.graphql.types.connection import Connection, Edge
 from app.graphql.types.feed_event import FeedEventType
 from app.graphql.types.project import CollaboratorType, ProjectType
 from app.graphql.types.skill import SkillType
@@ -10,12 +18,17 @@ from app.graphql.types.user import UserType
 
 __all__ = [
     "AuthPayload",
+    "BurnBreakdownEntryType",
+    "BurnBreakdownType",
     "BurnDayType",
     "BurnReceiptType",
     "BurnSummaryType",
     "CollaboratorType",
+    "Connection",
+    "Edge",
     "FeedEventType",
     "OpenRoleType",
+    "PackedBurnDaysType",
     "ProjectType",
     "SkillType",
     "TribeMemberType",
@@ -1,6 +1,10 @@
 """Strawberry GraphQL types for burn (token activity) data."""
 
+import base64
 import datetime
+import sys
+from array import array
+from collections.abc import Iterable
 
 import strawberry
 
@@ -13,6 +17,46 @@ class BurnDayType:
     tokens: int
 
 
+def _day_types(days: list[dict]) -> list[BurnDayType]:
+    return [BurnDayType(date=d["date"], tokens=d["tokens"]) for d in days]
+
+
+@strawberry.type
+class PackedBurnDaysType:
+    """Daily token totals packed into one fixed-width integer slot per day.
+
+    data is base64 of a little-endian unsigned integer array with
+    bytes_per_day bytes per slot (4, or 8 when a day exceeds 2**32 - 1).
+    Slot i holds the total for start_date + i days; days without activity
+    are zero. start_date is null and days is 0 when there is no activity.
+    """
+
+    start_date: datetime.date | None
+    days: int
+    bytes_per_day: int
+    data: str
+
+    @classmethod
+    def from_days(cls, days: Iterable[dict]) -> "PackedBurnDaysType":
+        """Pack burn_service's ascending {date, tokens} rows without an object per day."""
+        days = list(days)
+        if not days:
+            return cls(start_date=None, days=0, bytes_per_day=4, data="")
+        start = days[0]["date"]
+        typecode = "I" if max(d["tokens"] for d in days) <= 0xFFFFFFFF else "Q"
+        slots = array(typecode, [0]) * ((days[-1]["date"] - start).days + 1)
+        for day in days:
+            slots[(day["date"] - start).days] = day["tokens"]
+        if sys.byteorder == "big":
+            slots.byteswap()
+        return cls(
+            start_date=start,
+            days=len(slots),
+            bytes_per_day=slots.itemsize,
+            data=base64.b64encode(slots.tobytes()).decode("ascii"),
+        )
+
+
 @strawberry.type
 class BurnReceiptType:
     """Per-project burn receipt showing activity and totals."""
@@ -21,7 +65,29 @@ class BurnReceiptType:
     total_tokens: int
     duration_weeks: int
     peak_week_tokens: int
-    daily_activity: list[BurnDayType]
+    # burn_service's {date, tokens} rows, turned into objects only if selected
+    _days: strawberry.Private[list[dict]]
+
+    @strawberry.field
+    def daily_activity(self) -> list[BurnDayType]:
+        """Token totals of each active day, ascending."""
+        return _day_types(self._days)
+
+    @strawberry.field
+    def daily_activity_packed(self) -> PackedBurnDaysType:
+        """daily_activity as a packed per-day array, far smaller on the wire."""
+        return PackedBurnDaysType.from_days(self._days)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BurnReceiptType":
+        """Create BurnReceiptType from a burn_service.get_receipt dict."""
+        return cls(
+            project_id=strawberry.ID(data["project_id"]),
+            total_tokens=data["total_tokens"],
+            duration_weeks=data["duration_weeks"],
+            peak_week_tokens=data["peak_week_tokens"],
+            _days=data["daily_activity"],
+        )
 
 
 @strawberry.type
@@ -33,4 +99,64 @@ class BurnSummaryType:
     active_weeks: int
     total_weeks: int
     weekly_streak: int
-    daily_activity: list[BurnDayType]
+    # burn_service's {date, tokens} rows, turned into objects only if selected
+    _days: strawberry.Private[list[dict]]
+
+    @strawberry.field
+    def daily_activity(self) -> list[BurnDayType]:
+        """Token totals of each active day, ascending."""
+        return _day_types(self._days)
+
+    @strawberry.field
+    def daily_activity_packed(self) -> PackedBurnDaysType:
+        """daily_activity as a packed per-day array, far smaller on the wire."""
+        return PackedBurnDaysType.from_days(self._days)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BurnSummaryType":
+        """Create BurnSummaryType from a burn_service.get_summary dict."""
+        return cls(
+            days_active=data["days_active"],
+            total_tokens=data["total_tokens"],
+            active_weeks=data["active_weeks"],
+            total_weeks=data["total_weeks"],
+            weekly_streak=data["weekly_streak"],
+            _days=data["daily_activity"],
+        )
+
+
+@strawberry.type
+class BurnBreakdownEntryType:
+    """Token total for one value of a breakdown dimension (null: no tool/project)."""
+
+    key: str | None
+    tokens: int
+
+
+@strawberry.type
+class BurnBreakdownType:
+    """A user's token totals split by source, tool, project and verification level."""
+
+    total_tokens: int
+    by_source: list[BurnBreakdownEntryType]
+    by_tool: list[BurnBreakdownEntryType]
+    by_project: list[BurnBreakdownEntryType]
+    by_verification: list[BurnBreakdownEntryType]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BurnBreakdownType":
+        """Create BurnBreakdownType from a burn_service.get_breakdown dict."""
+
+        def entries(key: str) -> list[BurnBreakdownEntryType]:
+            return [
+                BurnBreakdownEntryType(key=entry["key"], tokens=entry["tokens"])
+                for entry in data[key]
+            ]
+
+        return cls(
+            total_tokens=data["total_tokens"],
+            by_source=entries("by_source"),
+            by_tool=entries("by_tool"),
+            by_project=entries("by_project"),
+            by_verification=entries("by_verification"),
+        )
@@ -0,0 +1,39 @@
+"""Relay-style connection type for the cursor-paginated lists."""
+
+from collections.abc import Callable
+from typing import Any
+
+import strawberry
+
+from app.graphql.pagination import Page, PageInfo
+
+
+@strawberry.type
+class Edge[T]:
+    cursor: str
+    node: T
+
+
+@strawberry.type
+class Connection[T]:
+    """A page of nodes in the field's order, each with its cursor.
+
+    Specialized per node type, e.g. ``Connection[UserType]`` is exposed as
+    ``UserTypeConnection``.
+    """
+
+    edges: list[Edge[T]]
+    page_info: PageInfo
+    total_count: int | None
+
+    @classmethod
+    def from_page(cls, page: Page[Any], node: Callable[[Any], T]) -> "Connection[T]":
+        """Connection for a fetched page, building each edge's node from its row."""
+        return cls(
+            edges=[
+                Edge(cursor=cursor, node=node(row))
+                for row, cursor in zip(page.rows, page.cursors, strict=True)
+            ],
+            page_info=page.page_info,
+            total_count=page.total_count,
+        )
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 import strawberry
+from strawberry.types import Info
 
 from app.models.enums import EventType
 
+if TYPE_CHECKING:
+    from app.models.feed_event import FeedEvent
+
 
 @strawberry.type
 class FeedEventType:
@@ -20,16 +25,27 @@ class FeedEventType:
     metadata: strawberry.scalars.JSON
     created_at: datetime
 
+    _actor_id: strawberry.Private[str | None] = None
+
     @strawberry.field
-    def actor(self) -> UserType | None:
-        """
-        Lazy resolver for event actor.
-
-        Returns None until proper dataloaders are implemented.
-        The frontend extracts actor info from event metadata instead.
-        """
-        # TODO: Implement proper actor loading from database using dataloaders
-        return None
+    async def actor(self, info: Info) -> UserType | None:
+        """Lazy resolver for event actor, batched across a page via the users loader."""
+        if self._actor_id is None:
+            return None
+        user = await info.context.loaders.users.load(self._actor_id)
+        return UserType.from_model(user) if user is not None else None
+
+    @classmethod
+    def from_model(cls, event: FeedEvent) -> FeedEventType:
+        return cls(
+            id=event.id,
+            event_type=event.event_type,
+            target_type=event.target_type,
+            target_id=event.target_id,
+            metadata=event.event_metadata,
+            created_at=event.created_at,
+            _actor_id=event.actor_id,
+        )
 
 
 # Import after class definition to avoid circular import at module level
@@ -4,10 +4,12 @@ from datetime import date, datetime
 from typing import TYPE_CHECKING
 
 import strawberry
+from strawberry.types import Info
 
 from app.models.enums import CollaboratorStatus, ProjectStatus
 
 if TYPE_CHECKING:
+    from app.graphql.dataloaders import Collaborator
     from app.models.project import Project
     from app.models.project_milestone import ProjectMilestone
     from app.models.user import User
@@ -56,52 +58,58 @@ class ProjectType:
     created_at: datetime
     updated_at: datetime
 
-    _owner: strawberry.Private[object | None]
-    _collaborators: strawberry.Private[list]
-    _milestones: strawberry.Private[list]
+    # Relationships supplied up front by from_model(); None means the field
+    # resolves through the request's dataloaders when selected.
+    _owner_id: strawberry.Private[str | None] = None
+    _owner: strawberry.Private[object | None] = None
+    _collaborators: strawberry.Private[list | None] = None
+    _milestones: strawberry.Private[list | None] = None
 
     @strawberry.field
-    def owner(self) -> "UserType":
-        return self._owner  # type: ignore[return-value]
+    async def owner(self, info: Info) -> "UserType":
+        owner = self._owner
+        if owner is None and self._owner_id is not None:
+            owner = await info.context.loaders.users.load(self._owner_id)
+        if owner is None:
+            return None  # type: ignore[return-value]
+        return UserType.from_model(owner)
 
     @strawberry.field
-    def collaborators(self) -> list["CollaboratorType"]:
-        return self._collaborators  # type: ignore[return-value]
+    async def collaborators(self, info: Info) -> list["CollaboratorType"]:
+        collaborators = self._collaborators
+        if collaborators is None:
+            collaborators = await info.context.loaders.collaborators_by_project.load(self.id)
+        return [
+            CollaboratorType(
+                user=UserType.from_model(c.user),
+                role=c.role,
+                status=CollaboratorStatus(c.status),
+                invited_at=c.invited_at,
+                confirmed_at=c.confirmed_at,
+            )
+            for c in collaborators
+        ]
 
     @strawberry.field
-    def milestones(self) -> list[ProjectMilestoneGQLType]:
-        return self._milestones  # type: ignore[return-value]
+    async def milestones(self, info: Info) -> list[ProjectMilestoneGQLType]:
+        milestones = self._milestones
+        if milestones is None:
+            milestones = await info.context.loaders.milestones_by_project.load(self.id)
+        return [ProjectMilestoneGQLType.from_model(m) for m in milestones]
 
     @classmethod
     def from_model(
         cls,
         project: "Project",
         owner: "User | None" = None,
-        collaborators: "list[User] | None" = None,
-        collab_details: "dict | None" = None,
+        collaborators: "list[Collaborator] | None" = None,
         milestones: "list | None" = None,
     ) -> "ProjectType":
-        owner_type = None
-        if owner is not None:
-            owner_type = UserType.from_model(owner)
-
-        _details = collab_details or {}
-        collaborator_types = []
-        for collab in (collaborators or []):
-            info = _details.get(collab.id, {})
-            collab_user = UserType.from_model(collab)
-            collaborator_types.append(
-                CollaboratorType(
-                    user=collab_user,
-                    role=info.get("role"),
-                    status=CollaboratorStatus(info["status"]) if "status" in info else CollaboratorStatus.CONFIRMED,
-                    invited_at=project.created_at,
-                    confirmed_at=project.created_at,
-                )
-            )
-
-        milestone_types = [ProjectMilestoneGQLType.from_model(m) for m in (milestones or [])]
+        """Create ProjectType from the Project model's columns.
 
+        Relationships passed in are used as is; the rest load lazily, and only
+        if selected.
+        """
         return cls(
             id=project.id,
             title=project.title,
@@ -120,9 +128,10 @@ class ProjectType:
             github_stars=project.github_stars,
             created_at=project.created_at,
             updated_at=project.updated_at,
-            _owner=owner_type,
-            _collaborators=collaborator_types,
-            _milestones=milestone_types,
+            _owner_id=project.owner_id,
+            _owner=owner,
+            _collaborators=collaborators,
+            _milestones=milestones,
         )
 
 
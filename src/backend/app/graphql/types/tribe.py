@@ -4,11 +4,15 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 import strawberry
+from strawberry.types import Info
 
 from app.models.enums import MemberRole, MemberStatus, TribeStatus
 
 if TYPE_CHECKING:
+    from app.graphql.dataloaders import TribeMembership
     from app.models.tribe import Tribe as TribeModel
+    from app.models.tribe import TribeOpenRole
+    from app.models.user import User
 
 
 @strawberry.type
@@ -23,76 +27,70 @@ class TribeType:
     created_at: datetime
     updated_at: datetime
 
-    _owner: strawberry.Private[object | None]
-    _members: strawberry.Private[list]
-    _open_roles: strawberry.Private[list]
+    # Relationships supplied up front; None means the field resolves through
+    # the request's dataloaders when selected.
+    _owner_id: strawberry.Private[str | None] = None
+    _owner: strawberry.Private[object | None] = None
+    _members: strawberry.Private[list | None] = None
+    _open_roles: strawberry.Private[list | None] = None
 
     @strawberry.field
-    def owner(self) -> "UserType":
-        return self._owner  # type: ignore[return-value]
+    async def owner(self, info: Info) -> "UserType":
+        owner = self._owner
+        if owner is None and self._owner_id is not None:
+            owner = await info.context.loaders.users.load(self._owner_id)
+        if owner is None:
+            return None  # type: ignore[return-value]
+        return UserType.from_model(owner)
 
     @strawberry.field
-    def members(self) -> list["TribeMemberType"]:
-        return self._members  # type: ignore[return-value]
+    async def members(self, info: Info) -> list["TribeMemberType"]:
+        memberships = self._members
+        if memberships is None:
+            memberships = await info.context.loaders.members_by_tribe.load(self.id)
+
+        # Requested roles are looked up among the tribe's open roles
+        role_lookup = {}
+        if any(m.requested_role_id for m in memberships):
+            role_lookup = {r.id: r for r in await self._load_open_roles(info)}
+
+        return [
+            TribeMemberType(
+                user=UserType.from_model(m.user),
+                role=MemberRole(m.role),
+                status=MemberStatus(m.status),
+                joined_at=m.joined_at,
+                requested_role=(
+                    OpenRoleType.from_model(role_lookup[m.requested_role_id])
+                    if m.requested_role_id in role_lookup
+                    else None
+                ),
+            )
+            for m in memberships
+        ]
 
     @strawberry.field
-    def open_roles(self) -> list["OpenRoleType"]:
-        return self._open_roles  # type: ignore[return-value]
+    async def open_roles(self, info: Info) -> list["OpenRoleType"]:
+        return [OpenRoleType.from_model(r) for r in await self._load_open_roles(info)]
 
-    @classmethod
-    def from_model(cls, tribe: "TribeModel") -> "TribeType":
-        owner_type = None
-        if tribe.owner is not None:
-            owner_type = UserType.from_model(tribe.owner)
-
-        # Build open roles first so we can look up requested roles for members
-        open_role_types = [
-            OpenRoleType(
-                id=r.id,
-                title=r.title,
-                skills_needed=r.skills_needed,
-                filled=r.filled,
-            )
-            for r in (tribe.open_roles or [])
-        ]
-        role_lookup = {r.id: r for r in (tribe.open_roles or [])}
-
-        # Use real membership data if attached by attach_membership_data()
-        membership_data: dict = getattr(tribe, "_membership_data", {})
-
-        member_types = []
-        for member in (tribe.members or []):
-            member_user = UserType.from_model(member)
-            row = membership_data.get(member.id)
-            if row is not None:
-                # Real data from association table
-                requested_role = None
-                if row.requested_role_id and row.requested_role_id in role_lookup:
-                    r = role_lookup[row.requested_role_id]
-                    requested_role = OpenRoleType(
-                        id=r.id, title=r.title,
-                        skills_needed=r.skills_needed, filled=r.filled,
-                    )
-                member_types.append(
-                    TribeMemberType(
-                        user=member_user,
-                        role=MemberRole(row.role),
-                        status=MemberStatus(row.status),
-                        joined_at=row.joined_at,
-                        requested_role=requested_role,
-                    )
-                )
-            else:
-                # Fallback when membership data not loaded
-                member_types.append(
-                    TribeMemberType(
-                        user=member_user,
-                        role=MemberRole.MEMBER,
-                        status=MemberStatus.ACTIVE,
-                        joined_at=None,
-                    )
-                )
+    async def _load_open_roles(self, info: Info) -> list:
+        if self._open_roles is not None:
+            return self._open_roles
+        return await info.context.loaders.open_roles_by_tribe.load(self.id)
 
+    @classmethod
+    def from_model(
+        cls,
+        tribe: "TribeModel",
+        owner: "User | None" = None,
+        members: "list[TribeMembership] | None" = None,
+        open_roles: "list[TribeOpenRole] | None" = None,
+    ) -> "TribeType":
+        """Create TribeType from the Tribe model's columns.
+
+        Relationships passed in are used as is; the rest load lazily, and only
+        if selected.
+        """
         return cls(
             id=tribe.id,
             name=tribe.name,
@@ -101,9 +99,10 @@ class TribeType:
             max_members=tribe.max_members,
             created_at=tribe.created_at,
             updated_at=tribe.updated_at,
-            _owner=owner_type,
-            _members=member_types,
-            _open_roles=open_role_types,
+            _owner_id=tribe.owner_id,
+            _owner=owner,
+            _members=members,
+            _open_roles=open_roles,
         )
 
 
@@ -127,6 +126,15 @@ class OpenRoleType:
     skills_needed: strawberry.scalars.JSON
     filled: bool
 
+    @classmethod
+    def from_model(cls, role: "TribeOpenRole") -> "OpenRoleType":
+        return cls(
+            id=role.id,
+            title=role.title,
+            skills_needed=role.skills_needed,
+            filled=role.filled,
+        )
+
 
 # Import after class definitions to avoid circular import at module level
 from app.graphql.types.user import UserType  # noqa: E402
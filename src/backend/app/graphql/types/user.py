@@ -4,7 +4,9 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 import strawberry
+from strawberry.types import Info
 
+from app.graphql.types.burn import BurnSummaryType
 from app.models.enums import AgentWorkflowStyle, AvailabilityStatus, UserRole
 from app.services.score_service import COMPLETENESS_FIELDS, _field_filled
 
@@ -39,29 +41,48 @@ class UserType:
     human_agent_ratio: float | None
     created_at: datetime
 
-    _skills: strawberry.Private[list]
-    _owned_projects: strawberry.Private[list]
-    _tribes: strawberry.Private[list]
+    # Relationship models supplied up front by from_model(); None means the
+    # field resolves through the request's dataloaders when selected.
+    _skills: strawberry.Private[list | None] = None
+    _owned_projects: strawberry.Private[list | None] = None
+    _tribes: strawberry.Private[list | None] = None
 
     @strawberry.field
-    def skills(self) -> list["SkillType"]:
+    async def skills(self, info: Info) -> list["SkillType"]:
         """Lazy resolver for user skills."""
-        return self._skills  # type: ignore[return-value]
+        skills = self._skills
+        if skills is None:
+            skills = await info.context.loaders.skills_by_user.load(self.id)
+        return [SkillType.from_model(s) for s in skills]
+
+    async def _load_projects(self, info: Info) -> list["ProjectType"]:
+        projects = self._owned_projects
+        if projects is None:
+            projects = await info.context.loaders.projects_by_owner.load(self.id)
+        return [ProjectType.from_model(p) for p in projects]
 
     @strawberry.field
-    def projects(self) -> list["ProjectType"]:
+    async def projects(self, info: Info) -> list["ProjectType"]:
         """Lazy resolver for user projects."""
-        return self._owned_projects  # type: ignore[return-value]
+        return await self._load_projects(info)
 
     @strawberry.field
-    def owned_projects(self) -> list["ProjectType"]:
+    async def owned_projects(self, info: Info) -> list["ProjectType"]:
         """Lazy resolver for owned projects (alias for projects)."""
-        return self._owned_projects  # type: ignore[return-value]
+        return await self._load_projects(info)
 
     @strawberry.field
-    def tribes(self) -> list["TribeType"]:
+    async def tribes(self, info: Info) -> list["TribeType"]:
         """Lazy resolver for tribes."""
-        return self._tribes  # type: ignore[return-value]
+        tribes = self._tribes
+        if tribes is None:
+            tribes = await info.context.loaders.tribes_by_member.load(self.id)
+        return [TribeType.from_model(t) for t in tribes]
+
+    @strawberry.field
+    async def burn_summary(self, info: Info, weeks: int = 52) -> BurnSummaryType:
+        """Burn summary for this user, batched across users via the request dataloader."""
+        return await info.context.loaders.burn_summary.load((self.id, weeks))
 
     @strawberry.field
     def profile_completeness(self) -> float:
@@ -88,26 +109,12 @@ class UserType:
         skills: "list | None" = None,
         projects: "list | None" = None,
         tribes: "list | None" = None,
-        collab_info: "dict | None" = None,
     ) -> "UserType":
-        """Create UserType from User model with optional relationships."""
-        from app.graphql.types.project import ProjectType
-        from app.graphql.types.skill import SkillType
-        from app.graphql.types.tribe import TribeType
-
-        _collab_info = collab_info or {}
-        skills_types = [SkillType.from_model(s) for s in (skills or [])]
-        projects_types = [
-            ProjectType.from_model(
-                p,
-                owner=user,
-                collaborators=p.collaborators if hasattr(p, "collaborators") else None,
-                collab_details=_collab_info.get(p.id, {}),
-            )
-            for p in (projects or [])
-        ]
-        tribes_types = [TribeType.from_model(t) for t in (tribes or [])]
+        """Create UserType from the User model's columns.
 
+        Relationship models passed in are used as is; the rest load lazily,
+        and only if selected.
+        """
         return cls(
             id=user.id,
             email=user.email,
@@ -128,9 +135,9 @@ class UserType:
             agent_workflow_style=user.agent_workflow_style,
             human_agent_ratio=user.human_agent_ratio,
             created_at=user.created_at,
-            _skills=skills_types,
-            _owned_projects=projects_types,
-            _tribes=tribes_types,
+            _skills=skills,
+            _owned_projects=projects,
+            _tribes=tribes,
         )
 
 
@@ -1,6 +1,7 @@
 """FastAPI application factory for Find Your Tribe API."""
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,9 +9,15 @@ from sqlalchemy import text
 from strawberry.fastapi import GraphQLRouter
 
 from app.api.burn_ingest import router as burn_router
+from app.api.metrics import router as metrics_router
+from app.config import settings
 from app.db.engine import engine
 from app.graphql.context import context_getter
 from app.graphql.schema import schema
+from app.services import burn_compaction, ingest_keys, invalidation
+from app.services.burn_buffer import burn_buffer
+from app.services.password_hashing import password_hasher
+from app.services.token_usage import token_usage
 
 
 @asynccontextmanager
@@ -19,7 +26,12 @@ async def lifespan(app: FastAPI):
     Application lifespan context manager.
 
     Handles startup and shutdown events for the FastAPI application.
-    On startup, verifies database connection is working.
+    On startup, verifies database connection is working and starts the
+    background burn jobs that are enabled: the periodic burn buffer flush in
+    buffered ingest mode, burn history compaction and the ingest key sweep,
+    plus the API token last-used flush and the cache invalidation listener
+    that keeps this worker's caches in step with the others. On shutdown, stops them and flushes
+    whatever is still buffered before disposing of the engine.
     """
     # Startup: Verify database connection
     try:
@@ -30,9 +42,61 @@ async def lifespan(app: FastAPI):
         print(f"✗ Database connection failed: {e}")
         raise
 
+    flush_task = None
+    if settings.burn_ingest_mode == "buffered":
+        flush_task = asyncio.create_task(burn_buffer.run(settings.burn_buffer_flush_seconds))
+
+    compaction_task = None
+    if settings.burn_compaction_interval_seconds > 0:
+        compaction_task = asyncio.create_task(burn_compaction.run(
+            settings.burn_compaction_interval_seconds,
+            settings.burn_compaction_horizon_days,
+        ))
+
+    sweep_task = None
+    if settings.burn_ingest_key_sweep_interval_seconds > 0:
+        sweep_task = asyncio.create_task(ingest_keys.run(
+            settings.burn_ingest_key_sweep_interval_seconds,
+            settings.burn_ingest_key_ttl_days,
+        ))
+
+    usage_task = None
+    if settings.api_token_usage_flush_seconds > 0:
+        usage_task = asyncio.create_task(token_usage.run(settings.api_token_usage_flush_seconds))
+
+    listen_task = None
+    if settings.cache_invalidation_listen:
+        listen_task = asyncio.create_task(
+            invalidation.run(invalidation.listen_dsn(settings.database_url))
+        )
+
     yield
 
     # Shutdown: Clean up resources
+    for task in (listen_task, sweep_task, compaction_task):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    if flush_task is not None:
+        flush_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await flush_task
+        try:
+            flushed = await burn_buffer.flush()
+            print(f"✓ Burn buffer flushed ({flushed} rows)")
+        except Exception as e:
+            print(f"✗ Burn buffer flush failed: {e}")
+    if usage_task is not None:
+        usage_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await usage_task
+    try:
+        flushed = await token_usage.flush()
+        print(f"✓ API token usage flushed ({flushed} tokens)")
+    except Exception as e:
+        print(f"✗ API token usage flush failed: {e}")
+    password_hasher.shutdown()
     await engine.dispose()
     print("✓ Database engine disposed")
 
@@ -63,3 +127,6 @@ app.include_router(graphql_router, prefix="/graphql")
 
 # Mount burn ingest router
 app.include_router(burn_router, prefix="/api/burn")
+
+# Mount metrics router
+app.include_router(metrics_router)
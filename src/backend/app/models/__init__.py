@@ -3,6 +3,8 @@
 from app.db.base import Base
 from app.models.api_token import ApiToken
 from app.models.build_activity import BuildActivity
+from app.models.build_activity_period import BuildActivityPeriod
+from app.models.burn_ingest_key import BurnIngestKey
 from app.models.collaborator_invite_token import CollaboratorInviteToken
 from app.models.enums import (
     AgentWorkflowStyle,
@@ -26,6 +28,8 @@ from app.models.project_milestone import ProjectMilestone
 from app.models.skill import Skill
 from app.models.tribe import Tribe, TribeOpenRole, tribe_members
 from app.models.user import RefreshToken, User, user_skills
+from app.models.user_daily_burn import UserDailyBurn
+from app.models.user_weekly_burn import UserWeeklyBurn
 
 __all__ = [
     "AgentWorkflowStyle",
@@ -33,7 +37,9 @@ __all__ = [
     "AvailabilityStatus",
     "Base",
     "BuildActivity",
+    "BuildActivityPeriod",
     "BuildActivitySource",
+    "BurnIngestKey",
     "BurnVerification",
     "CollaboratorInviteToken",
     "CollaboratorStatus",
@@ -53,7 +59,9 @@ __all__ = [
     "TribeOpenRole",
     "TribeStatus",
     "User",
+    "UserDailyBurn",
     "UserRole",
+    "UserWeeklyBurn",
     "project_collaborators",
     "tribe_members",
     "user_skills",
@@ -3,10 +3,21 @@
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, ForeignKey, Index, Integer, String, UniqueConstraint, text
+from sqlalchemy import (
+    DDL,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    event,
+    text,
+)
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from ulid import ULID
 
 from app.db.base import Base, TimestampMixin, ULIDMixin
 from app.models.enums import BuildActivitySource, BurnVerification, TokenPrecision
@@ -17,17 +28,25 @@ if TYPE_CHECKING:
 
 
 class BuildActivity(Base, ULIDMixin, TimestampMixin):
-    """Records daily token burn for a user, optionally attributed to a project."""
+    """Records daily token burn for a user, optionally attributed to a project.
+
+    The table is range-partitioned by month on activity_date (see
+    app.services.burn_partitions). Postgres requires the partition key in the
+    primary key, so the table key is (id, activity_date) while the ORM
+    identity stays id alone.
+    """
 
     __tablename__ = "build_activities"
 
+    # Redeclared from ULIDMixin so id leads the (id, activity_date) primary key
+    id: Mapped[str] = mapped_column(String(26), primary_key=True, default=lambda: str(ULID()))
     user_id: Mapped[str] = mapped_column(
         String(26), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     project_id: Mapped[str | None] = mapped_column(
         String(26), ForeignKey("projects.id", ondelete="SET NULL"), nullable=True
     )
-    activity_date: Mapped[date] = mapped_column(Date, nullable=False)
+    activity_date: Mapped[date] = mapped_column(Date, primary_key=True)
     tokens_burned: Mapped[int] = mapped_column(Integer, nullable=False)
     source: Mapped[str] = mapped_column(
         SQLEnum(BuildActivitySource, values_callable=lambda x: [e.value for e in x]),
@@ -64,14 +83,20 @@ class BuildActivity(Base, ULIDMixin, TimestampMixin):
             "project_id",
             postgresql_where=text("project_id IS NOT NULL"),
         ),
-        Index(
-            "ix_build_activities_session",
-            "session_id",
-            postgresql_where=text("session_id IS NOT NULL"),
-        ),
         Index(
             "ix_build_activities_verification",
             "user_id",
             "verification",
         ),
+        {"postgresql_partition_by": "RANGE (activity_date)"},
     )
+    __mapper_args__ = {"primary_key": ["id"]}
+
+
+# Tables created with metadata.create_all (tests, init-db) get a catch-all
+# partition so inserts work before any monthly partition exists.
+event.listen(
+    BuildActivity.__table__,
+    "after_create",
+    DDL("CREATE TABLE build_activities_default PARTITION OF build_activities DEFAULT"),
+)
@@ -0,0 +1,51 @@
+"""BuildActivityPeriod model — compacted burn history older than the compaction horizon."""
+
+from datetime import date
+
+from sqlalchemy import BigInteger, Date, ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base, ULIDMixin
+from app.models.enums import BuildActivitySource
+
+
+class BuildActivityPeriod(Base, ULIDMixin):
+    """Token burn for a user, project and source summed over one ISO week.
+
+    Written by app.services.burn_compaction, which folds build_activities rows
+    older than the horizon into these rows and deletes the originals.
+    period_start is the Monday of the week the tokens were burned in;
+    first_date and last_date are the earliest and latest days within it that
+    had activity, so durations measured in days survive compaction. As
+    with uq_build_activity_per_day, rows without a project never conflict,
+    so several may exist for the same period.
+    """
+
+    __tablename__ = "build_activity_periods"
+
+    user_id: Mapped[str] = mapped_column(
+        String(26), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    project_id: Mapped[str | None] = mapped_column(
+        String(26), ForeignKey("projects.id", ondelete="SET NULL"), nullable=True
+    )
+    source: Mapped[str] = mapped_column(
+        SQLEnum(BuildActivitySource, values_callable=lambda x: [e.value for e in x]),
+        nullable=False,
+    )
+    period_start: Mapped[date] = mapped_column(Date, nullable=False)
+    tokens: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    first_date: Mapped[date] = mapped_column(Date, nullable=False)
+    last_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "project_id",
+            "source",
+            "period_start",
+            name="uq_build_activity_period",
+        ),
+        Index("ix_build_activity_periods_project", "project_id", "user_id"),
+    )
@@ -0,0 +1,45 @@
+"""BurnIngestKey model — idempotency ledger for burn ingest session_ids."""
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, Index, String, func
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.enums import BuildActivitySource
+
+
+class BurnIngestKey(Base):
+    """One row per (user, session_id) the ingest API has already counted.
+
+    Ingest claims a key with INSERT ... ON CONFLICT DO NOTHING RETURNING in the
+    same transaction as the burn write, so deduplication is a single primary
+    key probe and stays correct when a later session updates the same
+    build_activities day row. burn_id is the id the burn was written with;
+    for project rows, which may have been merged into an existing row, the
+    (project_id, activity_date, source) triple locates the row instead.
+    Keys older than settings.burn_ingest_key_ttl_days are swept by
+    app.services.ingest_keys.
+    """
+
+    __tablename__ = "burn_ingest_keys"
+
+    user_id: Mapped[str] = mapped_column(
+        String(26), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    session_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    burn_id: Mapped[str] = mapped_column(String(26), nullable=False)
+    project_id: Mapped[str | None] = mapped_column(
+        String(26), ForeignKey("projects.id", ondelete="SET NULL"), nullable=True
+    )
+    activity_date: Mapped[date] = mapped_column(Date, nullable=False)
+    source: Mapped[str] = mapped_column(
+        SQLEnum(BuildActivitySource, values_callable=lambda x: [e.value for e in x]),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (Index("ix_burn_ingest_keys_created_at", "created_at"),)
@@ -66,6 +66,8 @@ class FeedEvent(Base, ULIDMixin):
     __table_args__ = (
         # Index for time-ordered feed queries (descending for recent first)
         Index("ix_feed_events_created_at_desc", "created_at", postgresql_ops={"created_at": "DESC"}),
+        # Keyset pagination by (created_at, id), scanned backwards for newest first
+        Index("ix_feed_events_created_at_id", "created_at", "id"),
         # Composite index for filtering by event type and time
         Index("ix_feed_events_event_type_created_at", "event_type", "created_at"),
         # Index for actor-specific queries
@@ -213,5 +213,7 @@ class Project(Base, ULIDMixin, TimestampMixin):
             postgresql_ops={"embedding": "vector_cosine_ops"},
         ),
         Index("ix_projects_status", "status"),
+        # Keyset pagination by (updated_at, id)
+        Index("ix_projects_updated_at_id", "updated_at", "id"),
         Index("ix_projects_github_repo", "github_repo_full_name"),
     )
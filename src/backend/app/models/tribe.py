@@ -139,6 +139,8 @@ class Tribe(Base, ULIDMixin, TimestampMixin):
     __table_args__ = (
         Index("ix_tribes_search_vector", "search_vector", postgresql_using="gin"),
         Index("ix_tribes_status", "status"),
+        # Keyset pagination by (updated_at, id)
+        Index("ix_tribes_updated_at_id", "updated_at", "id"),
     )
 
 
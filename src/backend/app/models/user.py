@@ -225,6 +225,8 @@ class User(Base, ULIDMixin, TimestampMixin):
             postgresql_ops={"embedding": "vector_cosine_ops"},
         ),
         Index("ix_users_primary_role_availability", "primary_role", "availability_status"),
+        # Keyset pagination of builders by (builder_score, id)
+        Index("ix_users_builder_score_id", "builder_score", "id"),
     )
 
 
@@ -0,0 +1,26 @@
+"""UserDailyBurn model — per-user daily token totals rolled up from build_activities."""
+
+from datetime import date
+
+from sqlalchemy import BigInteger, Date, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class UserDailyBurn(Base):
+    """Sum of tokens_burned across all of a user's build_activities rows for one day.
+
+    Kept in step with build_activities by every burn_service write path, in the
+    same transaction, so day totals and heatmaps read one row per day instead
+    of re-aggregating. The (user_id, activity_date) primary key serves a year
+    heatmap as a single index range scan.
+    """
+
+    __tablename__ = "user_daily_burn"
+
+    user_id: Mapped[str] = mapped_column(
+        String(26), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    activity_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
@@ -0,0 +1,25 @@
+"""UserWeeklyBurn model — per-user ISO-week token totals rolled up from build_activities."""
+
+from datetime import date
+
+from sqlalchemy import BigInteger, Date, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class UserWeeklyBurn(Base):
+    """Sum of tokens_burned across a user's build_activities rows for one ISO week.
+
+    week_start is the Monday of the week (what Postgres date_trunc('week')
+    returns). Maintained together with UserDailyBurn so that active weeks,
+    streaks and peak weeks are computed over at most one row per week.
+    """
+
+    __tablename__ = "user_weekly_burn"
+
+    user_id: Mapped[str] = mapped_column(
+        String(26), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    week_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
@@ -1,14 +1,14 @@
 """Seed data for users."""
 
-import bcrypt
 from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.enums import AgentWorkflowStyle, AvailabilityStatus, UserRole
 from app.models.user import User, user_skills
+from app.services.password_hashing import password_hasher
 
-# Default password for all seed users: "password123"
-_SEED_PASSWORD_HASH = bcrypt.hashpw(b"password123", bcrypt.gensalt(rounds=12)).decode()
+# Default password for all seed users
+_SEED_PASSWORD = "password123"
 
 
 async def seed_users(session: AsyncSession, skills_dict: dict[str, str]) -> dict[str, str]:
@@ -223,6 +223,9 @@ async def seed_users(session: AsyncSession, skills_dict: dict[str, str]) -> dict
         },
     ]
 
+    # One hash shared by every seed user, at the configured cost
+    password_hash = await password_hasher.hash(_SEED_PASSWORD)
+
     # Prepare users for bulk insert (without skills)
     users_for_insert = []
     for user_data in users_data:
@@ -230,7 +233,7 @@ async def seed_users(session: AsyncSession, skills_dict: dict[str, str]) -> dict
             "username": user_data["username"],
             "display_name": user_data["display_name"],
             "email": user_data["email"],
-            "password_hash": _SEED_PASSWORD_HASH,
+            "password_hash": password_hash,
             "headline": user_data.get("headline"),
             "bio": user_data.get("bio"),
             "primary_role": user_data.get("primary_role"),
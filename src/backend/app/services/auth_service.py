@@ -1,11 +1,11 @@
 """Auth service — signup, login, token management, and onboarding."""
 
 import hashlib
+import logging
 import re
 import secrets
 from datetime import UTC, datetime, timedelta
 
-import bcrypt
 import jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +15,9 @@ from app.config import settings
 from app.graphql.helpers import AuthError
 from app.models.enums import AvailabilityStatus, UserRole
 from app.models.user import RefreshToken, User, user_skills
+from app.services.password_hashing import PasswordHasherBusy, password_hasher
+
+logger = logging.getLogger(__name__)
 
 ACCESS_TOKEN_EXPIRE_MINUTES = 15
 REFRESH_TOKEN_EXPIRE_DAYS = 7
@@ -41,12 +44,21 @@ def _create_refresh_token_pair() -> tuple[str, str]:
     return raw, hashed
 
 
-def _hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=12)).decode()
+_HASHER_BUSY_MESSAGE = "Too many sign-ins in progress, try again shortly"
+
 
+async def _hash_password(password: str) -> str:
+    try:
+        return await password_hasher.hash(password)
+    except PasswordHasherBusy:
+        raise AuthError(_HASHER_BUSY_MESSAGE, code="RATE_LIMITED") from None
 
-def _verify_password(password: str, password_hash: str) -> bool:
-    return bcrypt.checkpw(password.encode(), password_hash.encode())
+
+async def _verify_password(password: str, password_hash: str) -> bool:
+    try:
+        return await password_hasher.verify(password, password_hash)
+    except PasswordHasherBusy:
+        raise AuthError(_HASHER_BUSY_MESSAGE, code="RATE_LIMITED") from None
 
 
 async def _issue_tokens(session: AsyncSession, user: User) -> dict:
@@ -93,7 +105,7 @@ async def signup(
     user = User(
         id=str(ULID()),
         email=email,
-        password_hash=_hash_password(password),
+        password_hash=await _hash_password(password),
         username=username,
         display_name=display_name,
     )
@@ -113,8 +125,15 @@ async def login(session: AsyncSession, email: str, password: str) -> dict:
 
     if not user or not user.password_hash:
         raise AuthError("Invalid email or password", code="INVALID_CREDENTIALS")
-    if not _verify_password(password, user.password_hash):
+    if not await _verify_password(password, user.password_hash):
         raise AuthError("Invalid email or password", code="INVALID_CREDENTIALS")
+    # Bring hashes made at a lower cost factor up to the configured one. The
+    # password has already verified, so a busy pool only postpones this.
+    if password_hasher.needs_rehash(user.password_hash):
+        try:
+            user.password_hash = await password_hasher.hash(password)
+        except PasswordHasherBusy:
+            logger.info("Hashing pool busy; rehash of user %s left for a later login", user.id)
 
     tokens = await _issue_tokens(session, user)
     await session.commit()
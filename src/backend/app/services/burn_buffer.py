@@ -0,0 +1,280 @@
+"""Write-behind buffer that coalesces burn increments before they reach build_activities.
+
+Used when settings.burn_ingest_mode == "buffered". Plugin hook storms produce
+many small additive writes to the same (user, project, day, source) row; the
+buffer sums them in memory and a background task flushes them as periodic
+multi-row upserts. The lifespan hook in app.main flushes once more on shutdown.
+
+Increments carrying a session_id only count once their burn_ingest_keys row
+is claimed, in the flush's own transaction, so a session already recorded by
+another worker or an earlier process is never added twice.
+"""
+
+import asyncio
+import datetime
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from ulid import ULID
+
+from app.db.engine import async_session_factory
+from app.services import burn_service, ingest_keys
+
+logger = logging.getLogger(__name__)
+
+FLUSH_CHUNK_SIZE = 500
+MAX_ACKNOWLEDGED_SESSIONS = 100_000
+
+# (user_id, project_id, activity_date, source, row_id). row_id is None for
+# project rows, which merge per key like a direct upsert; rows without a
+# project never conflict on insert, so each gets its own key.
+BufferKey = tuple[str, str | None, datetime.date, str, str | None]
+
+
+@dataclass
+class PendingBurn:
+    """Coalesced, not yet persisted increments for one build_activities row."""
+
+    id: str
+    verification: str
+    tool: str | None
+    session_id: str | None
+    token_precision: str
+    metadata: dict | None
+    # Tokens of increments without a session_id, always written
+    unkeyed_tokens: int = 0
+    # session_id -> tokens, written only if the flush claims the session_id
+    session_tokens: dict[str, int] = field(default_factory=dict)
+
+    def add_tokens(self, tokens: int, session_id: str | None) -> bool:
+        """Record an increment; False if its session_id is already folded in."""
+        if session_id is None:
+            self.unkeyed_tokens += tokens
+        elif session_id in self.session_tokens:
+            return False
+        else:
+            self.session_tokens[session_id] = tokens
+        return True
+
+
+class BurnBuffer:
+    """In-process accumulator of burn increments keyed by BufferKey.
+
+    Acknowledged session_ids are remembered (LRU-bounded) until well past the
+    flush that writes them to the burn_ingest_keys ledger, which answers
+    replays from then on.
+    """
+
+    def __init__(self, max_acknowledged_sessions: int = MAX_ACKNOWLEDGED_SESSIONS):
+        self._pending: dict[BufferKey, PendingBurn] = {}
+        self._in_flight: dict[BufferKey, PendingBurn] = {}
+        # (user_id, activity_date) -> buffered tokens, mirrors _pending/_in_flight
+        self._pending_days: dict[tuple[str, datetime.date], int] = {}
+        self._in_flight_days: dict[tuple[str, datetime.date], int] = {}
+        # (user_id, session_id) -> (burn_id, project_id, activity_date)
+        self._sessions: OrderedDict[
+            tuple[str, str], tuple[str, str | None, datetime.date]
+        ] = OrderedDict()
+        self._max_acknowledged_sessions = max_acknowledged_sessions
+        self._flush_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(
+        self,
+        user_id: str,
+        project_id: str | None,
+        activity_date: datetime.date,
+        source: str,
+        tokens_burned: int,
+        verification: str,
+        tool: str | None = None,
+        session_id: str | None = None,
+        token_precision: str = "approximate",
+        metadata: dict | None = None,
+        persisted_id: str | None = None,
+    ) -> str:
+        """Buffer one increment and return the burn_id to report to the caller.
+
+        persisted_id is the id of the row already stored for this key, if
+        known; otherwise the id the row will be inserted with is returned.
+        Later increments for a key overwrite its non-additive fields, matching
+        the ON CONFLICT behaviour of a direct upsert.
+        """
+        row_id = str(ULID())
+        key: BufferKey = (
+            user_id, project_id, activity_date, source, None if project_id else row_id
+        )
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = PendingBurn(
+                id=row_id,
+                verification=verification,
+                tool=tool,
+                session_id=session_id,
+                token_precision=token_precision,
+                metadata=metadata,
+            )
+            self._pending[key] = pending
+        else:
+            pending.verification = verification
+            pending.tool = tool
+            pending.session_id = session_id
+            pending.token_precision = token_precision
+            pending.metadata = metadata
+
+        if pending.add_tokens(tokens_burned, session_id or None):
+            day_key = (user_id, activity_date)
+            self._pending_days[day_key] = self._pending_days.get(day_key, 0) + tokens_burned
+
+        burn_id = persisted_id or pending.id
+        if session_id:
+            self._remember_session(user_id, session_id, (burn_id, project_id, activity_date))
+        return burn_id
+
+    def acknowledged(
+        self, user_id: str, session_id: str
+    ) -> tuple[str, str | None, datetime.date] | None:
+        """Return (burn_id, project_id, activity_date) for a session_id seen by this buffer."""
+        return self._sessions.get((user_id, session_id))
+
+    def day_total(self, user_id: str, activity_date: datetime.date) -> int:
+        """Tokens buffered (pending or being flushed) for a user on a given date.
+
+        Approximate while a flush is committing, since the persisted value read
+        alongside it may or may not include the in-flight rows yet.
+        """
+        day_key = (user_id, activity_date)
+        return self._pending_days.get(day_key, 0) + self._in_flight_days.get(day_key, 0)
+
+    def clear(self) -> None:
+        """Drop all buffered state without persisting it."""
+        self._pending.clear()
+        self._in_flight.clear()
+        self._pending_days.clear()
+        self._in_flight_days.clear()
+        self._sessions.clear()
+
+    async def flush(
+        self,
+        session_factory: Callable[[], AsyncSession] = async_session_factory,
+    ) -> int:
+        """Persist everything buffered so far. Returns the number of rows upserted.
+
+        The session_ids are claimed in the ledger first, in the same
+        transaction, and only increments whose claim succeeded are written.
+        On failure the increments are merged back into the buffer so the next
+        flush retries them, and the exception propagates.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            self._in_flight, self._pending = self._pending, {}
+            self._in_flight_days, self._pending_days = self._pending_days, {}
+
+            # (user_id, session_id) -> ledger row, for the first row folding it in
+            keys: dict[tuple[str, str], dict] = {}
+            for (user_id, project_id, activity_date, source, _), pending in self._in_flight.items():
+                for session_id in pending.session_tokens:
+                    keys.setdefault((user_id, session_id), {
+                        "user_id": user_id,
+                        "session_id": session_id,
+                        "burn_id": pending.id,
+                        "project_id": project_id,
+                        "activity_date": activity_date,
+                        "source": source,
+                    })
+            key_rows = list(keys.values())
+            try:
+                async with session_factory() as session:
+                    claimed: set[tuple[str, str]] = set()
+                    for start in range(0, len(key_rows), FLUSH_CHUNK_SIZE):
+                        claimed |= await ingest_keys.claim_user_keys(
+                            session, key_rows[start : start + FLUSH_CHUNK_SIZE]
+                        )
+                    rows = self._claimed_rows({key: keys[key]["burn_id"] for key in claimed})
+                    for start in range(0, len(rows), FLUSH_CHUNK_SIZE):
+                        await burn_service.upsert_activities(
+                            session, rows[start : start + FLUSH_CHUNK_SIZE]
+                        )
+                    await session.commit()
+            except Exception:
+                self._requeue_in_flight()
+                raise
+            finally:
+                self._in_flight = {}
+                self._in_flight_days = {}
+            return len(rows)
+
+    async def run(self, interval_seconds: float) -> None:
+        """Flush every interval_seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Burn buffer flush failed; increments kept for retry")
+
+    def _claimed_rows(self, claimed: dict[tuple[str, str], str]) -> list[dict]:
+        """build_activities rows of the in-flight increments, minus unclaimed sessions.
+
+        claimed maps each newly claimed (user_id, session_id) to the id of the
+        one row it is counted in.
+        """
+        rows = []
+        for (user_id, project_id, activity_date, source, _), pending in self._in_flight.items():
+            claimed_tokens = [
+                tokens
+                for session_id, tokens in pending.session_tokens.items()
+                if claimed.get((user_id, session_id)) == pending.id
+            ]
+            if not claimed_tokens and not pending.unkeyed_tokens:
+                # Every increment replays a session recorded elsewhere
+                continue
+            rows.append(
+                {
+                    "id": pending.id,
+                    "user_id": user_id,
+                    "project_id": project_id,
+                    "activity_date": activity_date,
+                    "tokens_burned": pending.unkeyed_tokens + sum(claimed_tokens),
+                    "source": source,
+                    "verification": pending.verification,
+                    "tool": pending.tool,
+                    "session_id": pending.session_id,
+                    "token_precision": pending.token_precision,
+                    "metadata_": pending.metadata,
+                }
+            )
+        return rows
+
+    def _requeue_in_flight(self) -> None:
+        """Merge in-flight increments back into the pending buffer."""
+        for key, in_flight in self._in_flight.items():
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = in_flight
+            else:
+                pending.unkeyed_tokens += in_flight.unkeyed_tokens
+                pending.id = in_flight.id
+                pending.session_tokens = {**in_flight.session_tokens, **pending.session_tokens}
+        for day_key, tokens in self._in_flight_days.items():
+            self._pending_days[day_key] = self._pending_days.get(day_key, 0) + tokens
+
+    def _remember_session(
+        self,
+        user_id: str,
+        session_id: str,
+        outcome: tuple[str, str | None, datetime.date],
+    ) -> None:
+        self._sessions[(user_id, session_id)] = outcome
+        self._sessions.move_to_end((user_id, session_id))
+        while len(self._sessions) > self._max_acknowledged_sessions:
+            self._sessions.popitem(last=False)
+
+
+burn_buffer = BurnBuffer()
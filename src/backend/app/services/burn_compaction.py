@@ -0,0 +1,158 @@
+"""Compaction of old build_activities rows into weekly build_activity_periods rows.
+
+Daily rows are only needed while they are recent enough to be edited or
+shown day by day. Beyond settings.burn_compaction_horizon_days they are summed
+per (user, project, source, ISO week) into build_activity_periods and
+deleted, so receipts read a handful of period rows instead of every day ever
+recorded. Periods are weeks because receipts report a peak week: a period
+never straddles two weeks, so compaction leaves that figure unchanged. The
+user_daily_burn / user_weekly_burn rollups are left as they are, so summaries
+keep day-level history.
+
+Rows an unexpired burn_ingest_keys entry still points at stay daily until the
+key is swept, so a replayed session is never answered with a deleted row.
+"""
+
+import asyncio
+import datetime
+import logging
+from collections import defaultdict
+from collections.abc import Callable
+
+from sqlalchemy import delete, exists, func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from ulid import ULID
+
+from app.db.engine import async_session_factory
+from app.models.build_activity import BuildActivity
+from app.models.build_activity_period import BuildActivityPeriod
+from app.models.burn_ingest_key import BurnIngestKey
+from app.services.burn_service import week_start
+
+logger = logging.getLogger(__name__)
+
+# Daily rows deleted (and held in memory) per transaction
+DELETE_BATCH_SIZE = 5000
+# Rows per INSERT, keeping each statement well under the bind parameter limit
+INSERT_CHUNK_SIZE = 1000
+
+
+def compaction_cutoff(horizon_days: int, today: datetime.date | None = None) -> datetime.date:
+    """Start of the week containing the horizon; rows before it are compacted.
+
+    Aligning to a week boundary means a week is compacted all at once,
+    never half daily and half summarised.
+    """
+    horizon = (today or datetime.date.today()) - datetime.timedelta(days=horizon_days)
+    return week_start(horizon)
+
+
+async def compact_burn_history(session: AsyncSession, before: datetime.date) -> int:
+    """Fold build_activities rows dated before `before` into build_activity_periods.
+
+    Works in batches of at most DELETE_BATCH_SIZE rows, committing after
+    each, so memory and transaction size stay bounded however much history
+    is due. Each batch is removed with DELETE ... RETURNING and the returned
+    rows are what gets summed, so a concurrent write is either compacted or
+    left in place, never lost. Returns the number of daily rows compacted.
+    """
+    compacted = 0
+    while True:
+        batch = await _compact_batch(session, before)
+        await session.commit()
+        compacted += batch
+        if batch < DELETE_BATCH_SIZE:
+            return compacted
+
+
+async def run(
+    interval_seconds: float,
+    horizon_days: int,
+    session_factory: Callable[[], AsyncSession] = async_session_factory,
+) -> None:
+    """Compact once every interval_seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with session_factory() as session:
+                compacted = await compact_burn_history(session, compaction_cutoff(horizon_days))
+            if compacted:
+                logger.info("Compacted %d build_activities rows", compacted)
+        except Exception:
+            logger.exception("Burn history compaction failed; will retry next interval")
+
+
+def _has_live_key():
+    """Whether an ingest key still resolves to the build_activities row (see resolved_burn_id)."""
+    return exists().where(
+        BurnIngestKey.user_id == BuildActivity.user_id,
+        BurnIngestKey.activity_date == BuildActivity.activity_date,
+        BurnIngestKey.source == BuildActivity.source,
+        or_(
+            BurnIngestKey.burn_id == BuildActivity.id,
+            BurnIngestKey.project_id == BuildActivity.project_id,
+        ),
+    )
+
+
+async def _compact_batch(session: AsyncSession, before: datetime.date) -> int:
+    """Move up to DELETE_BATCH_SIZE rows dated before `before` into period rows. Does NOT commit."""
+    batch = (
+        select(BuildActivity.id, BuildActivity.activity_date)
+        .where(BuildActivity.activity_date < before, ~_has_live_key())
+        .limit(DELETE_BATCH_SIZE)
+    )
+    result = await session.execute(
+        delete(BuildActivity)
+        .where(
+            # The date bound lets the delete prune partitions, like the batch query
+            BuildActivity.activity_date < before,
+            tuple_(BuildActivity.id, BuildActivity.activity_date).in_(batch),
+        )
+        .returning(
+            BuildActivity.user_id,
+            BuildActivity.project_id,
+            BuildActivity.source,
+            BuildActivity.activity_date,
+            BuildActivity.tokens_burned,
+        )
+    )
+    totals: dict[tuple, int] = defaultdict(int)
+    spans: dict[tuple, tuple[datetime.date, datetime.date]] = {}
+    rows = result.all()
+    for row in rows:
+        key = (row.user_id, row.project_id, row.source, week_start(row.activity_date))
+        totals[key] += row.tokens_burned
+        first, last = spans.get(key, (row.activity_date, row.activity_date))
+        spans[key] = (min(first, row.activity_date), max(last, row.activity_date))
+    if not totals:
+        return 0
+
+    values = [
+        {
+            "id": str(ULID()),
+            "user_id": user_id,
+            "project_id": project_id,
+            "source": source,
+            "period_start": period,
+            "tokens": tokens,
+            "first_date": spans[user_id, project_id, source, period][0],
+            "last_date": spans[user_id, project_id, source, period][1],
+        }
+        for (user_id, project_id, source, period), tokens in totals.items()
+    ]
+    for chunk_start in range(0, len(values), INSERT_CHUNK_SIZE):
+        stmt = insert(BuildActivityPeriod).values(
+            values[chunk_start : chunk_start + INSERT_CHUNK_SIZE]
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_build_activity_period",
+            set_={
+                "tokens": BuildActivityPeriod.tokens + stmt.excluded.tokens,
+                "first_date": func.least(BuildActivityPeriod.first_date, stmt.excluded.first_date),
+                "last_date": func.greatest(BuildActivityPeriod.last_date, stmt.excluded.last_date),
+            },
+        )
+        await session.execute(stmt)
+    return len(rows)
@@ -0,0 +1,154 @@
+"""Monthly partition maintenance for build_activities.
+
+build_activities is range-partitioned on activity_date with one partition per
+calendar month, named build_activities_yYYYYmMM, plus a DEFAULT partition
+that catches dates no monthly partition covers yet. Creating partitions ahead
+of time keeps writes out of the default partition; detaching old ones bounds
+the size of the live table (and of vacuum work on it) as history grows.
+
+Detaching does not touch user_daily_burn / user_weekly_burn, so burn
+summaries keep their history. Rebuilding the rollups afterwards would only
+see the attached months.
+"""
+
+import datetime
+import re
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+PARENT_TABLE = "build_activities"
+DEFAULT_PARTITION = "build_activities_default"
+
+_PARTITION_NAME = re.compile(r"^build_activities_y(\d{4})m(\d{2})$")
+_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+def month_start(day: datetime.date) -> datetime.date:
+    """First day of the month containing day."""
+    return day.replace(day=1)
+
+
+def add_months(month: datetime.date, count: int) -> datetime.date:
+    """First day of the month count months after (or before) month."""
+    index = month.year * 12 + month.month - 1 + count
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime.date) -> str:
+    """Name of the partition holding the month that contains the given date."""
+    return f"{PARENT_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+async def list_partitions(session: AsyncSession) -> list[datetime.date]:
+    """Return the first day of every month with an attached partition, ascending."""
+    result = await session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:parent AS regclass)"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    months = []
+    for (name,) in result.all():
+        match = _PARTITION_NAME.match(name)
+        if match:
+            months.append(datetime.date(int(match[1]), int(match[2]), 1))
+    return sorted(months)
+
+
+async def create_partitions(
+    session: AsyncSession,
+    months_ahead: int,
+    today: datetime.date | None = None,
+) -> list[str]:
+    """Create any missing monthly partitions from this month through months_ahead months out.
+
+    Rows that already landed in the default partition for a new month are
+    moved into it. Returns the names of the partitions created. Commits.
+    """
+    current = month_start(today or datetime.date.today())
+    existing = set(await list_partitions(session))
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month in existing:
+            continue
+        await _create_partition(session, month)
+        created.append(partition_name(month))
+
+    await session.commit()
+    return created
+
+
+async def detach_partitions(
+    session: AsyncSession,
+    before: datetime.date,
+    archive_schema: str | None = None,
+    drop: bool = False,
+) -> list[str]:
+    """Detach every monthly partition that ends on or before the month containing before.
+
+    Detached partitions become standalone tables. With archive_schema they
+    are moved into that schema (created if needed); with drop they are
+    dropped outright. Returns the names of the partitions detached. Commits.
+    """
+    if archive_schema is not None and not _IDENTIFIER.match(archive_schema):
+        raise ValueError(f"Invalid archive schema name: {archive_schema!r}")
+    if archive_schema is not None:
+        await session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {archive_schema}"))
+
+    cutoff = month_start(before)
+    detached = []
+    for month in await list_partitions(session):
+        if month >= cutoff:
+            break
+        name = partition_name(month)
+        await session.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        if drop:
+            await session.execute(text(f"DROP TABLE {name}"))
+        elif archive_schema is not None:
+            await session.execute(text(f"ALTER TABLE {name} SET SCHEMA {archive_schema}"))
+        detached.append(name)
+
+    await session.commit()
+    return detached
+
+
+async def _create_partition(session: AsyncSession, month: datetime.date) -> None:
+    """Create one monthly partition, relocating matching rows out of the default partition.
+
+    Postgres refuses to create a partition whose range overlaps rows already
+    in the default partition, so those rows are moved with the default
+    partition detached. Does NOT commit.
+    """
+    start, end = month, add_months(month, 1)
+    bounds = {"start": start, "end": end}
+    create = text(
+        f"CREATE TABLE {partition_name(month)} PARTITION OF {PARENT_TABLE} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+    in_range = "activity_date >= :start AND activity_date < :end"
+
+    stranded = (
+        await session.execute(
+            text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_range})"),
+            bounds,
+        )
+    ).scalar()
+    if not stranded:
+        await session.execute(create)
+        return
+
+    await session.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}"))
+    await session.execute(create)
+    await session.execute(
+        text(f"INSERT INTO {PARENT_TABLE} SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}"),
+        bounds,
+    )
+    await session.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"), bounds)
+    await session.execute(
+        text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+    )
@@ -3,11 +3,118 @@
 import datetime
 from collections import defaultdict
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Date,
+    Integer,
+    cast,
+    delete,
+    func,
+    literal,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.build_activity import BuildActivity
+from app.models.build_activity_period import BuildActivityPeriod
+from app.models.user_daily_burn import UserDailyBurn
+from app.models.user_weekly_burn import UserWeeklyBurn
+
+
+def week_start(day: datetime.date) -> datetime.date:
+    """Monday of the ISO week containing day (matches Postgres date_trunc('week'))."""
+    return day - datetime.timedelta(days=day.weekday())
+
+
+async def _apply_rollup_deltas(
+    session: AsyncSession,
+    model: type[UserDailyBurn] | type[UserWeeklyBurn],
+    date_column: str,
+    deltas: dict[tuple[str, datetime.date], int],
+) -> None:
+    """Upsert positive deltas in one statement; apply negative ones as plain updates."""
+    increments = [
+        {"user_id": user_id, date_column: day, "tokens": tokens}
+        for (user_id, day), tokens in deltas.items()
+        if tokens > 0
+    ]
+    if increments:
+        stmt = insert(model).values(increments)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[model.user_id, getattr(model, date_column)],
+            set_={"tokens": model.tokens + stmt.excluded.tokens},
+        )
+        await session.execute(stmt)
+
+    for (user_id, day), tokens in deltas.items():
+        if tokens < 0:
+            await session.execute(
+                update(model)
+                .where(model.user_id == user_id, getattr(model, date_column) == day)
+                .values(tokens=model.tokens + tokens)
+            )
+
+
+async def adjust_burn_rollups(
+    session: AsyncSession,
+    deltas: dict[tuple[str, datetime.date], int],
+) -> None:
+    """Apply token deltas to the user_daily_burn and user_weekly_burn rollups.
+
+    deltas maps (user_id, activity_date) to the change in that day's total.
+    Decrements (from edits and deletes) only update existing rollup rows.
+    Does NOT commit.
+    """
+    weekly: dict[tuple[str, datetime.date], int] = defaultdict(int)
+    for (user_id, day), tokens in deltas.items():
+        weekly[(user_id, week_start(day))] += tokens
+    await _apply_rollup_deltas(session, UserDailyBurn, "activity_date", deltas)
+    await _apply_rollup_deltas(session, UserWeeklyBurn, "week_start", weekly)
+
+
+async def rebuild_burn_rollups(session: AsyncSession) -> int:
+    """Recompute user_daily_burn and user_weekly_burn out of build_activities.
+
+    Days up to the end of the last week compacted into build_activity_periods
+    no longer have their daily rows, so their daily rollups are kept as
+    ingest maintained them; every later day is recomputed from scratch, and
+    the weekly rollup is rebuilt from the daily one. Returns the number of
+    daily rollup rows written. Commits.
+    """
+    last_period = (
+        await session.execute(select(func.max(BuildActivityPeriod.period_start)))
+    ).scalar()
+    rebuilt_from = last_period + datetime.timedelta(days=7) if last_period else None
+
+    daily_rollup = delete(UserDailyBurn)
+    daily_totals = select(
+        BuildActivity.user_id, BuildActivity.activity_date, func.sum(BuildActivity.tokens_burned)
+    ).group_by(BuildActivity.user_id, BuildActivity.activity_date)
+    if rebuilt_from is not None:
+        daily_rollup = daily_rollup.where(UserDailyBurn.activity_date >= rebuilt_from)
+        daily_totals = daily_totals.where(BuildActivity.activity_date >= rebuilt_from)
+    await session.execute(daily_rollup)
+    await session.execute(delete(UserWeeklyBurn))
+    result = await session.execute(
+        insert(UserDailyBurn).from_select(
+            ["user_id", "activity_date", "tokens"], daily_totals
+        )
+    )
+    week = cast(func.date_trunc("week", UserDailyBurn.activity_date), Date).label("week_start")
+    weekly_totals = (
+        select(UserDailyBurn.user_id, week, func.sum(UserDailyBurn.tokens))
+        .group_by(UserDailyBurn.user_id, week)
+    )
+    await session.execute(
+        insert(UserWeeklyBurn).from_select(
+            ["user_id", "week_start", "tokens"], weekly_totals
+        )
+    )
+    await session.commit()
+    return result.rowcount
 
 
 async def log_session(
@@ -45,6 +152,68 @@ async def log_session(
         )
     )
     await session.execute(stmt)
+    await adjust_burn_rollups(session, {(user_id, target_date): tokens_burned})
+
+
+async def upsert_activities(
+    session: AsyncSession,
+    rows: list[dict],
+) -> dict[tuple, str]:
+    """Additively upsert many BuildActivity rows with one multi-row INSERT ... ON CONFLICT.
+
+    Each dict carries BuildActivity column values (including a pre-generated
+    id). Rows must already be coalesced so that no two share a
+    uq_build_activity_per_day key — Postgres refuses to update a row twice in
+    one statement. The user_daily_burn rollup is adjusted to match. Does NOT
+    commit.
+
+    Returns {(project_id, activity_date, source): id} for rows with a project,
+    which may point at a pre-existing row. Rows without a project never
+    conflict, so they keep the id they were given.
+    """
+    if not rows:
+        return {}
+    stmt = insert(BuildActivity).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_build_activity_per_day",
+        set_={
+            "tokens_burned": BuildActivity.tokens_burned + stmt.excluded.tokens_burned,
+            "verification": stmt.excluded.verification,
+            "tool": stmt.excluded.tool,
+            "session_id": stmt.excluded.session_id,
+            "token_precision": stmt.excluded.token_precision,
+            "metadata": stmt.excluded["metadata"],
+        },
+    ).returning(
+        BuildActivity.id,
+        BuildActivity.project_id,
+        BuildActivity.activity_date,
+        BuildActivity.source,
+    )
+    result = await session.execute(stmt)
+    upserted = {
+        (row.project_id, row.activity_date, row.source): row.id
+        for row in result.all()
+        if row.project_id is not None
+    }
+
+    deltas: dict[tuple[str, datetime.date], int] = defaultdict(int)
+    for row in rows:
+        deltas[(row["user_id"], row["activity_date"])] += row["tokens_burned"]
+    await adjust_burn_rollups(session, deltas)
+
+    return upserted
+
+
+def _empty_summary(weeks: int) -> dict:
+    return {
+        "days_active": 0,
+        "total_tokens": 0,
+        "active_weeks": 0,
+        "total_weeks": weeks,
+        "weekly_streak": 0,
+        "daily_activity": [],
+    }
 
 
 async def get_summary(
@@ -62,72 +231,108 @@ async def get_summary(
       - weekly_streak: consecutive active weeks counting back from most recent activity
       - daily_activity: list of {date, tokens} dicts sorted ascending
     """
+    summaries = await get_summaries(session, [user_id], weeks=weeks)
+    return summaries[user_id]
+
+
+async def get_summaries(
+    session: AsyncSession,
+    user_ids: list[str],
+    weeks: int = 52,
+) -> dict[str, dict]:
+    """Return get_summary dicts for many users from a single query.
+
+    Every requested user_id is present in the result; users without activity
+    in the window get an all-zero summary.
+
+    Daily rows come from a range scan over the user_daily_burn primary key.
+    Week figures cover the same window: whole ISO weeks after the cutoff's
+    week come from user_weekly_burn, and the cutoff's own week counts only if
+    there was activity on or after the cutoff. Streaks use gaps-and-islands:
+    subtracting row_number() weeks from each week_start gives the same value
+    for every week in an unbroken run, and the streak is the run containing
+    the latest week.
+    """
+    summaries = {user_id: _empty_summary(weeks) for user_id in user_ids}
+    if not summaries:
+        return summaries
     cutoff = datetime.date.today() - datetime.timedelta(weeks=weeks)
+    first_week = week_start(cutoff)
+
+    window_weeks = union_all(
+        select(UserWeeklyBurn.user_id, UserWeeklyBurn.week_start).where(
+            UserWeeklyBurn.user_id.in_(summaries),
+            UserWeeklyBurn.week_start > first_week,
+            UserWeeklyBurn.tokens > 0,
+        ),
+        # The cutoff's week straddles the window edge, so only its days on or
+        # after the cutoff count
+        select(UserDailyBurn.user_id, literal(first_week, Date).label("week_start"))
+        .where(
+            UserDailyBurn.user_id.in_(summaries),
+            UserDailyBurn.activity_date >= cutoff,
+            UserDailyBurn.activity_date < first_week + datetime.timedelta(weeks=1),
+            UserDailyBurn.tokens > 0,
+        )
+        .distinct(),
+    ).subquery("window_weeks")
+    position = func.row_number().over(
+        partition_by=window_weeks.c.user_id, order_by=window_weeks.c.week_start
+    )
+    active_weeks = select(
+        window_weeks.c.user_id,
+        window_weeks.c.week_start,
+        (window_weeks.c.week_start - cast(position * 7, Integer)).label("island"),
+    ).subquery("active_weeks")
+    islands = select(
+        active_weeks.c.user_id,
+        active_weeks.c.island,
+        func.last_value(active_weeks.c.island)
+        .over(
+            partition_by=active_weeks.c.user_id,
+            order_by=active_weeks.c.week_start,
+            rows=(None, None),
+        )
+        .label("latest_island"),
+    ).subquery("islands")
+    week_stats = (
+        select(
+            islands.c.user_id,
+            func.count().label("active_weeks"),
+            func.count()
+            .filter(islands.c.island == islands.c.latest_island)
+            .label("weekly_streak"),
+        )
+        .group_by(islands.c.user_id)
+        .subquery("week_stats")
+    )
 
     stmt = (
         select(
-            BuildActivity.activity_date,
-            func.sum(BuildActivity.tokens_burned).label("tokens"),
+            UserDailyBurn.user_id,
+            UserDailyBurn.activity_date,
+            UserDailyBurn.tokens,
+            func.coalesce(week_stats.c.active_weeks, 0).label("active_weeks"),
+            func.coalesce(week_stats.c.weekly_streak, 0).label("weekly_streak"),
         )
+        .outerjoin(week_stats, week_stats.c.user_id == UserDailyBurn.user_id)
         .where(
-            BuildActivity.user_id == user_id,
-            BuildActivity.activity_date >= cutoff,
+            UserDailyBurn.user_id.in_(summaries),
+            UserDailyBurn.activity_date >= cutoff,
+            UserDailyBurn.tokens > 0,
         )
-        .group_by(BuildActivity.activity_date)
-        .order_by(BuildActivity.activity_date)
+        .order_by(UserDailyBurn.user_id, UserDailyBurn.activity_date)
     )
     result = await session.execute(stmt)
-    rows = result.all()
 
-    if not rows:
-        return {
-            "days_active": 0,
-            "total_tokens": 0,
-            "active_weeks": 0,
-            "total_weeks": weeks,
-            "weekly_streak": 0,
-            "daily_activity": [],
-        }
-
-    daily_activity = [{"date": row.activity_date, "tokens": int(row.tokens)} for row in rows]
-    total_tokens = sum(d["tokens"] for d in daily_activity)
-    days_active = len(daily_activity)
-
-    # Group by ISO (year, week) to calculate active_weeks
-    active_week_set: set[tuple[int, int]] = set()
-    for d in daily_activity:
-        iso = d["date"].isocalendar()
-        active_week_set.add((iso[0], iso[1]))
-    active_weeks = len(active_week_set)
-
-    # weekly_streak: consecutive active weeks ending at the most recent active week
-    if active_week_set:
-        # Build ordered list of (year, week) tuples present in data
-        sorted_weeks = sorted(active_week_set)
-        # Walk backwards from the last active week counting consecutive weeks
-        streak = 1
-        for i in range(len(sorted_weeks) - 1, 0, -1):
-            cur_year, cur_week = sorted_weeks[i]
-            prev_year, prev_week = sorted_weeks[i - 1]
-            # Check if prev week is immediately before cur week
-            cur_date = datetime.date.fromisocalendar(cur_year, cur_week, 1)
-            expected_prev = cur_date - datetime.timedelta(weeks=1)
-            expected_prev_iso = expected_prev.isocalendar()
-            if (prev_year, prev_week) == (expected_prev_iso[0], expected_prev_iso[1]):
-                streak += 1
-            else:
-                break
-    else:
-        streak = 0
-
-    return {
-        "days_active": days_active,
-        "total_tokens": total_tokens,
-        "active_weeks": active_weeks,
-        "total_weeks": weeks,
-        "weekly_streak": streak,
-        "daily_activity": daily_activity,
-    }
+    for row in result.all():
+        summary = summaries[row.user_id]
+        summary["daily_activity"].append({"date": row.activity_date, "tokens": int(row.tokens)})
+        summary["days_active"] += 1
+        summary["total_tokens"] += int(row.tokens)
+        summary["active_weeks"] = int(row.active_weeks)
+        summary["weekly_streak"] = int(row.weekly_streak)
+    return summaries
 
 
 async def get_receipt(
@@ -144,20 +349,57 @@ async def get_receipt(
       - peak_week_tokens: highest single-week token total
       - daily_activity: list of {date, tokens} dicts sorted ascending
 
+    History compacted by app.services.burn_compaction is included as one entry
+    per compacted week, dated on its Monday. Weeks are never split by
+    compaction, so the total and peak week are unaffected by it, and the
+    duration is measured from the first and last days with activity that
+    each period records.
+
     Returns None if there is no activity for this project.
     """
-    stmt = (
+    # Recent daily rows plus compacted history, which appears as one entry
+    # on the Monday of each compacted week
+    history = union_all(
         select(
             BuildActivity.activity_date,
-            func.sum(BuildActivity.tokens_burned).label("tokens"),
-        )
-        .where(
+            BuildActivity.tokens_burned.label("tokens"),
+            BuildActivity.activity_date.label("first_date"),
+            BuildActivity.activity_date.label("last_date"),
+        ).where(
             BuildActivity.user_id == user_id,
             BuildActivity.project_id == project_id,
+        ),
+        select(
+            BuildActivityPeriod.period_start,
+            BuildActivityPeriod.tokens,
+            BuildActivityPeriod.first_date,
+            BuildActivityPeriod.last_date,
+        ).where(
+            BuildActivityPeriod.user_id == user_id,
+            BuildActivityPeriod.project_id == project_id,
+        ),
+    ).subquery("history")
+    day_tokens = func.sum(history.c.tokens)
+    daily = (
+        select(
+            history.c.activity_date,
+            day_tokens.label("tokens"),
+            func.min(history.c.first_date).label("first_date"),
+            func.max(history.c.last_date).label("last_date"),
+            func.sum(day_tokens)
+            .over(partition_by=func.date_trunc("week", history.c.activity_date))
+            .label("week_tokens"),
         )
-        .group_by(BuildActivity.activity_date)
-        .order_by(BuildActivity.activity_date)
+        .group_by(history.c.activity_date)
+        .subquery("daily")
     )
+    stmt = select(
+        daily.c.activity_date,
+        daily.c.tokens,
+        func.max(daily.c.week_tokens).over().label("peak_week_tokens"),
+        func.min(daily.c.first_date).over().label("first_date"),
+        func.max(daily.c.last_date).over().label("last_date"),
+    ).order_by(daily.c.activity_date)
     result = await session.execute(stmt)
     rows = result.all()
 
@@ -167,19 +409,12 @@ async def get_receipt(
     daily_activity = [{"date": row.activity_date, "tokens": int(row.tokens)} for row in rows]
     total_tokens = sum(d["tokens"] for d in daily_activity)
 
-    first_date = daily_activity[0]["date"]
-    last_date = daily_activity[-1]["date"]
     # duration_weeks: number of calendar weeks from first to last activity, minimum 1
-    delta_days = (last_date - first_date).days
+    delta_days = (rows[0].last_date - rows[0].first_date).days
     duration_weeks = max(1, (delta_days // 7) + 1)
 
-    # Aggregate tokens by ISO week to find peak week
-    weekly_tokens: dict[tuple[int, int], int] = defaultdict(int)
-    for d in daily_activity:
-        iso = d["date"].isocalendar()
-        weekly_tokens[(iso[0], iso[1])] += d["tokens"]
-
-    peak_week_tokens = max(weekly_tokens.values()) if weekly_tokens else 0
+    # Every row carries the same window-computed peak ISO-week total
+    peak_week_tokens = int(rows[0].peak_week_tokens)
 
     return {
         "project_id": project_id,
@@ -190,6 +425,67 @@ async def get_receipt(
     }
 
 
+BREAKDOWN_DIMENSIONS = ("source", "tool", "project_id", "verification")
+
+
+async def get_breakdown(
+    session: AsyncSession,
+    user_id: str,
+    weeks: int = 52,
+) -> dict:
+    """Return a user's token totals split by source, tool, project and verification.
+
+    Returns a dict with:
+      - total_tokens: sum over the window
+      - by_source / by_tool / by_project / by_verification: lists of
+        {key, tokens} dicts, largest first; key is None for rows without a
+        tool or project
+
+    Every split comes from one GROUPING SETS aggregation over the user's
+    build_activities rows in the window (an ix_build_activities_user_date
+    range scan). History already compacted into build_activity_periods is
+    not included, since it no longer carries tool or verification.
+    """
+    cutoff = datetime.date.today() - datetime.timedelta(weeks=weeks)
+    columns = [getattr(BuildActivity, name) for name in BREAKDOWN_DIMENSIONS]
+    stmt = (
+        select(
+            *columns,
+            *(func.grouping(column).label(f"grouped_{column.key}") for column in columns),
+            func.coalesce(func.sum(BuildActivity.tokens_burned), 0).label("tokens"),
+        )
+        .where(
+            BuildActivity.user_id == user_id,
+            BuildActivity.activity_date >= cutoff,
+        )
+        .group_by(func.grouping_sets(*(tuple_(column) for column in columns), tuple_()))
+    )
+    result = await session.execute(stmt)
+
+    breakdown: dict[str, list[dict]] = {name: [] for name in BREAKDOWN_DIMENSIONS}
+    total_tokens = 0
+    for row in result.all():
+        # grouping(col) is 0 only for the column the row is grouped by
+        grouped_by = [
+            name for name in BREAKDOWN_DIMENSIONS if getattr(row, f"grouped_{name}") == 0
+        ]
+        if not grouped_by:
+            total_tokens = int(row.tokens)
+            continue
+        name = grouped_by[0]
+        breakdown[name].append({"key": getattr(row, name), "tokens": int(row.tokens)})
+
+    for entries in breakdown.values():
+        entries.sort(key=lambda entry: entry["tokens"], reverse=True)
+    return {
+        "total_tokens": total_tokens,
+        "by_source": breakdown["source"],
+        "by_tool": breakdown["tool"],
+        "by_project": breakdown["project_id"],
+        "by_verification": breakdown["verification"],
+    }
+
+
 _UNSET = object()
 
 
@@ -216,6 +512,9 @@ async def update_burn(
         return None
 
     if tokens_burned is not None:
+        delta = tokens_burned - record.tokens_burned
+        if delta:
+            await adjust_burn_rollups(session, {(user_id, record.activity_date): delta})
         record.tokens_burned = tokens_burned
     if source is not None:
         record.source = source
@@ -249,6 +548,7 @@ async def delete_burn(
     if record is None:
         return False
 
+    await adjust_burn_rollups(session, {(user_id, record.activity_date): -record.tokens_burned})
     await session.delete(record)
     await session.commit()
     return True
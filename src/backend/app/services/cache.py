@@ -0,0 +1,154 @@
+"""Bounded in-process TTL-LRU cache shared by the hot lookup paths.
+
+Entries expire after a TTL (a shorter one for negative, i.e. None, results)
+and the least recently used entry is evicted once the cache is full, so memory
+stays bounded however many distinct keys are seen. Each entry may name an
+owner (a user id); invalidate_owner drops all of an owner's entries through a
+secondary index without scanning the cache. Every cache registers itself by
+name so cache_metrics() can report hit/miss/eviction counters for all of them.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+# Returned by TTLCache.get for absent or expired keys (None is a cacheable value)
+MISSING = _Missing()
+
+
+@dataclass
+class CacheStats:
+    """Counters for one cache since start-up (or the last reset)."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class _Entry:
+    value: object
+    expires_at: float
+    owner: str | None
+
+
+_registry: dict[str, "TTLCache"] = {}
+
+
+class TTLCache:
+    """Size-capped mapping whose entries expire and are evicted least-recently-used first."""
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        ttl_seconds: float,
+        negative_ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = (
+            ttl_seconds if negative_ttl_seconds is None else negative_ttl_seconds
+        )
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._by_owner: dict[str, set[Hashable]] = {}
+        _registry[name] = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.expires_at > self.clock()
+
+    def get(self, key: Hashable) -> object:
+        """Return the cached value for key, or MISSING if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return MISSING
+        if entry.expires_at <= self.clock():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    def set(self, key: Hashable, value: object, owner: str | None = None) -> None:
+        """Cache value under key, evicting the least recently used entries beyond max_size.
+
+        A None value is a negative result and lives for negative_ttl_seconds.
+        """
+        if key in self._entries:
+            self._remove(key)
+        ttl = self.negative_ttl_seconds if value is None else self.ttl_seconds
+        self._entries[key] = _Entry(value=value, expires_at=self.clock() + ttl, owner=owner)
+        if owner is not None:
+            self._by_owner.setdefault(owner, set()).add(key)
+        while len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop key if cached. Returns whether anything was removed."""
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        self.stats.invalidations += 1
+        return True
+
+    def invalidate_owner(self, owner: str) -> int:
+        """Drop every entry cached for owner. Returns the number removed."""
+        keys = self._by_owner.pop(owner, set())
+        for key in keys:
+            del self._entries[key]
+        self.stats.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self._entries.clear()
+        self._by_owner.clear()
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        if entry.owner is not None:
+            keys = self._by_owner[entry.owner]
+            keys.discard(key)
+            if not keys:
+                del self._by_owner[entry.owner]
+
+
+def get_cache(name: str) -> TTLCache | None:
+    """Return the cache registered under name, if any."""
+    return _registry.get(name)
+
+
+def clear_all() -> None:
+    """Drop every entry of every registered cache."""
+    for cache in _registry.values():
+        cache.clear()
+
+
+def cache_metrics() -> dict[str, dict[str, int]]:
+    """Counters and current size of every cache, keyed by cache name."""
+    return {
+        name: {**vars(cache.stats), "size": len(cache), "max_size": cache.max_size}
+        for name, cache in sorted(_registry.items())
+    }
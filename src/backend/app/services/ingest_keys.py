@@ -0,0 +1,123 @@
+"""Idempotency ledger for burn ingest session_ids (the burn_ingest_keys table).
+
+Every ingest path claims a request's session_id here, in the same transaction
+as the burn it records, with INSERT ... ON CONFLICT DO NOTHING RETURNING: a
+returned key is new and the burn is written, a missing one is a replay and is
+answered from the ledger. Keys only have to outlive plugin retries, so rows
+older than settings.burn_ingest_key_ttl_days are swept periodically.
+"""
+
+import asyncio
+import datetime
+import logging
+from collections.abc import Callable, Iterable
+
+from sqlalchemy import ColumnElement, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.engine import async_session_factory
+from app.models.build_activity import BuildActivity
+from app.models.burn_ingest_key import BurnIngestKey
+
+logger = logging.getLogger(__name__)
+
+# (burn_id, project_id, activity_date) reported back for a replayed session_id
+Replay = tuple[str, str | None, datetime.date]
+
+
+def resolved_burn_id(keys=BurnIngestKey.__table__) -> ColumnElement[str]:
+    """SQL expression for the id of the build_activities row a ledger key was counted in.
+
+    A project burn may have been added to a row that already existed for its
+    (project, day, source), so that row is looked up; rows without a project
+    never merge and keep the burn_id recorded in the ledger.
+    """
+    merged_into = (
+        select(BuildActivity.id)
+        .where(
+            BuildActivity.user_id == keys.c.user_id,
+            BuildActivity.project_id == keys.c.project_id,
+            BuildActivity.activity_date == keys.c.activity_date,
+            BuildActivity.source == keys.c.source,
+        )
+        .limit(1)
+        .scalar_subquery()
+    )
+    return func.coalesce(merged_into, keys.c.burn_id)
+
+
+async def claim_keys(session: AsyncSession, rows: list[dict]) -> set[str]:
+    """Insert ledger rows, returning the session_ids that were not already claimed.
+
+    Each dict carries BurnIngestKey column values for one user. Does NOT
+    commit — the claim must commit or roll back with the burn it guards.
+    """
+    return {session_id for _, session_id in await claim_user_keys(session, rows)}
+
+
+async def claim_user_keys(session: AsyncSession, rows: list[dict]) -> set[tuple[str, str]]:
+    """claim_keys for rows of any number of users; returns the claimed (user_id, session_id)."""
+    if not rows:
+        return set()
+    # A stable order keeps concurrent multi-row claims from deadlocking
+    rows = sorted(rows, key=lambda row: (row["user_id"], row["session_id"]))
+    stmt = (
+        insert(BurnIngestKey)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["user_id", "session_id"])
+        .returning(BurnIngestKey.user_id, BurnIngestKey.session_id)
+    )
+    result = await session.execute(stmt)
+    return {(row.user_id, row.session_id) for row in result.all()}
+
+
+async def get_replays(
+    session: AsyncSession, user_id: str, session_ids: Iterable[str]
+) -> dict[str, Replay]:
+    """Look up the recorded outcome of session_ids already in the ledger."""
+    stmt = select(
+        BurnIngestKey.session_id,
+        resolved_burn_id().label("burn_id"),
+        BurnIngestKey.project_id,
+        BurnIngestKey.activity_date,
+    ).where(
+        BurnIngestKey.user_id == user_id,
+        BurnIngestKey.session_id.in_(list(session_ids)),
+    )
+    result = await session.execute(stmt)
+    return {
+        row.session_id: (row.burn_id, row.project_id, row.activity_date)
+        for row in result.all()
+    }
+
+
+async def expire_keys(session: AsyncSession, before: datetime.datetime) -> int:
+    """Delete ledger rows created before `before` and commit. Returns the number removed."""
+    result = await session.execute(
+        delete(BurnIngestKey).where(BurnIngestKey.created_at < before)
+    )
+    await session.commit()
+    return result.rowcount
+
+
+def expiry_cutoff(ttl_days: int, now: datetime.datetime | None = None) -> datetime.datetime:
+    """Creation time before which keys are past the TTL."""
+    return (now or datetime.datetime.now(datetime.UTC)) - datetime.timedelta(days=ttl_days)
+
+
+async def run(
+    interval_seconds: float,
+    ttl_days: int,
+    session_factory: Callable[[], AsyncSession] = async_session_factory,
+) -> None:
+    """Sweep expired keys once every interval_seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with session_factory() as session:
+                expired = await expire_keys(session, expiry_cutoff(ttl_days))
+            if expired:
+                logger.info("Expired %d burn ingest keys", expired)
+        except Exception:
+            logger.exception("Burn ingest key sweep failed; will retry next interval")
@@ -0,0 +1,104 @@
+"""Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+
+The in-process caches in app.services.cache are per worker. publish() drops
+an entry locally and queues a NOTIFY on the caller's transaction, so every
+worker's listener (started by the lifespan hook in app.main) drops it too
+once the change it describes has committed. A listener that loses its
+connection clears all caches on reconnect, since it may have missed
+notifications in between.
+"""
+
+import asyncio
+import json
+import logging
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.cache import clear_all, get_cache
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "fyt_cache_invalidation"
+
+
+def apply(message: dict) -> None:
+    """Drop what an invalidation message names from the local cache.
+
+    A message is {"cache": name, "key": key} for a single entry or
+    {"cache": name, "owner": owner} for every entry cached for an owner.
+    Unknown caches are ignored.
+    """
+    cache = get_cache(message["cache"])
+    if cache is None:
+        return
+    if "key" in message:
+        cache.invalidate(message["key"])
+    if "owner" in message:
+        cache.invalidate_owner(message["owner"])
+
+
+async def publish(
+    session: AsyncSession,
+    cache: str,
+    *,
+    key: str | None = None,
+    owner: str | None = None,
+) -> None:
+    """Invalidate locally now and on every worker when the session commits.
+
+    Does NOT commit — the notification is delivered with the transaction it
+    belongs to and discarded if that rolls back.
+    """
+    message: dict = {"cache": cache}
+    if key is not None:
+        message["key"] = key
+    if owner is not None:
+        message["owner"] = owner
+    apply(message)
+    await session.execute(select(func.pg_notify(CHANNEL, json.dumps(message))))
+
+
+def _on_notify(_connection, _pid: int, _channel: str, payload: str) -> None:
+    try:
+        apply(json.loads(payload))
+    except (ValueError, KeyError, TypeError):
+        logger.warning("Ignoring malformed cache invalidation: %r", payload)
+
+
+def listen_dsn(database_url: str) -> str:
+    """Plain asyncpg DSN for a SQLAlchemy database URL."""
+    return make_url(database_url).set(drivername="postgresql").render_as_string(
+        hide_password=False
+    )
+
+
+async def run(dsn: str, retry_seconds: float = 5.0) -> None:
+    """Apply invalidations from other workers until cancelled, reconnecting on failure.
+
+    Uses a dedicated connection outside the engine's pool, since LISTEN holds
+    it for the life of the worker.
+    """
+    while True:
+        try:
+            connection = await asyncpg.connect(dsn)
+        except Exception:
+            logger.exception("Cache invalidation listener could not connect; retrying")
+            await asyncio.sleep(retry_seconds)
+            continue
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _connection, lost=lost: lost.set())
+        try:
+            await connection.add_listener(CHANNEL, _on_notify)
+            # Anything published while we were not listening was missed
+            clear_all()
+            await lost.wait()
+            logger.warning("Cache invalidation listener lost its connection; reconnecting")
+        except Exception:
+            logger.exception("Cache invalidation listener failed; reconnecting")
+        finally:
+            if not connection.is_closed():
+                await connection.close()
+        await asyncio.sleep(retry_seconds)
@@ -0,0 +1,104 @@
+"""bcrypt hashing and verification off the event loop.
+
+bcrypt is deliberately slow (hundreds of milliseconds at cost 12) and releases
+the GIL while it works, so it runs in a dedicated thread pool rather than on
+the event loop, where it would stall every other request on the worker. The
+pool's size caps how many hashes run at once; beyond that, up to max_queue
+calls wait, and further calls are refused with PasswordHasherBusy instead of
+piling up behind a login storm.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import bcrypt
+
+from app.config import settings
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue is full."""
+
+
+@dataclass
+class HasherStats:
+    """Counters for the hashing pool since start-up."""
+
+    completed: int = 0
+    # Calls that raised or were cancelled before finishing
+    failed: int = 0
+    rejected: int = 0
+    # Calls submitted and not yet finished (running or queued)
+    in_flight: int = 0
+    max_queue_depth: int = 0
+
+
+def _rounds(password_hash: str) -> int | None:
+    """Cost factor of a modular-crypt bcrypt hash ($2b$12$...), if parseable."""
+    parts = password_hash.split("$")
+    return int(parts[2]) if len(parts) > 3 and parts[2].isdigit() else None
+
+
+class PasswordHasher:
+    """Runs bcrypt in a bounded thread pool."""
+
+    def __init__(self, rounds: int, max_workers: int, max_queue: int):
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.stats = HasherStats()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="bcrypt"
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting for a free thread."""
+        return max(0, self.stats.in_flight - self.max_workers)
+
+    async def hash(self, password: str) -> str:
+        """Hash password at the configured cost."""
+        hashed = await self._run(
+            lambda: bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=self.rounds))
+        )
+        return hashed.decode()
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """Check password against a stored hash (at whatever cost it was made with)."""
+        return await self._run(lambda: bcrypt.checkpw(password.encode(), password_hash.encode()))
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Whether a stored hash was made at a lower cost than configured.
+
+        Hashes made at a higher cost are kept, so lowering the configured
+        cost never weakens stored hashes.
+        """
+        return (_rounds(password_hash) or 0) < self.rounds
+
+    def shutdown(self) -> None:
+        """Stop the pool's threads once running calls finish."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, fn):
+        if self.queue_depth >= self.max_queue:
+            self.stats.rejected += 1
+            raise PasswordHasherBusy("Too many password checks in progress")
+        self.stats.in_flight += 1
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.queue_depth)
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, fn)
+        except BaseException:
+            self.stats.failed += 1
+            raise
+        finally:
+            self.stats.in_flight -= 1
+        self.stats.completed += 1
+        return result
+
+
+password_hasher = PasswordHasher(
+    rounds=settings.password_hash_rounds,
+    max_workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_max_queue,
+)
@@ -1,12 +1,13 @@
 """Project resolution service — maps git remote URL hints to FYT project IDs."""
 
 import re
-import time
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.project import Project
+from app.services import invalidation
+from app.services.cache import MISSING, TTLCache
 
 # HTTPS: https://github.com/owner/repo or https://github.com/owner/repo.git
 _HTTPS_RE = re.compile(
@@ -22,9 +23,17 @@ _SSH_RE = re.compile(
 _BARE_RE = re.compile(r"^(?P<slug>[A-Za-z0-9_.\-]+/[A-Za-z0-9_.\-]+)$")
 
 _CACHE_TTL_SECONDS = 600
-
-# (user_id, project_hint) -> (project_id | None, timestamp)
-_resolution_cache: dict[tuple[str, str], tuple[str | None, float]] = {}
+# Unmatched hints are retried sooner, so a newly linked repo is picked up quickly
+_NEGATIVE_CACHE_TTL_SECONDS = 60
+_CACHE_MAX_SIZE = 50_000
+
+# (user_id, project_hint) -> project_id | None, indexed by user_id
+_resolution_cache = TTLCache(
+    "project_resolution",
+    max_size=_CACHE_MAX_SIZE,
+    ttl_seconds=_CACHE_TTL_SECONDS,
+    negative_ttl_seconds=_NEGATIVE_CACHE_TTL_SECONDS,
+)
 
 
 def _normalize_hint(hint: str) -> str:
@@ -47,7 +56,7 @@ async def resolve_project(
     """Map a git remote URL hint to a FYT project ID.
 
     Algorithm:
-      1. Check in-memory cache (600s TTL).
+      1. Check in-memory cache (600s TTL, 60s for no-match).
       2. Parse hint to normalized 'owner/repo' form.
       3. Exact match on github_repo_full_name for this user.
       4. Partial match on repo-name portion via ILIKE.
@@ -57,11 +66,8 @@ async def resolve_project(
     """
     cache_key = (user_id, project_hint)
     cached = _resolution_cache.get(cache_key)
-    if cached is not None:
-        value, ts = cached
-        if time.monotonic() - ts < _CACHE_TTL_SECONDS:
-            return value
-        del _resolution_cache[cache_key]
+    if cached is not MISSING:
+        return cached
 
     normalized = _normalize_hint(project_hint)
 
@@ -88,15 +94,78 @@ async def resolve_project(
         project_id = result.scalar_one_or_none()
 
     project_id_str: str | None = str(project_id) if project_id is not None else None
-    _resolution_cache[cache_key] = (project_id_str, time.monotonic())
+    _resolution_cache.set(cache_key, project_id_str, owner=user_id)
     return project_id_str
 
 
+async def resolve_projects(
+    session: AsyncSession,
+    user_id: str,
+    project_hints: list[str],
+) -> dict[str, str | None]:
+    """Map many git remote URL hints to FYT project IDs in one round trip.
+
+    Hints already in the cache are served from it. All remaining hints are
+    matched against a single fetch of the user's GitHub-linked projects, using
+    the same exact-then-partial rules as resolve_project(). Results are cached.
+
+    Returns a dict keyed by the original hint. Never raises on no-match.
+    """
+    resolved: dict[str, str | None] = {}
+    misses: list[str] = []
+    for hint in dict.fromkeys(project_hints):
+        cached = _resolution_cache.get((user_id, hint))
+        if cached is not MISSING:
+            resolved[hint] = cached
+        else:
+            misses.append(hint)
+
+    if not misses:
+        return resolved
+
+    stmt = (
+        select(Project.id, Project.github_repo_full_name)
+        .where(Project.owner_id == user_id)
+        .where(Project.github_repo_full_name.is_not(None))
+        .order_by(Project.id)
+    )
+    candidates = (await session.execute(stmt)).all()
+
+    for hint in misses:
+        normalized = _normalize_hint(hint)
+        project_id = next(
+            (row.id for row in candidates if row.github_repo_full_name == normalized),
+            None,
+        )
+        if project_id is None:
+            repo_name = normalized.rsplit("/", 1)[-1] if "/" in normalized else normalized
+            suffix = f"/{repo_name}".lower()
+            project_id = next(
+                (
+                    row.id
+                    for row in candidates
+                    if row.github_repo_full_name.lower().endswith(suffix)
+                ),
+                None,
+            )
+        project_id_str = str(project_id) if project_id is not None else None
+        _resolution_cache.set((user_id, hint), project_id_str, owner=user_id)
+        resolved[hint] = project_id_str
+
+    return resolved
+
+
 def invalidate_project_cache(user_id: str) -> None:
-    """Remove all cached resolutions for a user.
+    """Remove all cached resolutions for a user from this process.
+
+    Use publish_project_invalidation to reach every worker.
+    """
+    _resolution_cache.invalidate_owner(user_id)
+
+
+async def publish_project_invalidation(session: AsyncSession, user_id: str) -> None:
+    """Drop a user's cached resolutions on every worker once session commits.
 
-    Call when projects are created or updated.
+    Call when a project's GitHub repo changes or a project is deleted.
     """
-    keys_to_remove = [key for key in _resolution_cache if key[0] == user_id]
-    for key in keys_to_remove:
-        del _resolution_cache[key]
+    await invalidation.publish(session, _resolution_cache.name, owner=user_id)
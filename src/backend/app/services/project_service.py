@@ -15,6 +15,7 @@ from app.models.enums import MilestoneType as MilestoneTypeEnum
 from app.models.project import Project, project_collaborators
 from app.models.project_milestone import ProjectMilestone
 from app.models.user import User
+from app.services.project_resolution import publish_project_invalidation
 
 _VALID_LINK_KEYS = frozenset({"repo", "live_url", "product_hunt", "app_store", "play_store"})
 _VALID_METRIC_KEYS = frozenset({"users", "stars", "downloads", "revenue", "forks"})
@@ -184,24 +185,10 @@ async def delete(session: AsyncSession, project_id: str, user_id: str) -> None:
         raise PermissionError("Only the project owner can delete this project")
 
     await session.delete(project)
+    await publish_project_invalidation(session, project.owner_id)
     await session.commit()
 
 
-async def get_with_details(session: AsyncSession, project_id: str) -> Project | None:
-    """Fetch a project by ID with owner and collaborators eagerly loaded."""
-    stmt = (
-        select(Project)
-        .where(Project.id == project_id)
-        .options(
-            selectinload(Project.owner),
-            selectinload(Project.collaborators),
-            selectinload(Project.milestones),
-        )
-    )
-    result = await session.execute(stmt)
-    return result.scalar_one_or_none()
-
-
 async def invite_collaborator(
     session: AsyncSession,
     project_id: str,
@@ -433,6 +420,7 @@ async def set_github_metadata(
         raise ValueError("Project not found")
     project.github_repo_full_name = repo_full_name
     project.github_stars = stars
+    await publish_project_invalidation(session, project.owner_id)
     await session.commit()
 
 
@@ -0,0 +1,68 @@
+"""In-process token-bucket rate limiting for the burn ingest API.
+
+Each key (an API token hash, a user id) gets a bucket holding up to `burst`
+tokens that refills at `rate_per_minute`. A request takes one token; an empty
+bucket means the caller must wait. Buckets live in an LRU-ordered dict capped
+at `max_keys` — evicting a bucket only forgets its debt, so the cap bounds
+memory without ever throttling anyone who should not be.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+MAX_TRACKED_KEYS = 10_000
+
+
+class TokenBucketLimiter:
+    """Token buckets keyed by an arbitrary string, with LRU eviction."""
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        burst: int,
+        max_keys: int = MAX_TRACKED_KEYS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate_per_second = rate_per_minute / 60
+        self.burst = burst
+        self._max_keys = max_keys
+        self._clock = clock
+        # key -> (tokens available, last refill time)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    @property
+    def enabled(self) -> bool:
+        """A limiter with a non-positive rate lets everything through."""
+        return self.rate_per_second > 0
+
+    def acquire(self, key: str) -> float:
+        """Take a token from key's bucket.
+
+        Returns 0 when the request may proceed, otherwise the number of
+        seconds until a token will be available (nothing is taken).
+        """
+        if not self.enabled:
+            return 0.0
+
+        now = self._clock()
+        tokens, updated_at = self._buckets.pop(key, (float(self.burst), now))
+        tokens = min(float(self.burst), tokens + (now - updated_at) * self.rate_per_second)
+
+        if tokens >= 1:
+            tokens -= 1
+            retry_after = 0.0
+        else:
+            retry_after = (1 - tokens) / self.rate_per_second
+
+        self._buckets[key] = (tokens, now)
+        while len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+    def clear(self) -> None:
+        """Forget every bucket."""
+        self._buckets.clear()
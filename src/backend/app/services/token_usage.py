@@ -0,0 +1,100 @@
+"""Write-behind recording of ApiToken.last_used_at.
+
+Authenticating a request only notes the time in memory, keyed by token hash;
+a background task flushes the latest time per token every
+settings.api_token_usage_flush_seconds as batched
+UPDATE ... FROM (VALUES ...) statements, so the auth path never writes. The
+lifespan hook in app.main flushes once more on shutdown.
+"""
+
+import asyncio
+import datetime
+import logging
+from collections.abc import Callable
+
+from sqlalchemy import DateTime, String, column, or_, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.engine import async_session_factory
+from app.models.api_token import ApiToken
+
+logger = logging.getLogger(__name__)
+
+FLUSH_CHUNK_SIZE = 500
+
+
+class TokenUsageRecorder:
+    """In-process map of token_hash -> most recent use, drained by flush()."""
+
+    def __init__(self) -> None:
+        self._pending: dict[str, datetime.datetime] = {}
+        self._flush_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record(self, token_hash: str, used_at: datetime.datetime | None = None) -> None:
+        """Note that the token was used at used_at (default: now)."""
+        used_at = used_at or datetime.datetime.now(datetime.UTC)
+        previous = self._pending.get(token_hash)
+        if previous is None or used_at > previous:
+            self._pending[token_hash] = used_at
+
+    def clear(self) -> None:
+        """Drop all recorded uses without persisting them."""
+        self._pending.clear()
+
+    async def flush(
+        self,
+        session_factory: Callable[[], AsyncSession] = async_session_factory,
+    ) -> int:
+        """Persist recorded uses. Returns the number of tokens flushed.
+
+        last_used_at only ever moves forward. On failure the uses are merged
+        back so the next flush retries them, and the exception propagates.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            in_flight, self._pending = self._pending, {}
+            rows = sorted(in_flight.items())
+            try:
+                async with session_factory() as session:
+                    for start in range(0, len(rows), FLUSH_CHUNK_SIZE):
+                        await session.execute(
+                            _last_used_update(rows[start : start + FLUSH_CHUNK_SIZE])
+                        )
+                    await session.commit()
+            except Exception:
+                for token_hash, used_at in in_flight.items():
+                    self.record(token_hash, used_at)
+                raise
+            return len(rows)
+
+    async def run(self, interval_seconds: float) -> None:
+        """Flush every interval_seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("API token usage flush failed; uses kept for retry")
+
+
+def _last_used_update(rows: list[tuple[str, datetime.datetime]]):
+    """UPDATE api_tokens SET last_used_at FROM a VALUES list of (token_hash, used_at)."""
+    used = values(
+        column("token_hash", String),
+        column("used_at", DateTime(timezone=True)),
+        name="used",
+    ).data(rows)
+    return (
+        update(ApiToken)
+        .where(ApiToken.token_hash == used.c.token_hash)
+        .where(or_(ApiToken.last_used_at.is_(None), ApiToken.last_used_at < used.c.used_at))
+        .values(last_used_at=used.c.used_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+token_usage = TokenUsageRecorder()
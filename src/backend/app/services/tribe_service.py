@@ -4,7 +4,6 @@ from datetime import UTC, datetime
 
 from sqlalchemy import and_, distinct, func, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from ulid import ULID
 
 from app.models.enums import MemberRole, MemberStatus, TribeStatus
@@ -88,56 +87,6 @@ async def update(
     return tribe
 
 
-async def attach_membership_data(
-    session: AsyncSession, tribes: list[Tribe],
-) -> None:
-    """Load association table rows and attach as _membership_data on each tribe.
-
-    This gives from_model() access to the real role, status, joined_at,
-    and requested_role_id instead of hardcoded values.
-    """
-    if not tribes:
-        return
-    tribe_ids = [t.id for t in tribes]
-    result = await session.execute(
-        select(
-            tribe_members.c.tribe_id,
-            tribe_members.c.user_id,
-            tribe_members.c.role,
-            tribe_members.c.status,
-            tribe_members.c.joined_at,
-            tribe_members.c.requested_role_id,
-        ).where(tribe_members.c.tribe_id.in_(tribe_ids))
-    )
-    rows = result.fetchall()
-
-    # Build per-tribe lookup: { tribe_id: { user_id: row } }
-    lookup: dict[str, dict[str, object]] = {}
-    for row in rows:
-        lookup.setdefault(row.tribe_id, {})[row.user_id] = row
-
-    for tribe in tribes:
-        tribe._membership_data = lookup.get(tribe.id, {})  # type: ignore[attr-defined]
-
-
-async def get_with_details(session: AsyncSession, tribe_id: str) -> Tribe | None:
-    """Fetch a tribe with owner, members, and open roles."""
-    stmt = (
-        select(Tribe)
-        .where(Tribe.id == tribe_id)
-        .options(
-            selectinload(Tribe.owner),
-            selectinload(Tribe.members),
-            selectinload(Tribe.open_roles),
-        )
-    )
-    result = await session.execute(stmt)
-    tribe = result.scalar_one_or_none()
-    if tribe is not None:
-        await attach_membership_data(session, [tribe])
-    return tribe
-
-
 async def add_open_role(
     session: AsyncSession,
     tribe_id: str,
@@ -414,7 +363,8 @@ async def search(
     on open role titles, skills_needed JSONB, and user timezones.
 
     Returns:
-        Tuple of (matching tribes with eager-loaded relationships, total count).
+        Tuple of (matching tribes, total count). Owner, members and open roles
+        are left for the GraphQL types to load if selected.
     """
     q = query.strip()
     if not q:
@@ -492,16 +442,7 @@ async def search(
     if not tribe_ids:
         return [], total
 
-    # Load full tribe objects with eager-loaded relationships
-    tribes_stmt = (
-        select(Tribe)
-        .where(Tribe.id.in_(tribe_ids))
-        .options(
-            selectinload(Tribe.owner),
-            selectinload(Tribe.members),
-            selectinload(Tribe.open_roles),
-        )
-    )
+    tribes_stmt = select(Tribe).where(Tribe.id.in_(tribe_ids))
     tribes_result = await session.execute(tribes_stmt)
     tribes = list(tribes_result.scalars().all())
 
@@ -509,6 +450,4 @@ async def search(
     order_map = {tid: idx for idx, tid in enumerate(tribe_ids)}
     tribes.sort(key=lambda t: order_map.get(t.id, 0))
 
-    await attach_membership_data(session, tribes)
-
     return tribes, total
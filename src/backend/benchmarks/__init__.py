@@ -0,0 +1 @@
+"""Load benchmarks for the Find Your Tribe backend."""
@@ -0,0 +1,435 @@
+"""Load benchmark for the burn ingest endpoints.
+
+Drives POST /api/burn/ingest and GET /api/burn/verify-token in-process through
+httpx.ASGITransport against a real Postgres (the docker-compose database by
+default), so changes to burn_ingest.py or project_resolution.py can be compared
+run against run.
+
+Usage:
+    python -m benchmarks.burn_ingest [--requests N] [--concurrency N] [--users N]
+                                     [--repeat-ratio F] [--matched-hint-ratio F]
+                                     [--unmatched-hint-ratio F] [--verify-ratio F]
+                                     [--mode single_statement|sequential|buffered]
+                                     [--rate-limit]
+                                     [--seed N] [--database-url URL] [--json]
+
+Each run creates its own users, API tokens and GitHub-linked projects, and
+deletes them (with everything they ingested) when it finishes. The API rate
+limiters are bypassed unless --rate-limit is given. Reports
+throughput, p50/p95/p99 latency, SQL statements per request and connection
+pool wait time, overall and per endpoint.
+"""
+
+import argparse
+import asyncio
+import contextvars
+import hashlib
+import json
+import random
+import secrets
+import statistics
+import time
+from collections.abc import AsyncGenerator
+from dataclasses import asdict, dataclass, field
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+import app.models  # noqa: F401
+from app.api import auth_token
+from app.config import settings
+from app.db.engine import MAX_OVERFLOW, POOL_SIZE, get_session
+from app.main import app
+from app.models.api_token import ApiToken
+from app.models.project import Project
+from app.models.user import User
+from app.services.burn_buffer import burn_buffer
+from app.services.rate_limit import TokenBucketLimiter
+
+PROJECTS_PER_USER = 3
+SESSION_ID_WINDOW = 50
+
+
+@dataclass
+class RequestStats:
+    """Database work attributed to one request."""
+
+    statements: int = 0
+    pool_wait_seconds: float = 0.0
+
+
+_current_stats: contextvars.ContextVar[RequestStats | None] = contextvars.ContextVar(
+    "benchmark_request_stats", default=None
+)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that charges connection checkout time to the current request."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            stats = _current_stats.get()
+            if stats is not None:
+                stats.pool_wait_seconds += time.perf_counter() - start
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.statements += 1
+
+
+@dataclass
+class BenchmarkConfig:
+    requests: int = 2000
+    concurrency: int = 16
+    users: int = 20
+    repeat_ratio: float = 0.1
+    matched_hint_ratio: float = 0.5
+    unmatched_hint_ratio: float = 0.2
+    verify_ratio: float = 0.05
+    mode: str = "single_statement"
+    rate_limit: bool = False
+    seed: int = 0
+
+
+@dataclass
+class PlannedRequest:
+    """One request of the workload: an ingest body, or None for verify-token."""
+
+    user_index: int
+    body: dict | None
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    status: int
+    latency_seconds: float
+    statements: int
+    pool_wait_seconds: float
+
+
+@dataclass
+class EndpointReport:
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    statements_per_request: float
+    pool_wait_ms_per_request: float
+    pool_wait_p99_ms: float
+
+
+@dataclass
+class BenchmarkReport:
+    config: BenchmarkConfig
+    elapsed_seconds: float
+    throughput_rps: float
+    overall: EndpointReport
+    endpoints: dict[str, EndpointReport] = field(default_factory=dict)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of values (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def plan_workload(config: BenchmarkConfig, repos: list[list[str]]) -> list[PlannedRequest]:
+    """Build the request sequence for a run, deterministic for a given seed.
+
+    repos[i] holds the github_repo_full_name values of user i's projects.
+    A repeat_ratio share of ingests reuse one of the user's recent session_ids;
+    project hints are a matched_hint_ratio / unmatched_hint_ratio mix of
+    URLs for the user's own repos and repos that resolve to nothing.
+    """
+    rng = random.Random(config.seed)
+    recent_sessions: list[list[str]] = [[] for _ in repos]
+    planned: list[PlannedRequest] = []
+
+    for index in range(config.requests):
+        user_index = rng.randrange(len(repos))
+        if rng.random() < config.verify_ratio:
+            planned.append(PlannedRequest(user_index=user_index, body=None))
+            continue
+
+        sessions = recent_sessions[user_index]
+        if sessions and rng.random() < config.repeat_ratio:
+            session_id = rng.choice(sessions)
+        else:
+            session_id = f"bench_{config.seed}_{index}"
+            sessions.append(session_id)
+            del sessions[:-SESSION_ID_WINDOW]
+
+        body = {
+            "tokens_burned": rng.randint(100, 50_000),
+            "source": rng.choice(["anthropic", "openai", "google"]),
+            "verification": "extension_tracked",
+            "tool": rng.choice(["claude_code", "codex", None]),
+            "session_id": session_id,
+        }
+        roll = rng.random()
+        if roll < config.matched_hint_ratio:
+            repo = rng.choice(repos[user_index])
+            body["project_hint"] = rng.choice([
+                f"https://github.com/{repo}.git",
+                f"git@github.com:{repo}.git",
+                repo,
+            ])
+        elif roll < config.matched_hint_ratio + config.unmatched_hint_ratio:
+            body["project_hint"] = f"https://github.com/elsewhere/unknown-{rng.randrange(1000)}"
+        planned.append(PlannedRequest(user_index=user_index, body=body))
+
+    return planned
+
+
+def summarize(samples: list[Sample]) -> EndpointReport:
+    latencies = [s.latency_seconds * 1000 for s in samples]
+    waits = [s.pool_wait_seconds * 1000 for s in samples]
+    return EndpointReport(
+        requests=len(samples),
+        errors=sum(1 for s in samples if s.status >= 400),
+        p50_ms=percentile(latencies, 50),
+        p95_ms=percentile(latencies, 95),
+        p99_ms=percentile(latencies, 99),
+        statements_per_request=statistics.fmean(s.statements for s in samples) if samples else 0.0,
+        pool_wait_ms_per_request=statistics.fmean(waits) if waits else 0.0,
+        pool_wait_p99_ms=percentile(waits, 99),
+    )
+
+
+async def _create_fixtures(
+    session_factory: async_sessionmaker[AsyncSession], config: BenchmarkConfig, run_id: str
+) -> tuple[list[str], list[str], list[list[str]]]:
+    """Create benchmark users, API tokens and projects.
+
+    Returns (user_ids, raw_tokens, repos) indexed by user.
+    """
+    user_ids: list[str] = []
+    raw_tokens: list[str] = []
+    repos: list[list[str]] = []
+    async with session_factory() as session:
+        for index in range(config.users):
+            user = User(
+                username=f"bench_{run_id}_{index}",
+                display_name=f"Bench {index}",
+                email=f"bench_{run_id}_{index}@example.com",
+            )
+            session.add(user)
+            await session.flush()
+
+            raw_token = f"fyt_{secrets.token_hex(32)}"
+            session.add(ApiToken(
+                user_id=user.id,
+                token_hash=hashlib.sha256(raw_token.encode()).hexdigest(),
+                name="Benchmark",
+            ))
+            user_repos = [f"bench-{run_id}-{index}/repo-{n}" for n in range(PROJECTS_PER_USER)]
+            session.add_all(
+                Project(owner_id=user.id, title=repo, github_repo_full_name=repo)
+                for repo in user_repos
+            )
+
+            user_ids.append(user.id)
+            raw_tokens.append(raw_token)
+            repos.append(user_repos)
+        await session.commit()
+    return user_ids, raw_tokens, repos
+
+
+async def _delete_fixtures(
+    session_factory: async_sessionmaker[AsyncSession], user_ids: list[str]
+) -> None:
+    """Delete benchmark users; tokens, projects and burn rows cascade."""
+    async with session_factory() as session:
+        await session.execute(delete(User).where(User.id.in_(user_ids)))
+        await session.commit()
+
+
+async def run_benchmark(config: BenchmarkConfig, database_url: str) -> BenchmarkReport:
+    """Run one benchmark and return its report."""
+    engine = create_async_engine(
+        database_url,
+        poolclass=TimedQueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_pre_ping=True,
+    )
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_statement)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
+        async with session_factory() as session:
+            yield session
+
+    run_id = secrets.token_hex(4)
+    previous_mode = settings.burn_ingest_mode
+    previous_limiters = auth_token.token_rate_limiter, auth_token.user_rate_limiter
+    settings.burn_ingest_mode = config.mode
+    if not config.rate_limit:
+        auth_token.token_rate_limiter = TokenBucketLimiter(rate_per_minute=0, burst=0)
+        auth_token.user_rate_limiter = TokenBucketLimiter(rate_per_minute=0, burst=0)
+    app.dependency_overrides[get_session] = override_get_session
+    user_ids: list[str] = []
+    flush_task = None
+    try:
+        user_ids, raw_tokens, repos = await _create_fixtures(session_factory, config, run_id)
+        planned = plan_workload(config, repos)
+        queue: asyncio.Queue[PlannedRequest] = asyncio.Queue()
+        for request in planned:
+            queue.put_nowait(request)
+        samples: list[Sample] = []
+
+        if config.mode == "buffered":
+
+            async def flush_periodically() -> None:
+                while True:
+                    await asyncio.sleep(settings.burn_buffer_flush_seconds)
+                    await burn_buffer.flush(session_factory)
+
+            flush_task = asyncio.create_task(flush_periodically())
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+
+            async def worker() -> None:
+                while not queue.empty():
+                    request = queue.get_nowait()
+                    headers = {"Authorization": f"Bearer {raw_tokens[request.user_index]}"}
+                    stats = RequestStats()
+                    stats_token = _current_stats.set(stats)
+                    start = time.perf_counter()
+                    try:
+                        if request.body is None:
+                            endpoint = "verify_token"
+                            resp = await client.get("/api/burn/verify-token", headers=headers)
+                        else:
+                            endpoint = "ingest_burn"
+                            resp = await client.post(
+                                "/api/burn/ingest", headers=headers, json=request.body
+                            )
+                    finally:
+                        _current_stats.reset(stats_token)
+                    samples.append(Sample(
+                        endpoint=endpoint,
+                        status=resp.status_code,
+                        latency_seconds=time.perf_counter() - start,
+                        statements=stats.statements,
+                        pool_wait_seconds=stats.pool_wait_seconds,
+                    ))
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(config.concurrency)))
+            elapsed = time.perf_counter() - started
+    finally:
+        if flush_task is not None:
+            flush_task.cancel()
+            try:
+                await flush_task
+            except asyncio.CancelledError:
+                pass
+            await burn_buffer.flush(session_factory)
+        if user_ids:
+            await _delete_fixtures(session_factory, user_ids)
+        app.dependency_overrides.pop(get_session, None)
+        settings.burn_ingest_mode = previous_mode
+        auth_token.token_rate_limiter, auth_token.user_rate_limiter = previous_limiters
+        await engine.dispose()
+
+    by_endpoint: dict[str, list[Sample]] = {}
+    for sample in samples:
+        by_endpoint.setdefault(sample.endpoint, []).append(sample)
+    return BenchmarkReport(
+        config=config,
+        elapsed_seconds=elapsed,
+        throughput_rps=len(samples) / elapsed if elapsed else 0.0,
+        overall=summarize(samples),
+        endpoints={name: summarize(group) for name, group in sorted(by_endpoint.items())},
+    )
+
+
+def format_report(report: BenchmarkReport) -> str:
+    """Render a report as a plain-text table."""
+    config = report.config
+    lines = [
+        f"mode={config.mode} requests={config.requests} concurrency={config.concurrency} "
+        f"users={config.users} repeat={config.repeat_ratio} "
+        f"hints={config.matched_hint_ratio}/{config.unmatched_hint_ratio} "
+        f"verify={config.verify_ratio} rate_limit={config.rate_limit} seed={config.seed}",
+        f"elapsed {report.elapsed_seconds:.2f}s  throughput {report.throughput_rps:.1f} req/s",
+        "",
+        f"{'endpoint':<14}{'reqs':>7}{'errs':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        f"{'stmts/req':>11}{'pool wait ms':>14}{'wait p99':>10}",
+    ]
+    for name, endpoint in [*report.endpoints.items(), ("all", report.overall)]:
+        lines.append(
+            f"{name:<14}{endpoint.requests:>7}{endpoint.errors:>6}"
+            f"{endpoint.p50_ms:>9.2f}{endpoint.p95_ms:>9.2f}{endpoint.p99_ms:>9.2f}"
+            f"{endpoint.statements_per_request:>11.2f}"
+            f"{endpoint.pool_wait_ms_per_request:>14.3f}{endpoint.pool_wait_p99_ms:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    defaults = BenchmarkConfig()
+    parser = argparse.ArgumentParser(description="Load benchmark for the burn ingest endpoints.")
+    parser.add_argument("--requests", type=int, default=defaults.requests,
+                        help=f"Total requests to send (default: {defaults.requests})")
+    parser.add_argument("--concurrency", type=int, default=defaults.concurrency,
+                        help=f"Concurrent in-flight requests (default: {defaults.concurrency})")
+    parser.add_argument("--users", type=int, default=defaults.users,
+                        help=f"Distinct users/API tokens (default: {defaults.users})")
+    parser.add_argument("--repeat-ratio", type=float, default=defaults.repeat_ratio,
+                        help="Share of ingests replaying a recent session_id "
+                             f"(default: {defaults.repeat_ratio})")
+    parser.add_argument("--matched-hint-ratio", type=float, default=defaults.matched_hint_ratio,
+                        help="Share of ingests with a project_hint for one of the user's repos "
+                             f"(default: {defaults.matched_hint_ratio})")
+    parser.add_argument("--unmatched-hint-ratio", type=float,
+                        default=defaults.unmatched_hint_ratio,
+                        help="Share of ingests with a project_hint that matches nothing "
+                             f"(default: {defaults.unmatched_hint_ratio})")
+    parser.add_argument("--verify-ratio", type=float, default=defaults.verify_ratio,
+                        help=f"Share of requests that are verify-token "
+                             f"(default: {defaults.verify_ratio})")
+    parser.add_argument("--mode", choices=["single_statement", "sequential", "buffered"],
+                        default=settings.burn_ingest_mode,
+                        help="Ingest write path (default: BURN_INGEST_MODE)")
+    parser.add_argument("--rate-limit", action="store_true",
+                        help="Keep the per-token/per-user API rate limits in force")
+    parser.add_argument("--seed", type=int, default=defaults.seed,
+                        help=f"Workload random seed (default: {defaults.seed})")
+    parser.add_argument("--database-url", default=settings.database_url,
+                        help="Database to run against (default: DATABASE_URL)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    config = BenchmarkConfig(
+        requests=args.requests,
+        concurrency=args.concurrency,
+        users=args.users,
+        repeat_ratio=args.repeat_ratio,
+        matched_hint_ratio=args.matched_hint_ratio,
+        unmatched_hint_ratio=args.unmatched_hint_ratio,
+        verify_ratio=args.verify_ratio,
+        mode=args.mode,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+    )
+    report = asyncio.run(run_benchmark(config, args.database_url))
+    print(json.dumps(asdict(report), indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
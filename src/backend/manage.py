@@ -4,6 +4,17 @@ Usage:
     python manage.py init-db      Create all tables (idempotent)
     python manage.py seed          Seed the database with sample data
     python manage.py reset-db      Drop all tables and recreate (with confirmation)
+    python manage.py rebuild-burn-rollup
+                                   Recompute the daily/weekly burn rollups from build_activities
+    python manage.py maintain-burn-partitions [--months-ahead N] [--retain-months N]
+                                   [--archive-schema NAME | --drop]
+                                   Create upcoming build_activities partitions and
+                                   detach (or archive/drop) ones past retention
+    python manage.py compact-burn-history [--horizon-days N]
+                                   Fold build_activities rows past the horizon into
+                                   weekly build_activity_periods rows
+    python manage.py expire-ingest-keys [--ttl-days N]
+                                   Delete burn ingest idempotency keys older than the TTL
 """
 
 import argparse
@@ -11,6 +22,7 @@ import asyncio
 import sys
 
 import app.models  # noqa: F401
+from app.config import settings
 from app.db.base import Base
 from app.db.engine import async_session_factory, engine
 
@@ -65,9 +77,66 @@ async def seed() -> None:
         activity_count = await seed_build_activities(session, users_dict, projects_dict)
         print(f"  -> {activity_count} build activity rows created.")
 
+    await rebuild_burn_rollup()
+
     print("Seeding complete.")
 
 
+async def rebuild_burn_rollup() -> None:
+    """Recompute the daily and weekly burn rollups from scratch out of build_activities."""
+    from app.services.burn_service import rebuild_burn_rollups
+
+    async with async_session_factory() as session:
+        row_count = await rebuild_burn_rollups(session)
+    print(f"Burn rollup rebuilt: {row_count} user-day rows.")
+
+
+async def maintain_burn_partitions(
+    months_ahead: int,
+    retain_months: int | None,
+    archive_schema: str | None,
+    drop: bool,
+) -> None:
+    """Create future build_activities partitions and detach those older than the retention window."""
+    import datetime
+
+    from app.services import burn_partitions
+
+    async with async_session_factory() as session:
+        created = await burn_partitions.create_partitions(session, months_ahead)
+        print(f"Partitions created: {', '.join(created) or 'none'}")
+
+        if retain_months is not None:
+            before = burn_partitions.add_months(
+                burn_partitions.month_start(datetime.date.today()), -retain_months
+            )
+            detached = await burn_partitions.detach_partitions(
+                session, before, archive_schema=archive_schema, drop=drop
+            )
+            action = "dropped" if drop else f"moved to {archive_schema}" if archive_schema else "detached"
+            print(f"Partitions {action}: {', '.join(detached) or 'none'}")
+
+
+async def compact_burn_history(horizon_days: int) -> None:
+    """Compact build_activities rows older than the horizon into weekly rows."""
+    from app.services import burn_compaction
+
+    before = burn_compaction.compaction_cutoff(horizon_days)
+    async with async_session_factory() as session:
+        compacted = await burn_compaction.compact_burn_history(session, before)
+    print(f"Burn history compacted: {compacted} daily rows before {before} folded by week.")
+
+
+async def expire_ingest_keys(ttl_days: int) -> None:
+    """Delete burn_ingest_keys rows older than the TTL."""
+    from app.services import ingest_keys
+
+    before = ingest_keys.expiry_cutoff(ttl_days)
+    async with async_session_factory() as session:
+        expired = await ingest_keys.expire_keys(session, before)
+    print(f"Burn ingest keys expired: {expired} created before {before:%Y-%m-%d %H:%M}.")
+
+
 async def reset_db() -> None:
     """Drop all tables and recreate them."""
     async with engine.begin() as conn:
@@ -86,6 +155,50 @@ def main() -> None:
     subparsers.add_parser("init-db", help="Create all tables (idempotent)")
     subparsers.add_parser("seed", help="Seed the database with sample data")
     subparsers.add_parser("reset-db", help="Drop all tables and recreate them")
+    subparsers.add_parser(
+        "rebuild-burn-rollup",
+        help="Recompute the daily and weekly burn rollups from build_activities",
+    )
+
+    partitions_parser = subparsers.add_parser(
+        "maintain-burn-partitions",
+        help="Create upcoming build_activities partitions and detach old ones",
+    )
+    partitions_parser.add_argument(
+        "--months-ahead", type=int, default=3,
+        help="Create partitions through this many months past the current one (default: 3)",
+    )
+    partitions_parser.add_argument(
+        "--retain-months", type=int, default=None,
+        help="Detach partitions for months older than this many months ago (default: keep all)",
+    )
+    retention = partitions_parser.add_mutually_exclusive_group()
+    retention.add_argument(
+        "--archive-schema", default=None,
+        help="Move detached partitions into this schema instead of leaving them in public",
+    )
+    retention.add_argument(
+        "--drop", action="store_true",
+        help="Drop detached partitions (their totals remain in the burn rollups)",
+    )
+
+    compaction_parser = subparsers.add_parser(
+        "compact-burn-history",
+        help="Fold build_activities rows past the horizon into weekly rows",
+    )
+    compaction_parser.add_argument(
+        "--horizon-days", type=int, default=settings.burn_compaction_horizon_days,
+        help="Keep daily rows for this many days (default: BURN_COMPACTION_HORIZON_DAYS)",
+    )
+
+    keys_parser = subparsers.add_parser(
+        "expire-ingest-keys",
+        help="Delete burn ingest idempotency keys older than the TTL",
+    )
+    keys_parser.add_argument(
+        "--ttl-days", type=int, default=settings.burn_ingest_key_ttl_days,
+        help="Keep keys for this many days (default: BURN_INGEST_KEY_TTL_DAYS)",
+    )
 
     args = parser.parse_args()
 
@@ -99,6 +212,16 @@ def main() -> None:
             print("Aborted.")
             sys.exit(1)
         asyncio.run(reset_db())
+    elif args.command == "rebuild-burn-rollup":
+        asyncio.run(rebuild_burn_rollup())
+    elif args.command == "maintain-burn-partitions":
+        asyncio.run(maintain_burn_partitions(
+            args.months_ahead, args.retain_months, args.archive_schema, args.drop,
+        ))
+    elif args.command == "compact-burn-history":
+        asyncio.run(compact_burn_history(args.horizon_days))
+    elif args.command == "expire-ingest-keys":
+        asyncio.run(expire_ingest_keys(args.ttl_days))
 
 
 if __name__ == "__main__":
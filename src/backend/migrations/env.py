@@ -16,6 +16,7 @@ from app.models import (  # noqa: F401
     ApiToken,
     Base,
     BuildActivity,
+    BuildActivityPeriod,
     FeedEvent,
     Project,
     RefreshToken,
@@ -23,6 +24,8 @@ from app.models import (  # noqa: F401
     Tribe,
     TribeOpenRole,
     User,
+    UserDailyBurn,
+    UserWeeklyBurn,
     project_collaborators,
     tribe_members,
     user_skills,
@@ -0,0 +1,55 @@
+"""add_build_activity_periods
+
+Revision ID: a7b9c1d3e5f8
+Revises: f6a8b0c2d4e7
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b9c1d3e5f8"
+down_revision: str | None = "f6a8b0c2d4e7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the table that holds compacted weekly burn history."""
+    op.create_table(
+        "build_activity_periods",
+        sa.Column("id", sa.String(26), nullable=False),
+        sa.Column("user_id", sa.String(26), nullable=False),
+        sa.Column("project_id", sa.String(26), nullable=True),
+        sa.Column(
+            "source",
+            postgresql.ENUM(name="buildactivitysource", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("tokens", sa.BigInteger(), nullable=False),
+        sa.Column("first_date", sa.Date(), nullable=False),
+        sa.Column("last_date", sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "user_id", "project_id", "source", "period_start",
+            name="uq_build_activity_period",
+        ),
+    )
+    op.create_index(
+        "ix_build_activity_periods_project",
+        "build_activity_periods",
+        ["project_id", "user_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the compacted burn history table."""
+    op.drop_index("ix_build_activity_periods_project", table_name="build_activity_periods")
+    op.drop_table("build_activity_periods")
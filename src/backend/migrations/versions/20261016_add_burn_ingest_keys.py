@@ -0,0 +1,68 @@
+"""add_burn_ingest_keys
+
+Revision ID: b8c0d2e4f6a9
+Revises: a7b9c1d3e5f8
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c0d2e4f6a9"
+down_revision: str | None = "a7b9c1d3e5f8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the ingest idempotency ledger, seed it from build_activities, drop the session index."""
+    op.create_table(
+        "burn_ingest_keys",
+        sa.Column("user_id", sa.String(26), nullable=False),
+        sa.Column("session_id", sa.String(100), nullable=False),
+        sa.Column("burn_id", sa.String(26), nullable=False),
+        sa.Column("project_id", sa.String(26), nullable=True),
+        sa.Column("activity_date", sa.Date(), nullable=False),
+        sa.Column(
+            "source",
+            postgresql.ENUM(name="buildactivitysource", create_type=False),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("user_id", "session_id"),
+    )
+    op.create_index("ix_burn_ingest_keys_created_at", "burn_ingest_keys", ["created_at"])
+
+    # Only the session_id a row still carries is known; ids overwritten by
+    # later sessions on the same day row were already lost.
+    op.execute(
+        "INSERT INTO burn_ingest_keys "
+        "(user_id, session_id, burn_id, project_id, activity_date, source, created_at) "
+        "SELECT DISTINCT ON (user_id, session_id) "
+        "user_id, session_id, id, project_id, activity_date, source, updated_at "
+        "FROM build_activities WHERE session_id IS NOT NULL "
+        "ORDER BY user_id, session_id, updated_at DESC"
+    )
+
+    op.drop_index("ix_build_activities_session", table_name="build_activities")
+
+
+def downgrade() -> None:
+    """Restore the build_activities session index and drop the ledger."""
+    op.execute(
+        "CREATE INDEX ix_build_activities_session ON build_activities (session_id) "
+        "WHERE session_id IS NOT NULL"
+    )
+    op.drop_index("ix_burn_ingest_keys_created_at", table_name="burn_ingest_keys")
+    op.drop_table("burn_ingest_keys")
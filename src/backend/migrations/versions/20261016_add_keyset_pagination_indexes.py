@@ -0,0 +1,32 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: c9d1e3f5a7b0
+Revises: b8c0d2e4f6a9
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c9d1e3f5a7b0"
+down_revision: str | None = "b8c0d2e4f6a9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index the (sort value, id) pairs the connection queries page by."""
+    op.create_index("ix_feed_events_created_at_id", "feed_events", ["created_at", "id"])
+    op.create_index("ix_projects_updated_at_id", "projects", ["updated_at", "id"])
+    op.create_index("ix_tribes_updated_at_id", "tribes", ["updated_at", "id"])
+    op.create_index("ix_users_builder_score_id", "users", ["builder_score", "id"])
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+    op.drop_index("ix_users_builder_score_id", table_name="users")
+    op.drop_index("ix_tribes_updated_at_id", table_name="tribes")
+    op.drop_index("ix_projects_updated_at_id", table_name="projects")
+    op.drop_index("ix_feed_events_created_at_id", table_name="feed_events")
@@ -0,0 +1,41 @@
+"""add_user_daily_burn_rollup
+
+Revision ID: d4e6f8a0b2c5
+Revises: c3d5e7f9a1b3
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e6f8a0b2c5"
+down_revision: str | None = "c3d5e7f9a1b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the per-user daily burn rollup and backfill it from build_activities."""
+    op.create_table(
+        "user_daily_burn",
+        sa.Column("user_id", sa.String(26), nullable=False),
+        sa.Column("activity_date", sa.Date(), nullable=False),
+        sa.Column("tokens", sa.BigInteger(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "activity_date"),
+    )
+
+    op.execute(
+        "INSERT INTO user_daily_burn (user_id, activity_date, tokens) "
+        "SELECT user_id, activity_date, SUM(tokens_burned) "
+        "FROM build_activities "
+        "GROUP BY user_id, activity_date"
+    )
+
+
+def downgrade() -> None:
+    """Drop the per-user daily burn rollup."""
+    op.drop_table("user_daily_burn")
@@ -0,0 +1,41 @@
+"""add_user_weekly_burn_rollup
+
+Revision ID: e5f7a9b1c3d6
+Revises: d4e6f8a0b2c5
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f7a9b1c3d6"
+down_revision: str | None = "d4e6f8a0b2c5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the per-user ISO-week burn rollup and backfill it from build_activities."""
+    op.create_table(
+        "user_weekly_burn",
+        sa.Column("user_id", sa.String(26), nullable=False),
+        sa.Column("week_start", sa.Date(), nullable=False),
+        sa.Column("tokens", sa.BigInteger(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "week_start"),
+    )
+
+    op.execute(
+        "INSERT INTO user_weekly_burn (user_id, week_start, tokens) "
+        "SELECT user_id, date_trunc('week', activity_date)::date, SUM(tokens_burned) "
+        "FROM build_activities "
+        "GROUP BY 1, 2"
+    )
+
+
+def downgrade() -> None:
+    """Drop the per-user ISO-week burn rollup."""
+    op.drop_table("user_weekly_burn")
@@ -0,0 +1,127 @@
+"""partition_build_activities_by_month
+
+Revision ID: f6a8b0c2d4e7
+Revises: e5f7a9b1c3d6
+Create Date: 2026-10-16 11:00:00.000000
+
+Rebuilds build_activities as a table range-partitioned by month on
+activity_date. Postgres requires the partition key in every unique
+constraint, so the primary key becomes (id, activity_date);
+uq_build_activity_per_day already contains activity_date and is kept as is.
+
+One partition is created per month from the oldest row through
+PARTITIONS_AHEAD months past the current one, plus a DEFAULT partition so
+out-of-range dates never fail to insert. Later months are added by
+``python manage.py maintain-burn-partitions``.
+"""
+import datetime
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a8b0c2d4e7"
+down_revision: str | None = "e5f7a9b1c3d6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PARTITIONS_AHEAD = 3
+
+_INDEXES = (
+    "ix_build_activities_user_date",
+    "ix_build_activities_project",
+    "ix_build_activities_session",
+    "ix_build_activities_verification",
+)
+
+
+def _add_months(month: datetime.date, count: int) -> datetime.date:
+    index = month.year * 12 + month.month - 1 + count
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def _create_constraints_and_indexes(primary_key: str) -> None:
+    op.execute(f"ALTER TABLE build_activities ADD CONSTRAINT build_activities_pkey PRIMARY KEY ({primary_key})")
+    op.execute(
+        "ALTER TABLE build_activities ADD CONSTRAINT uq_build_activity_per_day "
+        "UNIQUE (user_id, project_id, activity_date, source)"
+    )
+    op.execute(
+        "ALTER TABLE build_activities ADD CONSTRAINT build_activities_user_id_fkey "
+        "FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE"
+    )
+    op.execute(
+        "ALTER TABLE build_activities ADD CONSTRAINT build_activities_project_id_fkey "
+        "FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE SET NULL"
+    )
+    op.execute("CREATE INDEX ix_build_activities_user_date ON build_activities (user_id, activity_date)")
+    op.execute(
+        "CREATE INDEX ix_build_activities_project ON build_activities (project_id) "
+        "WHERE project_id IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX ix_build_activities_session ON build_activities (session_id) "
+        "WHERE session_id IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX ix_build_activities_verification ON build_activities (user_id, verification)"
+    )
+
+
+def _rename_to_legacy() -> None:
+    """Move the current table and its index names aside so the new table can take them."""
+    op.execute("ALTER TABLE build_activities RENAME TO build_activities_legacy")
+    op.execute("ALTER TABLE build_activities_legacy RENAME CONSTRAINT build_activities_pkey TO build_activities_legacy_pkey")
+    op.execute(
+        "ALTER TABLE build_activities_legacy RENAME CONSTRAINT uq_build_activity_per_day "
+        "TO uq_build_activity_per_day_legacy"
+    )
+    for index in _INDEXES:
+        op.execute(f"ALTER INDEX {index} RENAME TO {index}_legacy")
+
+
+def upgrade() -> None:
+    """Rebuild build_activities as a monthly range-partitioned table."""
+    _rename_to_legacy()
+
+    op.execute(
+        "CREATE TABLE build_activities "
+        "(LIKE build_activities_legacy INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        "PARTITION BY RANGE (activity_date)"
+    )
+    _create_constraints_and_indexes("id, activity_date")
+
+    oldest = op.get_bind().execute(text("SELECT min(activity_date) FROM build_activities_legacy")).scalar()
+    current = datetime.date.today().replace(day=1)
+    month = min(oldest.replace(day=1), current) if oldest else current
+    last = _add_months(current, PARTITIONS_AHEAD)
+    while month <= last:
+        following = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE build_activities_y{month.year:04d}m{month.month:02d} "
+            f"PARTITION OF build_activities FOR VALUES FROM ('{month}') TO ('{following}')"
+        )
+        month = following
+    op.execute("CREATE TABLE build_activities_default PARTITION OF build_activities DEFAULT")
+
+    op.execute("INSERT INTO build_activities SELECT * FROM build_activities_legacy")
+    op.execute("DROP TABLE build_activities_legacy")
+
+
+def downgrade() -> None:
+    """Collapse the partitions back into a single unpartitioned build_activities table.
+
+    Only rows in attached partitions are restored; partitions previously
+    detached by maintain-burn-partitions are left where they are.
+    """
+    _rename_to_legacy()
+
+    op.execute(
+        "CREATE TABLE build_activities "
+        "(LIKE build_activities_legacy INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    _create_constraints_and_indexes("id")
+
+    op.execute("INSERT INTO build_activities SELECT * FROM build_activities_legacy")
+    op.execute("DROP TABLE build_activities_legacy")
@@ -1,6 +1,7 @@
 """Pytest configuration and fixtures for Find Your Tribe backend tests."""
 
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from typing import Any
 from urllib.parse import urlparse, urlunparse
 
@@ -183,8 +184,14 @@ async def async_client(async_session: AsyncSession) -> AsyncGenerator[AsyncClien
     async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
         yield async_session
 
-    from app.db.engine import get_session
+    # Sessions opened from the factory (e.g. by streamed responses) are the test session too
+    @asynccontextmanager
+    async def test_session_context() -> AsyncGenerator[AsyncSession, None]:
+        yield async_session
+
+    from app.db.engine import get_session, get_session_factory
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_session_factory] = lambda: test_session_context
 
     # Create async client
     async with AsyncClient(
@@ -1,17 +1,25 @@
 """Tests for app.api.auth_token — FastAPI dependency for API token authentication."""
 
 import hashlib
-import time
 from datetime import UTC, datetime, timedelta
 
 import pytest
 from fastapi import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
 
-from app.api.auth_token import TOKEN_PREFIX, _token_cache, clear_token_cache, get_api_token_user
+from app.api import auth_token
+from app.api.auth_token import (
+    TOKEN_CACHE_TTL,
+    TOKEN_PREFIX,
+    _token_cache,
+    clear_token_cache,
+    get_api_token_user,
+)
 from app.models.api_token import ApiToken
 from app.models.enums import AvailabilityStatus, UserRole
 from app.models.user import User
+from app.services.rate_limit import TokenBucketLimiter
+from app.services.token_usage import token_usage
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -147,6 +155,28 @@ async def test_valid_token_returns_user_id(async_session):
     assert result == str(user.id)
 
 
+@pytest.mark.asyncio
+async def test_valid_token_records_usage_without_writing(async_session, monkeypatch):
+    """Auth records last use in memory instead of committing in the request path."""
+    _token_cache.clear()
+    token_usage.clear()
+    user = await _create_user(async_session)
+    raw = f"{TOKEN_PREFIX}{'7' * 64}"
+    api_token = await _create_api_token(async_session, user, raw)
+
+    async def _no_commit():
+        raise AssertionError("auth must not commit")
+
+    monkeypatch.setattr(async_session, "commit", _no_commit)
+    creds = _make_creds(raw)
+    await get_api_token_user(credentials=creds, session=async_session)
+    await get_api_token_user(credentials=creds, session=async_session)
+
+    assert len(token_usage) == 1
+    assert api_token.last_used_at is None
+    token_usage.clear()
+
+
 @pytest.mark.asyncio
 async def test_valid_token_no_expiry_returns_user_id(async_session):
     """A token with no expiry (expires_at=None) is treated as never-expiring."""
@@ -197,9 +227,7 @@ async def test_cache_is_populated_after_valid_auth(async_session):
     await get_api_token_user(credentials=creds, session=async_session)
 
     assert token_hash in _token_cache
-    cached_user_id, cached_at = _token_cache[token_hash]
-    assert cached_user_id == str(user.id)
-    assert time.time() - cached_at < 5
+    assert _token_cache.get(token_hash) == str(user.id)
 
 
 @pytest.mark.asyncio
@@ -212,7 +240,7 @@ async def test_cached_token_does_not_hit_db(async_session, monkeypatch):
     token_hash = hashlib.sha256(raw.encode()).hexdigest()
 
     # Pre-populate the cache manually
-    _token_cache[token_hash] = (str(user.id), time.time())
+    _token_cache.set(token_hash, str(user.id))
 
     # Patch session.execute to fail if called
     async def _no_db(*_args, **_kwargs):
@@ -226,7 +254,7 @@ async def test_cached_token_does_not_hit_db(async_session, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_expired_cache_entry_triggers_db_lookup(async_session):
+async def test_expired_cache_entry_triggers_db_lookup(async_session, monkeypatch):
     """A cache entry older than TTL is evicted and the DB is queried."""
     _token_cache.clear()
 
@@ -235,16 +263,84 @@ async def test_expired_cache_entry_triggers_db_lookup(async_session):
     await _create_api_token(async_session, user, raw)
     token_hash = hashlib.sha256(raw.encode()).hexdigest()
 
-    # Plant a stale cache entry (cached 400 seconds ago)
-    _token_cache[token_hash] = (str(user.id), time.time() - 400)
+    # Plant an entry, then move the cache clock past its TTL
+    _token_cache.set(token_hash, "stale-user-id")
+    now = _token_cache.clock()
+    monkeypatch.setattr(_token_cache, "clock", lambda: now + TOKEN_CACHE_TTL + 1)
 
     creds = _make_creds(raw)
     result = await get_api_token_user(credentials=creds, session=async_session)
     assert result == str(user.id)
 
     # Cache should now hold a fresh entry
-    _, fresh_at = _token_cache[token_hash]
-    assert time.time() - fresh_at < 5
+    assert _token_cache.get(token_hash) == str(user.id)
+
+
+@pytest.mark.asyncio
+async def test_unknown_token_is_negatively_cached(async_session, monkeypatch):
+    """A token that failed lookup is rejected from the cache until the negative TTL passes."""
+    _token_cache.clear()
+    raw = f"{TOKEN_PREFIX}{'6' * 64}"
+    creds = _make_creds(raw)
+
+    with pytest.raises(HTTPException):
+        await get_api_token_user(credentials=creds, session=async_session)
+
+    async def _no_db(*_args, **_kwargs):
+        raise AssertionError("DB should not be queried for a negatively cached token")
+
+    monkeypatch.setattr(async_session, "execute", _no_db)
+    with pytest.raises(HTTPException) as exc_info:
+        await get_api_token_user(credentials=creds, session=async_session)
+    assert exc_info.value.status_code == 401
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_throttled_token_raises_429_without_db(async_session, monkeypatch):
+    """An empty token bucket yields 429 with Retry-After before any DB access."""
+    monkeypatch.setattr(
+        auth_token, "token_rate_limiter", TokenBucketLimiter(rate_per_minute=6, burst=1)
+    )
+    user = await _create_user(async_session)
+    raw = f"{TOKEN_PREFIX}{'3' * 64}"
+    await _create_api_token(async_session, user, raw)
+    creds = _make_creds(raw)
+
+    assert await get_api_token_user(credentials=creds, session=async_session) == str(user.id)
+
+    async def _no_db(*_args, **_kwargs):
+        raise AssertionError("DB should not be queried for a throttled token")
+
+    monkeypatch.setattr(async_session, "execute", _no_db)
+    _token_cache.clear()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_api_token_user(credentials=creds, session=async_session)
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers == {"Retry-After": "10"}
+
+
+@pytest.mark.asyncio
+async def test_user_limit_spans_tokens(async_session, monkeypatch):
+    """The per-user bucket is shared by all of a user's tokens."""
+    monkeypatch.setattr(
+        auth_token, "user_rate_limiter", TokenBucketLimiter(rate_per_minute=60, burst=1)
+    )
+    user = await _create_user(async_session)
+    first = f"{TOKEN_PREFIX}{'4' * 64}"
+    second = f"{TOKEN_PREFIX}{'5' * 64}"
+    await _create_api_token(async_session, user, first)
+    await _create_api_token(async_session, user, second)
+
+    await get_api_token_user(credentials=_make_creds(first), session=async_session)
+    with pytest.raises(HTTPException) as exc_info:
+        await get_api_token_user(credentials=_make_creds(second), session=async_session)
+    assert exc_info.value.status_code == 429
 
 
 # ---------------------------------------------------------------------------
@@ -254,7 +350,7 @@ async def test_expired_cache_entry_triggers_db_lookup(async_session):
 
 def test_clear_token_cache_removes_entry():
     """clear_token_cache removes the specified hash from the cache."""
-    _token_cache["some_hash"] = ("user_id_123", time.time())
+    _token_cache.set("some_hash", "user_id_123")
     assert "some_hash" in _token_cache
 
     clear_token_cache("some_hash")
@@ -154,7 +154,7 @@ async def test_revoked_token_raises_401(
     token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
     from app.api.auth_token import _token_cache
 
-    _token_cache.pop(token_hash, None)
+    _token_cache.invalidate(token_hash)
 
     resp = await async_client.get(
         "/api/burn/verify-token",
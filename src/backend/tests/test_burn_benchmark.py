@@ -0,0 +1,46 @@
+"""Tests for the burn ingest benchmark's workload planning and statistics."""
+
+from benchmarks.burn_ingest import BenchmarkConfig, percentile, plan_workload
+
+REPOS = [["bench-0/repo-0", "bench-0/repo-1"], ["bench-1/repo-0"]]
+
+
+def test_percentile_nearest_rank():
+    """Percentiles use the nearest-rank method; an empty list gives 0."""
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_plan_workload_is_deterministic_per_seed():
+    """The same config and seed always yield the same request sequence."""
+    config = BenchmarkConfig(requests=200, seed=7)
+    assert plan_workload(config, REPOS) == plan_workload(config, REPOS)
+    assert plan_workload(config, REPOS) != plan_workload(BenchmarkConfig(requests=200), REPOS)
+
+
+def test_plan_workload_honours_ratios():
+    """Repeat, hint and verify ratios shape the generated requests."""
+    config = BenchmarkConfig(
+        requests=2000,
+        repeat_ratio=0.0,
+        matched_hint_ratio=1.0,
+        unmatched_hint_ratio=0.0,
+        verify_ratio=0.0,
+    )
+    planned = plan_workload(config, REPOS)
+
+    session_ids = [p.body["session_id"] for p in planned]
+    assert len(set(session_ids)) == len(session_ids)
+    for request in planned:
+        hint = request.body["project_hint"]
+        assert any(repo in hint for repo in REPOS[request.user_index])
+
+    config = BenchmarkConfig(requests=2000, repeat_ratio=0.5, verify_ratio=0.25)
+    planned = plan_workload(config, REPOS)
+    ingests = [p for p in planned if p.body is not None]
+    assert 0.2 < 1 - len(ingests) / len(planned) < 0.3
+    repeats = len(ingests) - len({p.body["session_id"] for p in ingests})
+    assert 0.4 < repeats / len(ingests) < 0.6
@@ -0,0 +1,256 @@
+"""Tests for the burn write-behind buffer — coalescing, day totals, idempotency, flushing."""
+
+import datetime
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.build_activity import BuildActivity
+from app.models.burn_ingest_key import BurnIngestKey
+from app.models.project import Project
+from app.services.burn_buffer import BurnBuffer
+
+DAY = datetime.date(2026, 5, 1)
+
+
+def _session_factory(session: AsyncSession):
+    """Wrap the transactional test session so flush() can open it like a factory."""
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory
+
+
+def _add(buffer: BurnBuffer, user_id: str = "user1", **overrides) -> str:
+    values = {
+        "user_id": user_id,
+        "project_id": None,
+        "activity_date": DAY,
+        "source": "anthropic",
+        "tokens_burned": 100,
+        "verification": "provider_verified",
+    }
+    values.update(overrides)
+    return buffer.add(**values)
+
+
+async def _project(session: AsyncSession, owner_id: str) -> Project:
+    project = Project(owner_id=owner_id, title="Buffered")
+    session.add(project)
+    await session.flush()
+    return project
+
+
+# ---------------------------------------------------------------------------
+# In-memory behaviour
+# ---------------------------------------------------------------------------
+
+
+def test_add_coalesces_same_key():
+    """Increments for the same user/project/day/source collapse into one pending row."""
+    buffer = BurnBuffer()
+    first = _add(buffer, project_id="proj1", tokens_burned=100)
+    second = _add(buffer, project_id="proj1", tokens_burned=250, tool="claude-code")
+
+    assert first == second
+    assert len(buffer) == 1
+    assert buffer.day_total("user1", DAY) == 350
+
+
+def test_add_keeps_rows_without_project_apart():
+    """Rows without a project never merge, as with direct inserts."""
+    buffer = BurnBuffer()
+    first = _add(buffer, tokens_burned=100)
+    second = _add(buffer, tokens_burned=250)
+
+    assert first != second
+    assert len(buffer) == 2
+    assert buffer.day_total("user1", DAY) == 350
+
+
+def test_add_counts_a_session_once():
+    """A session_id folded into a pending row twice is only counted once."""
+    buffer = BurnBuffer()
+    _add(buffer, project_id="proj1", session_id="sess_1", tokens_burned=100)
+    _add(buffer, project_id="proj1", session_id="sess_1", tokens_burned=100)
+
+    assert buffer.day_total("user1", DAY) == 100
+
+
+def test_add_keeps_distinct_keys_apart():
+    """Different sources or dates produce separate pending rows."""
+    buffer = BurnBuffer()
+    _add(buffer, source="anthropic")
+    _add(buffer, source="openai")
+    _add(buffer, activity_date=DAY + datetime.timedelta(days=1))
+
+    assert len(buffer) == 3
+    assert buffer.day_total("user1", DAY) == 200
+    assert buffer.day_total("user2", DAY) == 0
+
+
+def test_add_reports_persisted_id_when_known():
+    """The id of an already stored row is reported instead of the pending id."""
+    buffer = BurnBuffer()
+    assert _add(buffer, project_id="proj1", persisted_id="01PERSISTED") == "01PERSISTED"
+
+
+def test_session_ids_are_acknowledged():
+    """A buffered session_id is remembered with its burn id and date."""
+    buffer = BurnBuffer()
+    burn_id = _add(buffer, session_id="sess_1")
+
+    assert buffer.acknowledged("user1", "sess_1") == (burn_id, None, DAY)
+    assert buffer.acknowledged("user2", "sess_1") is None
+
+
+def test_acknowledged_sessions_are_bounded():
+    """The oldest acknowledged session_ids are evicted beyond the cap."""
+    buffer = BurnBuffer(max_acknowledged_sessions=2)
+    for i in range(3):
+        _add(buffer, session_id=f"sess_{i}")
+
+    assert buffer.acknowledged("user1", "sess_0") is None
+    assert buffer.acknowledged("user1", "sess_2") is not None
+
+
+# ---------------------------------------------------------------------------
+# flush
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_flush_empty_buffer_is_noop(async_session: AsyncSession):
+    """Flushing an empty buffer writes nothing."""
+    buffer = BurnBuffer()
+    assert await buffer.flush(_session_factory(async_session)) == 0
+
+
+@pytest.mark.asyncio
+async def test_flush_persists_coalesced_rows(async_session: AsyncSession, seed_test_data):
+    """Flush writes one row per key and clears the buffered day totals."""
+    user = seed_test_data["users"]["testuser1"]
+    project = await _project(async_session, user.id)
+    buffer = BurnBuffer()
+    for _ in range(5):
+        _add(buffer, user_id=user.id, project_id=project.id, tokens_burned=200)
+
+    flushed = await buffer.flush(_session_factory(async_session))
+
+    assert flushed == 1
+    assert len(buffer) == 0
+    assert buffer.day_total(user.id, DAY) == 0
+    rows = (
+        await async_session.execute(
+            select(BuildActivity).where(BuildActivity.user_id == user.id)
+        )
+    ).scalars().all()
+    assert [r.tokens_burned for r in rows] == [1000]
+
+
+@pytest.mark.asyncio
+async def test_flush_adds_to_existing_project_row(async_session: AsyncSession, seed_test_data):
+    """Flushed increments are added to a row already stored for the same key."""
+    user = seed_test_data["users"]["testuser1"]
+    project = await _project(async_session, user.id)
+    async_session.add(
+        BuildActivity(
+            user_id=user.id,
+            project_id=project.id,
+            activity_date=DAY,
+            tokens_burned=1000,
+            source="anthropic",
+        )
+    )
+    await async_session.commit()
+
+    buffer = BurnBuffer()
+    _add(buffer, user_id=user.id, project_id=project.id, tokens_burned=500)
+    await buffer.flush(_session_factory(async_session))
+
+    rows = (
+        await async_session.execute(
+            select(BuildActivity).where(BuildActivity.user_id == user.id)
+        )
+    ).scalars().all()
+    assert [r.tokens_burned for r in rows] == [1500]
+
+
+@pytest.mark.asyncio
+async def test_flush_claims_session_ids_in_ledger(async_session: AsyncSession, seed_test_data):
+    """Every session_id coalesced into a flushed row gets a ledger key."""
+    user = seed_test_data["users"]["testuser1"]
+    project = await _project(async_session, user.id)
+    buffer = BurnBuffer()
+    burn_id = _add(buffer, user_id=user.id, project_id=project.id, session_id="sess_a")
+    _add(buffer, user_id=user.id, project_id=project.id, session_id="sess_b")
+    _add(buffer, user_id=user.id, project_id=project.id)
+
+    await buffer.flush(_session_factory(async_session))
+
+    keys = (
+        await async_session.execute(
+            select(BurnIngestKey.session_id, BurnIngestKey.burn_id)
+            .where(BurnIngestKey.user_id == user.id)
+            .order_by(BurnIngestKey.session_id)
+        )
+    ).all()
+    assert [tuple(k) for k in keys] == [("sess_a", burn_id), ("sess_b", burn_id)]
+
+
+@pytest.mark.asyncio
+async def test_flush_failure_requeues_increments():
+    """A failed flush keeps the increments buffered for the next attempt."""
+
+    @asynccontextmanager
+    async def failing_factory():
+        raise RuntimeError("database unavailable")
+        yield  # pragma: no cover
+
+    buffer = BurnBuffer()
+    _add(buffer, project_id="proj1", tokens_burned=300)
+
+    with pytest.raises(RuntimeError):
+        await buffer.flush(failing_factory)
+
+    _add(buffer, project_id="proj1", tokens_burned=100)
+    assert len(buffer) == 1
+    assert buffer.day_total("user1", DAY) == 400
+
+
+@pytest.mark.asyncio
+async def test_flush_skips_sessions_already_in_ledger(
+    async_session: AsyncSession, seed_test_data
+):
+    """Sessions recorded by another worker or process are not counted again."""
+    user = seed_test_data["users"]["testuser1"]
+    project = await _project(async_session, user.id)
+    async_session.add(
+        BurnIngestKey(
+            user_id=user.id,
+            session_id="sess_done",
+            burn_id="01EARLIERBURN0000000000000",
+            project_id=project.id,
+            activity_date=DAY,
+            source="anthropic",
+        )
+    )
+    await async_session.commit()
+
+    buffer = BurnBuffer()
+    _add(buffer, user_id=user.id, project_id=project.id, session_id="sess_done", tokens_burned=500)
+    _add(buffer, user_id=user.id, project_id=project.id, session_id="sess_new", tokens_burned=200)
+    _add(buffer, user_id=user.id, session_id="sess_done", tokens_burned=500)
+
+    assert await buffer.flush(_session_factory(async_session)) == 1
+
+    rows = (
+        await async_session.execute(
+            select(BuildActivity).where(BuildActivity.user_id == user.id)
+        )
+    ).scalars().all()
+    assert [(r.project_id, r.tokens_burned) for r in rows] == [(project.id, 200)]
@@ -0,0 +1,207 @@
+"""Tests for app.services.burn_compaction — folding old daily burn into period rows."""
+
+import datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ulid import ULID
+
+from app.models.build_activity import BuildActivity
+from app.models.build_activity_period import BuildActivityPeriod
+from app.models.project import Project
+from app.services import burn_compaction, burn_service, ingest_keys
+
+
+@pytest.fixture
+def user_id(seed_test_data) -> str:
+    return seed_test_data["users"]["testuser1"].id
+
+
+@pytest.fixture
+async def project_id(async_session: AsyncSession, user_id: str) -> str:
+    project = Project(owner_id=user_id, title="Long Runner")
+    async_session.add(project)
+    await async_session.flush()
+    return project.id
+
+
+async def _log(session: AsyncSession, user_id: str, project_id: str | None, days: list[tuple[str, int]]):
+    for date_str, tokens in days:
+        await burn_service.log_session(
+            session, user_id, tokens, "anthropic",
+            project_id=project_id, activity_date=datetime.date.fromisoformat(date_str),
+        )
+    await session.commit()
+
+
+async def _periods(session: AsyncSession, user_id: str) -> list[tuple[datetime.date, int]]:
+    rows = await session.execute(
+        select(BuildActivityPeriod.period_start, func.sum(BuildActivityPeriod.tokens))
+        .where(BuildActivityPeriod.user_id == user_id)
+        .group_by(BuildActivityPeriod.period_start)
+        .order_by(BuildActivityPeriod.period_start)
+    )
+    return [(row[0], int(row[1])) for row in rows]
+
+
+def test_compaction_cutoff_aligns_to_week_start():
+    """The cutoff is the ISO Monday of the week the horizon falls in."""
+    today = datetime.date(2026, 10, 16)
+    # 2026-09-16 is a Wednesday; its ISO week starts on Monday 2026-09-14
+    assert burn_compaction.compaction_cutoff(30, today) == datetime.date(2026, 9, 14)
+
+
+@pytest.mark.asyncio
+async def test_compaction_folds_old_rows_by_week(
+    async_session: AsyncSession, user_id: str, project_id: str
+):
+    """Rows before the cutoff become one row per ISO week; newer rows stay daily."""
+    await _log(async_session, user_id, project_id, [
+        ("2026-01-06", 10), ("2026-01-08", 20), ("2026-01-14", 30), ("2026-01-19", 40),
+    ])
+
+    compacted = await burn_compaction.compact_burn_history(
+        async_session, datetime.date(2026, 1, 19)
+    )
+
+    assert compacted == 3
+    assert await _periods(async_session, user_id) == [
+        (datetime.date(2026, 1, 5), 30),
+        (datetime.date(2026, 1, 12), 30),
+    ]
+    remaining = (
+        await async_session.execute(
+            select(BuildActivity.activity_date).where(BuildActivity.user_id == user_id)
+        )
+    ).scalars().all()
+    assert remaining == [datetime.date(2026, 1, 19)]
+
+
+@pytest.mark.asyncio
+async def test_compaction_runs_in_batches(
+    async_session: AsyncSession, user_id: str, project_id: str, monkeypatch
+):
+    """History larger than a batch is compacted over several batches, all of it."""
+    monkeypatch.setattr(burn_compaction, "DELETE_BATCH_SIZE", 2)
+    await _log(async_session, user_id, project_id, [
+        ("2026-01-05", 1), ("2026-01-06", 2), ("2026-01-07", 3), ("2026-01-12", 4),
+        ("2026-01-13", 5),
+    ])
+
+    compacted = await burn_compaction.compact_burn_history(
+        async_session, datetime.date(2026, 2, 1)
+    )
+
+    assert compacted == 5
+    assert await _periods(async_session, user_id) == [
+        (datetime.date(2026, 1, 5), 6),
+        (datetime.date(2026, 1, 12), 9),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_compaction_is_additive_across_runs(
+    async_session: AsyncSession, user_id: str, project_id: str
+):
+    """Late rows for an already-compacted week are added to it on the next run."""
+    await _log(async_session, user_id, project_id, [("2026-01-05", 100)])
+    await burn_compaction.compact_burn_history(async_session, datetime.date(2026, 2, 2))
+    await _log(async_session, user_id, project_id, [("2026-01-07", 50)])
+    await burn_compaction.compact_burn_history(async_session, datetime.date(2026, 2, 2))
+
+    assert await _periods(async_session, user_id) == [(datetime.date(2026, 1, 5), 150)]
+
+
+@pytest.mark.asyncio
+async def test_rows_with_live_ingest_keys_stay_daily(
+    async_session: AsyncSession, user_id: str, project_id: str
+):
+    """A row an ingest key still resolves to is kept until the key is swept."""
+    await _log(async_session, user_id, project_id, [("2026-01-05", 100), ("2026-01-06", 50)])
+    await ingest_keys.claim_keys(async_session, [{
+        "user_id": user_id,
+        "session_id": "sess_1",
+        "burn_id": str(ULID()),
+        "project_id": project_id,
+        "activity_date": datetime.date(2026, 1, 5),
+        "source": "anthropic",
+    }])
+    await async_session.commit()
+
+    compacted = await burn_compaction.compact_burn_history(
+        async_session, datetime.date(2026, 2, 2)
+    )
+
+    assert compacted == 1
+    replays = await ingest_keys.get_replays(async_session, user_id, ["sess_1"])
+    kept = await async_session.get(BuildActivity, replays["sess_1"][0])
+    assert kept is not None and kept.tokens_burned == 100
+
+
+@pytest.mark.asyncio
+async def test_receipt_unchanged_by_compaction(
+    async_session: AsyncSession, user_id: str, project_id: str
+):
+    """get_receipt totals, peak week and duration survive compaction; weeks show as one entry."""
+    await _log(async_session, user_id, project_id, [
+        ("2026-01-07", 100), ("2026-01-09", 200), ("2026-01-20", 150), ("2026-03-03", 50),
+    ])
+    before = await burn_service.get_receipt(async_session, user_id, project_id)
+
+    await burn_compaction.compact_burn_history(async_session, datetime.date(2026, 3, 2))
+    after = await burn_service.get_receipt(async_session, user_id, project_id)
+
+    for key in ("total_tokens", "peak_week_tokens", "duration_weeks"):
+        assert after[key] == before[key]
+    assert after["peak_week_tokens"] == 300
+    assert [(d["date"], d["tokens"]) for d in after["daily_activity"]] == [
+        (datetime.date(2026, 1, 5), 300),
+        (datetime.date(2026, 1, 19), 150),
+        (datetime.date(2026, 3, 3), 50),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_receipt_duration_counts_calendar_weeks_across_compaction(
+    async_session: AsyncSession, user_id: str, project_id: str
+):
+    """A Sunday-to-Monday span is one week, before and after its first week is compacted."""
+    await _log(async_session, user_id, project_id, [("2026-01-11", 100), ("2026-01-12", 100)])
+    before = await burn_service.get_receipt(async_session, user_id, project_id)
+
+    await burn_compaction.compact_burn_history(async_session, datetime.date(2026, 1, 12))
+    after = await burn_service.get_receipt(async_session, user_id, project_id)
+
+    assert before["duration_weeks"] == after["duration_weeks"] == 1
+    assert after["daily_activity"][0]["date"] == datetime.date(2026, 1, 5)
+
+
+@pytest.mark.asyncio
+async def test_summary_and_rollup_rebuild_keep_compacted_days(
+    async_session: AsyncSession, user_id: str
+):
+    """Summaries read the rollups, and a rebuild keeps the compacted days' rollups."""
+    await _log(async_session, user_id, None, [
+        ("2026-01-05", 100), ("2026-01-20", 200), ("2026-03-03", 50),
+    ])
+    await burn_compaction.compact_burn_history(async_session, datetime.date(2026, 2, 2))
+    expected = await burn_service.get_summary(async_session, user_id, weeks=520)
+    assert expected["total_tokens"] == 350
+
+    await burn_service.rebuild_burn_rollups(async_session)
+    summary = await burn_service.get_summary(async_session, user_id, weeks=520)
+    assert summary == expected
+    assert summary["daily_activity"] == [
+        {"date": datetime.date(2026, 1, 5), "tokens": 100},
+        {"date": datetime.date(2026, 1, 20), "tokens": 200},
+        {"date": datetime.date(2026, 3, 3), "tokens": 50},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_nothing_to_compact(async_session: AsyncSession):
+    """No rows before the cutoff compacts nothing."""
+    assert await burn_compaction.compact_burn_history(
+        async_session, datetime.date(2000, 1, 1)
+    ) == 0
@@ -1,19 +1,26 @@
 """Tests for burn ingest REST endpoints.
 
-Covers POST /api/burn/ingest and GET /api/burn/verify-token.
+Covers POST /api/burn/ingest, /ingest/batch, /import and GET /api/burn/verify-token.
 Uses httpx.AsyncClient with the transactional test session.
 """
 
+import asyncio
+import datetime
 import hashlib
+import json
 import secrets
+from collections.abc import AsyncGenerator, Generator
 
 import pytest
+import uvicorn
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.api_token import ApiToken
 from app.models.project import Project
 from app.models.user import User
+from app.models.user_daily_burn import UserDailyBurn
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -51,6 +58,28 @@ async def api_token_fixture(async_session: AsyncSession, async_client: AsyncClie
     return {"raw_token": raw_token, "user": user, "api_token": api_token}
 
 
+@pytest.fixture
+async def live_server(async_client: AsyncClient) -> AsyncGenerator[str, None]:
+    """Serve the app with uvicorn on a free local port, returning its base URL.
+
+    Depends on async_client so the test-session dependency overrides apply.
+    """
+    from app.main import app
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=0, lifespan="off", log_level="warning")
+    )
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}"
+
+    server.should_exit = True
+    await task
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -260,3 +289,534 @@ async def test_verify_token_returns_username_and_recent_burns(
     assert data["username"] == user.username
     assert data["display_name"] == user.display_name
     assert isinstance(data["recent_burns"], list)
+
+
+# ---------------------------------------------------------------------------
+# Batch ingest
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_batch_ingest_returns_per_item_results_and_day_totals(
+    async_client: AsyncClient,
+    api_token_fixture: dict,
+) -> None:
+    """Batch ingest returns one result per item plus a total for every touched day."""
+    raw_token = api_token_fixture["raw_token"]
+
+    resp = await async_client.post(
+        "/api/burn/ingest/batch",
+        headers={"Authorization": f"Bearer {raw_token}"},
+        json={
+            "items": [
+                {
+                    "tokens_burned": 1000,
+                    "source": "anthropic",
+                    "verification": "provider_verified",
+                    "activity_date": "2026-03-01",
+                },
+                {
+                    "tokens_burned": 2000,
+                    "source": "anthropic",
+                    "verification": "provider_verified",
+                    "activity_date": "2026-03-01",
+                },
+                {
+                    "tokens_burned": 500,
+                    "source": "openai",
+                    "verification": "provider_verified",
+                    "activity_date": "2026-03-02",
+                },
+            ]
+        },
+    )
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["status"] == "ok"
+    assert len(data["results"]) == 3
+    assert data["day_totals"] == {"2026-03-01": 3000, "2026-03-02": 500}
+    assert [r["day_total"] for r in data["results"]] == [3000, 3000, 500]
+    assert len({r["burn_id"] for r in data["results"]}) == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_ingest_coalesces_same_project_day_source(
+    async_session: AsyncSession,
+    async_client: AsyncClient,
+    api_token_fixture: dict,
+) -> None:
+    """Items hitting the same project/day/source row are summed into one upsert."""
+    raw_token = api_token_fixture["raw_token"]
+    user = api_token_fixture["user"]
+
+    project = Project(
+        owner_id=user.id,
+        title="Batch Repo",
+        github_repo_full_name="testowner/batch-repo",
+    )
+    async_session.add(project)
+    await async_session.commit()
+
+    from app.services.project_resolution import invalidate_project_cache
+
+    invalidate_project_cache(user.id)
+
+    item = {
+        "tokens_burned": 1500,
+        "source": "anthropic",
+        "verification": "provider_verified",
+        "activity_date": "2026-03-05",
+        "project_hint": "https://github.com/testowner/batch-repo.git",
+    }
+    resp = await async_client.post(
+        "/api/burn/ingest/batch",
+        headers={"Authorization": f"Bearer {raw_token}"},
+        json={"items": [item, {**item, "project_hint": "testowner/batch-repo"}]},
+    )
+
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert results[0]["burn_id"] == results[1]["burn_id"]
+    assert all(r["project_id"] == project.id for r in results)
+    assert all(r["project_matched"] for r in results)
+    assert resp.json()["day_totals"] == {"2026-03-05": 3000}
+
+
+@pytest.mark.asyncio
+async def test_batch_ingest_deduplicates_session_ids(
+    async_client: AsyncClient,
+    api_token_fixture: dict,
+) -> None:
+    """Session ids already ingested, or repeated within the batch, are not double-counted."""
+    raw_token = api_token_fixture["raw_token"]
+    headers = {"Authorization": f"Bearer {raw_token}"}
+    base = {
+        "tokens_burned": 1000,
+        "source": "anthropic",
+        "verification": "provider_verified",
+        "activity_date": "2026-03-10",
+    }
+
+    first = await async_client.post(
+        "/api/burn/ingest", headers=headers, json={**base, "session_id": "sess_prior"}
+    )
+    assert first.status_code == 200
+
+    resp = await async_client.post(
+        "/api/burn/ingest/batch",
+        headers=headers,
+        json={
+            "items": [
+                {**base, "session_id": "sess_prior"},
+                {**base, "session_id": "sess_new"},
+                {**base, "session_id": "sess_new"},
+            ]
+        },
+    )
+
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert results[0]["burn_id"] == first.json()["burn_id"]
+    assert results[1]["burn_id"] == results[2]["burn_id"]
+    assert resp.json()["day_totals"] == {"2026-03-10": 2000}
+
+
+@pytest.mark.asyncio
+async def test_batch_ingest_invalid_date_returns_400(
+    async_client: AsyncClient,
+    api_token_fixture: dict,
+) -> None:
+    """A malformed activity_date anywhere in the batch rejects the whole batch."""
+    raw_token = api_token_fixture["raw_token"]
+
+    resp = await async_client.post(
+        "/api/burn/ingest/batch",
+        headers={"Authorization": f"Bearer {raw_token}"},
+        json={
+            "items": [
+                {
+                    "tokens_burned": 1000,
+                    "source": "anthropic",
+                    "verification": "provider_verified",
+                    "activity_date": "03/01/2026",
+                },
+            ]
+        },
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_batch_ingest_oversized_batch_returns_422(
+    async_client: AsyncClient,
+    api_token_fixture: dict,
+) -> None:
+    """Batches larger than MAX_BATCH_SIZE fail validation."""
+    from app.api.burn_ingest import MAX_BATCH_SIZE
+
+    raw_token = api_token_fixture["raw_token"]
+    item = {"tokens_burned": 1, "source": "anthropic", "verification": "provider_verified"}
+
+    resp = await async_client.post(
+        "/api/burn/ingest/batch",
+        headers={"Authorization": f"Bearer {raw_token}"},
+        json={"items": [item] * (MAX_BATCH_SIZE + 1)},
+    )
+    assert resp.status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# Streaming NDJSON import
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_import_streams_progress_and_per_line_errors(
+    async_client: AsyncClient,
+    api_token_fixture: dict,
+) -> None:
+    """Valid lines are committed; invalid ones are reported by line number."""
+    raw_token = api_token_fixture["raw_token"]
+    item = {
+        "tokens_burned": 1000,
+        "source": "anthropic",
+        "verification": "extension_tracked",
+        "activity_date": "2025-06-01",
+    }
+    body = "\n".join([
+        json.dumps(item),
+        "not json",
+        "",
+        json.dumps({**item, "activity_date": "06/01/2025"}),
+        json.dumps({**item, "tokens_burned": 0}),
+        json.dumps({**item, "source": "openai"}),
+    ])
+
+    async def chunks():
+        for start in range(0, len(body), 7):
+            yield body[start:start + 7].encode()
+
+    resp = await async_client.post(
+        "/api/burn/import",
+        headers={
+            "Authorization": f"Bearer {raw_token}",
+            "Content-Type": "application/x-ndjson",
+        },
+        content=chunks(),
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert [e["line"] for e in events if "error" in e] == [2, 4, 5]
+    assert events[-2] == {"committed": 2, "lines": 6}
+    assert events[-1] == {"status": "ok", "lines": 6, "committed": 2, "errors": 3}
+
+    verify = await async_client.get(
+        "/api/burn/verify-token", headers={"Authorization": f"Bearer {raw_token}"}
+    )
+    assert sum(b["tokens"] for b in verify.json()["recent_burns"]) == 2000
+
+
+@pytest.mark.asyncio
+async def test_import_commits_in_fixed_size_chunks(
+    async_client: AsyncClient,
+    api_token_fixture: dict,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A progress event follows every IMPORT_CHUNK_SIZE lines; session_ids stay idempotent."""
+    from app.api import burn_ingest
+
+    monkeypatch.setattr(burn_ingest, "IMPORT_CHUNK_SIZE", 2)
+    raw_token = api_token_fixture["raw_token"]
+    lines = [
+        json.dumps({
+            "tokens_burned": 100,
+            "source": "anthropic",
+            "verification": "extension_tracked",
+            "activity_date": "2025-06-02",
+            "session_id": f"sess_import_{index % 4}",
+        })
+        for index in range(5)
+    ]
+
+    resp = await async_client.post(
+        "/api/burn/import",
+        headers={"Authorization": f"Bearer {raw_token}"},
+        content="\n".join(lines) + "\n",
+    )
+
+    assert resp.status_code == 200
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert events == [
+        {"committed": 2, "lines": 2},
+        {"committed": 4, "lines": 4},
+        {"committed": 5, "lines": 5},
+        {"status": "ok", "lines": 5, "committed": 5, "errors": 0},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_overlong_line(
+    async_client: AsyncClient,
+    api_token_fixture: dict,
+) -> None:
+    """A line over MAX_IMPORT_LINE_BYTES is reported without being buffered."""
+    from app.api.burn_ingest import MAX_IMPORT_LINE_BYTES
+
+    raw_token = api_token_fixture["raw_token"]
+    resp = await async_client.post(
+        "/api/burn/import",
+        headers={"Authorization": f"Bearer {raw_token}"},
+        content=b"x" * (MAX_IMPORT_LINE_BYTES + 1) + b"\n",
+    )
+
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert events[0]["line"] == 1
+    assert events[-1] == {"status": "ok", "lines": 1, "committed": 0, "errors": 1}
+
+
+@pytest.mark.asyncio
+async def test_import_over_a_real_server(
+    live_server: str,
+    async_session: AsyncSession,
+    api_token_fixture: dict,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Through uvicorn, every body chunk reaches the import while progress streams back."""
+    from app.api import burn_ingest
+
+    monkeypatch.setattr(burn_ingest, "IMPORT_CHUNK_SIZE", 2)
+    raw_token = api_token_fixture["raw_token"]
+    lines = [
+        json.dumps({
+            "tokens_burned": 100,
+            "source": "anthropic",
+            "verification": "extension_tracked",
+            "activity_date": "2025-06-03",
+            "session_id": f"sess_live_{index}",
+        })
+        for index in range(6)
+    ]
+
+    async def chunks():
+        for line in lines:
+            yield line.encode()
+            await asyncio.sleep(0.01)
+            yield b"\n"
+
+    async with AsyncClient(base_url=live_server) as client:
+        resp = await client.post(
+            "/api/burn/import",
+            headers={
+                "Authorization": f"Bearer {raw_token}",
+                "Content-Type": "application/x-ndjson",
+            },
+            content=chunks(),
+        )
+
+    assert resp.status_code == 200
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert events == [
+        {"committed": 2, "lines": 2},
+        {"committed": 4, "lines": 4},
+        {"committed": 6, "lines": 6},
+        {"status": "ok", "lines": 6, "committed": 6, "errors": 0},
+    ]
+    day_total = await async_session.scalar(
+        select(UserDailyBurn.tokens).where(
+            UserDailyBurn.user_id == api_token_fixture["user"].id,
+            UserDailyBurn.activity_date == datetime.date(2025, 6, 3),
+        )
+    )
+    assert day_total == 600
+
+
+# ---------------------------------------------------------------------------
+# Ingest mode parity
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(params=["single_statement", "sequential", "buffered"])
+def ingest_mode(request, monkeypatch) -> Generator[str, None, None]:
+    """Run a test once per burn_ingest_mode, discarding anything left buffered."""
+    from app.config import settings
+    from app.services.burn_buffer import burn_buffer
+
+    monkeypatch.setattr(settings, "burn_ingest_mode", request.param)
+    burn_buffer.clear()
+    yield request.param
+    burn_buffer.clear()
+
+
+@pytest.mark.asyncio
+async def test_ingest_modes_accumulate_day_total(
+    async_client: AsyncClient,
+    api_token_fixture: dict,
+    ingest_mode: str,
+) -> None:
+    """Both modes add tokens to the day total across sources and repeated rows."""
+    headers = {"Authorization": f"Bearer {api_token_fixture['raw_token']}"}
+    base = {"verification": "provider_verified", "activity_date": "2026-04-01"}
+
+    r1 = await async_client.post(
+        "/api/burn/ingest", headers=headers,
+        json={**base, "tokens_burned": 1000, "source": "anthropic"},
+    )
+    r2 = await async_client.post(
+        "/api/burn/ingest", headers=headers,
+        json={**base, "tokens_burned": 250, "source": "openai"},
+    )
+    r3 = await async_client.post(
+        "/api/burn/ingest", headers=headers,
+        json={**base, "tokens_burned": 50, "source": "anthropic"},
+    )
+
+    assert [r.status_code for r in (r1, r2, r3)] == [200, 200, 200]
+    assert [r.json()["day_total"] for r in (r1, r2, r3)] == [1000, 1250, 1300]
+
+
+@pytest.mark.asyncio
+async def test_ingest_modes_upsert_matched_project_row(
+    async_session: AsyncSession,
+    async_client: AsyncClient,
+    api_token_fixture: dict,
+    ingest_mode: str,
+) -> None:
+    """Both modes upsert into one row per project/day/source and return its id."""
+    user = api_token_fixture["user"]
+    project = Project(
+        owner_id=user.id,
+        title="Parity Repo",
+        github_repo_full_name="testowner/parity-repo",
+    )
+    async_session.add(project)
+    await async_session.commit()
+
+    from app.services.project_resolution import invalidate_project_cache
+
+    invalidate_project_cache(user.id)
+
+    headers = {"Authorization": f"Bearer {api_token_fixture['raw_token']}"}
+    payload = {
+        "tokens_burned": 700,
+        "source": "anthropic",
+        "verification": "provider_verified",
+        "activity_date": "2026-04-02",
+        "project_hint": "testowner/parity-repo",
+    }
+    r1 = await async_client.post("/api/burn/ingest", headers=headers, json=payload)
+    r2 = await async_client.post(
+        "/api/burn/ingest", headers=headers, json={**payload, "session_id": "sess_parity"}
+    )
+    r3 = await async_client.post(
+        "/api/burn/ingest", headers=headers, json={**payload, "session_id": "sess_parity"}
+    )
+
+    assert r1.json()["burn_id"] == r2.json()["burn_id"] == r3.json()["burn_id"]
+    assert r2.json()["project_id"] == project.id
+    assert [r.json()["day_total"] for r in (r1, r2, r3)] == [700, 1400, 1400]
+
+
+@pytest.mark.asyncio
+async def test_ingest_modes_dedupe_earlier_session_on_shared_row(
+    async_session: AsyncSession,
+    async_client: AsyncClient,
+    api_token_fixture: dict,
+    ingest_mode: str,
+) -> None:
+    """Replaying a session stays a no-op after a later session updated the same day row."""
+    user = api_token_fixture["user"]
+    project = Project(
+        owner_id=user.id,
+        title="Ledger Repo",
+        github_repo_full_name="testowner/ledger-repo",
+    )
+    async_session.add(project)
+    await async_session.commit()
+
+    from app.services.project_resolution import invalidate_project_cache
+
+    invalidate_project_cache(user.id)
+
+    headers = {"Authorization": f"Bearer {api_token_fixture['raw_token']}"}
+    payload = {
+        "tokens_burned": 400,
+        "source": "anthropic",
+        "verification": "provider_verified",
+        "activity_date": "2026-04-04",
+        "project_hint": "testowner/ledger-repo",
+    }
+    first = await async_client.post(
+        "/api/burn/ingest", headers=headers, json={**payload, "session_id": "sess_first"}
+    )
+    second = await async_client.post(
+        "/api/burn/ingest", headers=headers, json={**payload, "session_id": "sess_second"}
+    )
+    replay = await async_client.post(
+        "/api/burn/ingest", headers=headers, json={**payload, "session_id": "sess_first"}
+    )
+
+    assert first.json()["burn_id"] == second.json()["burn_id"] == replay.json()["burn_id"]
+    assert [r.json()["day_total"] for r in (first, second, replay)] == [400, 800, 800]
+
+
+@pytest.mark.asyncio
+async def test_batch_ingest_dedupes_earlier_session_on_shared_row(
+    async_session: AsyncSession,
+    async_client: AsyncClient,
+    api_token_fixture: dict,
+) -> None:
+    """The batch path consults the ledger, not the session_id left on the day row."""
+    user = api_token_fixture["user"]
+    project = Project(
+        owner_id=user.id,
+        title="Ledger Batch Repo",
+        github_repo_full_name="testowner/ledger-batch",
+    )
+    async_session.add(project)
+    await async_session.commit()
+
+    from app.services.project_resolution import invalidate_project_cache
+
+    invalidate_project_cache(user.id)
+
+    headers = {"Authorization": f"Bearer {api_token_fixture['raw_token']}"}
+    item = {
+        "tokens_burned": 300,
+        "source": "anthropic",
+        "verification": "provider_verified",
+        "activity_date": "2026-04-05",
+        "project_hint": "testowner/ledger-batch",
+    }
+    await async_client.post(
+        "/api/burn/ingest/batch", headers=headers,
+        json={"items": [{**item, "session_id": "sess_1"}, {**item, "session_id": "sess_2"}]},
+    )
+    resp = await async_client.post(
+        "/api/burn/ingest/batch", headers=headers,
+        json={"items": [{**item, "session_id": "sess_1"}, {**item, "session_id": "sess_3"}]},
+    )
+
+    assert resp.json()["day_totals"] == {"2026-04-05": 900}
+
+
+@pytest.mark.asyncio
+async def test_ingest_modes_reject_invalid_date(
+    async_client: AsyncClient,
+    api_token_fixture: dict,
+    ingest_mode: str,
+) -> None:
+    """Both modes reject a malformed activity_date with 400."""
+    resp = await async_client.post(
+        "/api/burn/ingest",
+        headers={"Authorization": f"Bearer {api_token_fixture['raw_token']}"},
+        json={
+            "tokens_burned": 100,
+            "source": "anthropic",
+            "verification": "provider_verified",
+            "activity_date": "2026/04/03",
+        },
+    )
+    assert resp.status_code == 400
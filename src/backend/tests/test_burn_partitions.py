@@ -0,0 +1,129 @@
+"""Tests for app.services.burn_partitions — monthly build_activities partition maintenance."""
+
+import datetime
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.build_activity import BuildActivity
+from app.models.project import Project
+from app.services import burn_partitions, burn_service
+
+TODAY = datetime.date(2026, 10, 16)
+
+
+@pytest.fixture
+def user_id(seed_test_data) -> str:
+    return seed_test_data["users"]["testuser1"].id
+
+
+async def _count(session: AsyncSession, table: str) -> int:
+    return (await session.execute(text(f"SELECT count(*) FROM {table}"))).scalar()
+
+
+def test_add_months_crosses_year_boundaries():
+    """add_months walks months forwards and backwards across years."""
+    assert burn_partitions.add_months(datetime.date(2026, 11, 1), 3) == datetime.date(2027, 2, 1)
+    assert burn_partitions.add_months(datetime.date(2026, 1, 1), -1) == datetime.date(2025, 12, 1)
+
+
+def test_partition_name():
+    """Partitions are named after their year and month."""
+    assert burn_partitions.partition_name(datetime.date(2026, 3, 1)) == "build_activities_y2026m03"
+
+
+@pytest.mark.asyncio
+async def test_create_partitions_is_idempotent(async_session: AsyncSession):
+    """Months from the current one through months_ahead get one partition each, once."""
+    created = await burn_partitions.create_partitions(async_session, 2, today=TODAY)
+
+    assert created == [
+        "build_activities_y2026m10",
+        "build_activities_y2026m11",
+        "build_activities_y2026m12",
+    ]
+    assert await burn_partitions.list_partitions(async_session) == [
+        datetime.date(2026, 10, 1),
+        datetime.date(2026, 11, 1),
+        datetime.date(2026, 12, 1),
+    ]
+    assert await burn_partitions.create_partitions(async_session, 2, today=TODAY) == []
+
+
+@pytest.mark.asyncio
+async def test_create_partition_moves_rows_out_of_default(
+    async_session: AsyncSession, user_id: str
+):
+    """Rows written before their month had a partition are relocated into it."""
+    day = datetime.date(2026, 11, 5)
+    await burn_service.log_session(async_session, user_id, 400, "anthropic", activity_date=day)
+    await async_session.commit()
+    assert await _count(async_session, burn_partitions.DEFAULT_PARTITION) == 1
+
+    await burn_partitions.create_partitions(async_session, 1, today=TODAY)
+
+    assert await _count(async_session, burn_partitions.DEFAULT_PARTITION) == 0
+    assert await _count(async_session, "build_activities_y2026m11") == 1
+    total = (
+        await async_session.execute(
+            select(func.sum(BuildActivity.tokens_burned)).where(BuildActivity.user_id == user_id)
+        )
+    ).scalar()
+    assert total == 400
+
+
+@pytest.mark.asyncio
+async def test_upsert_targets_monthly_partition(async_session: AsyncSession, user_id: str):
+    """ON CONFLICT on uq_build_activity_per_day still accumulates on a partitioned table."""
+    project = Project(owner_id=user_id, title="Partitioned")
+    async_session.add(project)
+    await burn_partitions.create_partitions(async_session, 0, today=TODAY)
+    for tokens in (100, 250):
+        await burn_service.log_session(
+            async_session, user_id, tokens, "anthropic", project_id=project.id, activity_date=TODAY
+        )
+    await async_session.commit()
+
+    rows = (
+        await async_session.execute(
+            text("SELECT tokens_burned FROM build_activities_y2026m10 WHERE user_id = :u"),
+            {"u": user_id},
+        )
+    ).scalars().all()
+    assert rows == [350]
+
+
+@pytest.mark.asyncio
+async def test_detach_partitions_archives_old_months(async_session: AsyncSession, user_id: str):
+    """Months before the cutoff are detached into the archive schema; rollups are untouched."""
+    await burn_partitions.create_partitions(async_session, 1, today=datetime.date(2026, 8, 1))
+    await burn_service.log_session(
+        async_session, user_id, 900, "anthropic", activity_date=datetime.date(2026, 8, 20)
+    )
+    await async_session.commit()
+
+    detached = await burn_partitions.detach_partitions(
+        async_session, datetime.date(2026, 9, 10), archive_schema="burn_archive_test"
+    )
+
+    assert detached == ["build_activities_y2026m08"]
+    assert await burn_partitions.list_partitions(async_session) == [datetime.date(2026, 9, 1)]
+    assert await _count(async_session, "burn_archive_test.build_activities_y2026m08") == 1
+    live = (
+        await async_session.execute(
+            select(func.count()).select_from(BuildActivity).where(BuildActivity.user_id == user_id)
+        )
+    ).scalar()
+    assert live == 0
+    summary = await burn_service.get_summary(async_session, user_id, weeks=520)
+    assert summary["total_tokens"] == 900
+
+
+@pytest.mark.asyncio
+async def test_detach_partitions_rejects_bad_schema_name(async_session: AsyncSession):
+    """The archive schema is interpolated into DDL, so it must be a plain identifier."""
+    with pytest.raises(ValueError):
+        await burn_partitions.detach_partitions(
+            async_session, TODAY, archive_schema="archive; DROP TABLE users"
+        )
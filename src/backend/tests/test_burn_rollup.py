@@ -0,0 +1,163 @@
+"""Tests for the user_daily_burn rollup — kept in step with build_activities writes."""
+
+import datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.build_activity import BuildActivity
+from app.models.user_daily_burn import UserDailyBurn
+from app.models.user_weekly_burn import UserWeeklyBurn
+from app.services import burn_service
+
+DAY = datetime.date.today() - datetime.timedelta(days=3)
+
+
+async def _rollup(session: AsyncSession, user_id: str) -> dict[datetime.date, int]:
+    result = await session.execute(
+        select(UserDailyBurn.activity_date, UserDailyBurn.tokens).where(
+            UserDailyBurn.user_id == user_id
+        )
+    )
+    return {row.activity_date: row.tokens for row in result.all()}
+
+
+async def _raw_totals(session: AsyncSession, user_id: str) -> dict[datetime.date, int]:
+    result = await session.execute(
+        select(BuildActivity.activity_date, func.sum(BuildActivity.tokens_burned))
+        .where(BuildActivity.user_id == user_id)
+        .group_by(BuildActivity.activity_date)
+    )
+    return {row[0]: int(row[1]) for row in result.all()}
+
+
+@pytest.fixture
+def user_id(seed_test_data) -> str:
+    return seed_test_data["users"]["testuser1"].id
+
+
+@pytest.mark.asyncio
+async def test_log_session_increments_rollup(async_session: AsyncSession, user_id: str):
+    """log_session adds its tokens to the day's rollup row."""
+    await burn_service.log_session(async_session, user_id, 400, "anthropic", activity_date=DAY)
+    await burn_service.log_session(async_session, user_id, 100, "openai", activity_date=DAY)
+    await async_session.commit()
+
+    assert await _rollup(async_session, user_id) == {DAY: 500}
+
+
+@pytest.mark.asyncio
+async def test_update_burn_applies_delta(async_session: AsyncSession, user_id: str):
+    """update_burn moves the rollup by the difference in tokens."""
+    await burn_service.log_session(async_session, user_id, 400, "anthropic", activity_date=DAY)
+    await burn_service.log_session(async_session, user_id, 100, "openai", activity_date=DAY)
+    await async_session.commit()
+    record = (
+        await async_session.execute(
+            select(BuildActivity).where(
+                BuildActivity.user_id == user_id, BuildActivity.source == "anthropic"
+            )
+        )
+    ).scalar_one()
+
+    await burn_service.update_burn(async_session, record.id, user_id, tokens_burned=250)
+
+    assert await _rollup(async_session, user_id) == {DAY: 350}
+
+
+@pytest.mark.asyncio
+async def test_delete_burn_subtracts(async_session: AsyncSession, user_id: str):
+    """delete_burn removes the record's tokens from the rollup."""
+    await burn_service.log_session(async_session, user_id, 400, "anthropic", activity_date=DAY)
+    await burn_service.log_session(async_session, user_id, 100, "openai", activity_date=DAY)
+    await async_session.commit()
+    record = (
+        await async_session.execute(
+            select(BuildActivity).where(
+                BuildActivity.user_id == user_id, BuildActivity.source == "openai"
+            )
+        )
+    ).scalar_one()
+
+    await burn_service.delete_burn(async_session, record.id, user_id)
+
+    assert await _rollup(async_session, user_id) == {DAY: 400}
+
+
+@pytest.mark.asyncio
+async def test_upsert_activities_increments_rollup(async_session: AsyncSession, user_id: str):
+    """Multi-row upserts add each row's tokens to its day."""
+    other_day = DAY - datetime.timedelta(days=1)
+    rows = [
+        {
+            "id": f"01ROLLUP{i:018d}",
+            "user_id": user_id,
+            "project_id": None,
+            "activity_date": day,
+            "tokens_burned": tokens,
+            "source": "anthropic",
+            "verification": "provider_verified",
+            "tool": None,
+            "session_id": None,
+            "token_precision": "approximate",
+            "metadata_": None,
+        }
+        for i, (day, tokens) in enumerate([(DAY, 300), (DAY, 200), (other_day, 50)])
+    ]
+    await burn_service.upsert_activities(async_session, rows)
+    await async_session.commit()
+
+    assert await _rollup(async_session, user_id) == {DAY: 500, other_day: 50}
+
+
+@pytest.mark.asyncio
+async def test_rebuild_matches_build_activities(async_session: AsyncSession, user_id: str):
+    """rebuild_burn_rollups recomputes totals for rows written around the rollup."""
+    async_session.add_all(
+        [
+            BuildActivity(user_id=user_id, activity_date=DAY, tokens_burned=700, source="anthropic"),
+            BuildActivity(user_id=user_id, activity_date=DAY, tokens_burned=300, source="openai"),
+        ]
+    )
+    await async_session.commit()
+    assert await _rollup(async_session, user_id) == {}
+
+    await burn_service.rebuild_burn_rollups(async_session)
+
+    assert await _rollup(async_session, user_id) == await _raw_totals(async_session, user_id)
+
+
+@pytest.mark.asyncio
+async def test_get_summary_reads_rollup(async_session: AsyncSession, user_id: str):
+    """get_summary reports the day totals maintained in the rollup."""
+    await burn_service.log_session(async_session, user_id, 1200, "anthropic", activity_date=DAY)
+    await burn_service.log_session(async_session, user_id, 800, "openai", activity_date=DAY)
+    await async_session.commit()
+
+    summary = await burn_service.get_summary(async_session, user_id)
+
+    assert summary["days_active"] == 1
+    assert summary["total_tokens"] == 2000
+    assert summary["daily_activity"] == [{"date": DAY, "tokens": 2000}]
+
+
+@pytest.mark.asyncio
+async def test_weekly_rollup_follows_daily_writes(async_session: AsyncSession, user_id: str):
+    """Days in the same ISO week accumulate into one user_weekly_burn row."""
+    monday = burn_service.week_start(DAY)
+    await burn_service.log_session(async_session, user_id, 300, "anthropic", activity_date=monday)
+    await burn_service.log_session(
+        async_session, user_id, 200, "anthropic",
+        activity_date=monday + datetime.timedelta(days=6),
+    )
+    await async_session.commit()
+
+    weekly = (
+        await async_session.execute(
+            select(UserWeeklyBurn.week_start, UserWeeklyBurn.tokens).where(
+                UserWeeklyBurn.user_id == user_id
+            )
+        )
+    ).all()
+    assert [(row.week_start, row.tokens) for row in weekly] == [(monday, 500)]
@@ -1,28 +1,64 @@
-"""Unit tests for burn_service — get_summary and get_receipt logic."""
+"""Tests for burn_service — get_summary and get_receipt aggregation.
+
+Weekly figures (active weeks, streaks, peak weeks) are computed in SQL, so
+these run against the test database with rows written through log_session.
+"""
 
 import datetime
-from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from ulid import ULID
 
+from app.models.project import Project
 from app.services import burn_service
 
+# Wide enough that the fixed 2026 dates below stay inside the summary window
+WEEKS = 520
+
+
+@pytest.fixture
+def user_id(seed_test_data) -> str:
+    return seed_test_data["users"]["testuser1"].id
+
 
-def _make_row(date_str: str, tokens: int):
-    """Create a mock SQLAlchemy result row."""
-    row = MagicMock()
-    row.activity_date = datetime.date.fromisoformat(date_str)
-    row.tokens = tokens
-    return row
+@pytest.fixture
+async def project_id(async_session: AsyncSession, user_id: str) -> str:
+    project = Project(owner_id=user_id, title="Receipt Project")
+    async_session.add(project)
+    await async_session.flush()
+    return project.id
 
 
-def _mock_session(rows):
-    """Return a mock AsyncSession whose execute() returns given rows."""
-    mock_result = MagicMock()
-    mock_result.all.return_value = rows
-    session = AsyncMock()
-    session.execute = AsyncMock(return_value=mock_result)
-    return session
+async def _log(
+    session: AsyncSession,
+    user_id: str,
+    days: list[tuple[str, int]],
+    project_id: str | None = None,
+) -> None:
+    """Record one burn per (ISO date, tokens) pair and commit."""
+    for date_str, tokens in days:
+        await burn_service.log_session(
+            session,
+            user_id,
+            tokens,
+            "anthropic",
+            project_id=project_id,
+            activity_date=datetime.date.fromisoformat(date_str),
+        )
+    await session.commit()
+
+
+# ---------------------------------------------------------------------------
+# week_start
+# ---------------------------------------------------------------------------
+
+
+def test_week_start_is_iso_monday():
+    """week_start maps every day of an ISO week to its Monday."""
+    monday = datetime.date(2026, 2, 9)
+    for offset in range(7):
+        assert burn_service.week_start(monday + datetime.timedelta(days=offset)) == monday
 
 
 # ---------------------------------------------------------------------------
@@ -31,10 +67,9 @@ def _mock_session(rows):
 
 
 @pytest.mark.asyncio
-async def test_get_summary_empty():
+async def test_get_summary_empty(async_session: AsyncSession, user_id: str):
     """Empty result set returns all-zero summary."""
-    session = _mock_session([])
-    result = await burn_service.get_summary(session, "user1")
+    result = await burn_service.get_summary(async_session, user_id, weeks=WEEKS)
 
     assert result["days_active"] == 0
     assert result["total_tokens"] == 0
@@ -44,10 +79,10 @@ async def test_get_summary_empty():
 
 
 @pytest.mark.asyncio
-async def test_get_summary_single_day():
+async def test_get_summary_single_day(async_session: AsyncSession, user_id: str):
     """Single active day returns correct totals."""
-    session = _mock_session([_make_row("2026-02-10", 5000)])
-    result = await burn_service.get_summary(session, "user1")
+    await _log(async_session, user_id, [("2026-02-10", 5000)])
+    result = await burn_service.get_summary(async_session, user_id, weeks=WEEKS)
 
     assert result["days_active"] == 1
     assert result["total_tokens"] == 5000
@@ -58,14 +93,13 @@ async def test_get_summary_single_day():
 
 
 @pytest.mark.asyncio
-async def test_get_summary_multi_day_consecutive_weeks():
+async def test_get_summary_multi_day_consecutive_weeks(async_session: AsyncSession, user_id: str):
     """Two consecutive weeks produce streak=2 and active_weeks=2."""
-    rows = [
-        _make_row("2026-01-12", 1000),  # ISO week 3
-        _make_row("2026-01-19", 2000),  # ISO week 4
-    ]
-    session = _mock_session(rows)
-    result = await burn_service.get_summary(session, "user1")
+    await _log(async_session, user_id, [
+        ("2026-01-12", 1000),  # ISO week 3
+        ("2026-01-19", 2000),  # ISO week 4
+    ])
+    result = await burn_service.get_summary(async_session, user_id, weeks=WEEKS)
 
     assert result["days_active"] == 2
     assert result["total_tokens"] == 3000
@@ -74,14 +108,13 @@ async def test_get_summary_multi_day_consecutive_weeks():
 
 
 @pytest.mark.asyncio
-async def test_get_summary_non_consecutive_weeks():
+async def test_get_summary_non_consecutive_weeks(async_session: AsyncSession, user_id: str):
     """Gap in weeks resets streak."""
-    rows = [
-        _make_row("2026-01-05", 1000),  # ISO week 2
-        _make_row("2026-01-26", 2000),  # ISO week 5 (gap: weeks 3,4 missing)
-    ]
-    session = _mock_session(rows)
-    result = await burn_service.get_summary(session, "user1")
+    await _log(async_session, user_id, [
+        ("2026-01-05", 1000),  # ISO week 2
+        ("2026-01-26", 2000),  # ISO week 5 (gap: weeks 3,4 missing)
+    ])
+    result = await burn_service.get_summary(async_session, user_id, weeks=WEEKS)
 
     assert result["active_weeks"] == 2
     # Streak from the most recent end: only week 5 is alone at the tail
@@ -89,15 +122,32 @@ async def test_get_summary_non_consecutive_weeks():
 
 
 @pytest.mark.asyncio
-async def test_get_summary_multiple_days_same_week():
+async def test_get_summary_streak_counts_back_from_latest_run(
+    async_session: AsyncSession, user_id: str
+):
+    """Only the run ending at the most recent active week counts toward the streak."""
+    await _log(async_session, user_id, [
+        ("2025-12-22", 500),   # ISO 2025-W52
+        ("2025-12-29", 500),   # ISO 2026-W01 (year boundary)
+        ("2026-01-05", 500),   # ISO 2026-W02
+        ("2026-02-02", 500),   # ISO 2026-W06 (gap)
+        ("2026-02-09", 500),   # ISO 2026-W07
+    ])
+    result = await burn_service.get_summary(async_session, user_id, weeks=WEEKS)
+
+    assert result["active_weeks"] == 5
+    assert result["weekly_streak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_summary_multiple_days_same_week(async_session: AsyncSession, user_id: str):
     """Multiple days in the same week count as one active week."""
-    rows = [
-        _make_row("2026-02-09", 1000),  # Mon ISO week 7
-        _make_row("2026-02-11", 2000),  # Wed ISO week 7
-        _make_row("2026-02-13", 3000),  # Fri ISO week 7
-    ]
-    session = _mock_session(rows)
-    result = await burn_service.get_summary(session, "user1")
+    await _log(async_session, user_id, [
+        ("2026-02-09", 1000),  # Mon ISO week 7
+        ("2026-02-11", 2000),  # Wed ISO week 7
+        ("2026-02-13", 3000),  # Fri ISO week 7
+    ])
+    result = await burn_service.get_summary(async_session, user_id, weeks=WEEKS)
 
     assert result["days_active"] == 3
     assert result["total_tokens"] == 6000
@@ -105,28 +155,98 @@ async def test_get_summary_multiple_days_same_week():
     assert result["weekly_streak"] == 1
 
 
+@pytest.mark.asyncio
+async def test_get_summary_weeks_ignore_activity_before_cutoff(
+    async_session: AsyncSession, user_id: str
+):
+    """A day just before the cutoff counts toward neither the days nor the weeks.
+
+    It usually falls in the same ISO week as the cutoff, which must not
+    become active (and extend the streak) because of it.
+    """
+    weeks = 4
+    cutoff = datetime.date.today() - datetime.timedelta(weeks=weeks)
+    await _log(async_session, user_id, [
+        ((cutoff - datetime.timedelta(days=1)).isoformat(), 1000),
+        ((cutoff + datetime.timedelta(weeks=1)).isoformat(), 2000),
+    ])
+    result = await burn_service.get_summary(async_session, user_id, weeks=weeks)
+
+    assert result["days_active"] == 1
+    assert result["total_tokens"] == 2000
+    assert result["active_weeks"] == 1
+    assert result["weekly_streak"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_summary_counts_cutoff_week_from_the_cutoff_on(
+    async_session: AsyncSession, user_id: str
+):
+    """Activity on the cutoff day makes the cutoff's week active and joins the streak."""
+    weeks = 4
+    cutoff = datetime.date.today() - datetime.timedelta(weeks=weeks)
+    await _log(async_session, user_id, [
+        (cutoff.isoformat(), 1000),
+        ((cutoff + datetime.timedelta(weeks=1)).isoformat(), 2000),
+    ])
+    result = await burn_service.get_summary(async_session, user_id, weeks=weeks)
+
+    assert result["days_active"] == 2
+    assert result["active_weeks"] == 2
+    assert result["weekly_streak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_summaries_matches_per_user_summaries(
+    async_session: AsyncSession, seed_test_data
+):
+    """get_summaries returns the same dict get_summary would, for every user."""
+    users = seed_test_data["users"]
+    first, second, idle = (users[name].id for name in ("testuser1", "testuser2", "testuser3"))
+    await _log(async_session, first, [("2026-01-12", 1000), ("2026-01-19", 2000)])
+    await _log(async_session, second, [("2026-01-05", 700), ("2026-01-26", 300)])
+
+    result = await burn_service.get_summaries(async_session, [first, second, idle], weeks=WEEKS)
+
+    assert set(result) == {first, second, idle}
+    for user_id in (first, second, idle):
+        assert result[user_id] == await burn_service.get_summary(
+            async_session, user_id, weeks=WEEKS
+        )
+    assert result[first]["weekly_streak"] == 2
+    assert result[second]["weekly_streak"] == 1
+    assert result[idle]["days_active"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_summaries_empty_user_list(async_session: AsyncSession):
+    """No user ids means no query and an empty result."""
+    assert await burn_service.get_summaries(async_session, [], weeks=WEEKS) == {}
+
+
 # ---------------------------------------------------------------------------
 # get_receipt
 # ---------------------------------------------------------------------------
 
 
 @pytest.mark.asyncio
-async def test_get_receipt_none_when_no_activity():
+async def test_get_receipt_none_when_no_activity(
+    async_session: AsyncSession, user_id: str, project_id: str
+):
     """Returns None when there is no activity for a project."""
-    session = _mock_session([])
-    result = await burn_service.get_receipt(session, "user1", "proj1")
+    result = await burn_service.get_receipt(async_session, user_id, project_id)
 
     assert result is None
 
 
 @pytest.mark.asyncio
-async def test_get_receipt_single_day():
+async def test_get_receipt_single_day(async_session: AsyncSession, user_id: str, project_id: str):
     """Single-day project: duration_weeks=1, peak_week=total."""
-    session = _mock_session([_make_row("2026-02-10", 8000)])
-    result = await burn_service.get_receipt(session, "user1", "proj1")
+    await _log(async_session, user_id, [("2026-02-10", 8000)], project_id=project_id)
+    result = await burn_service.get_receipt(async_session, user_id, project_id)
 
     assert result is not None
-    assert result["project_id"] == "proj1"
+    assert result["project_id"] == project_id
     assert result["total_tokens"] == 8000
     assert result["duration_weeks"] == 1
     assert result["peak_week_tokens"] == 8000
@@ -134,15 +254,14 @@ async def test_get_receipt_single_day():
 
 
 @pytest.mark.asyncio
-async def test_get_receipt_multi_week():
+async def test_get_receipt_multi_week(async_session: AsyncSession, user_id: str, project_id: str):
     """Multi-week project: duration_weeks spans first to last day."""
-    rows = [
-        _make_row("2026-01-05", 3000),  # week 2
-        _make_row("2026-01-12", 4000),  # week 3
-        _make_row("2026-01-19", 2000),  # week 4
-    ]
-    session = _mock_session(rows)
-    result = await burn_service.get_receipt(session, "user1", "proj1")
+    await _log(async_session, user_id, [
+        ("2026-01-05", 3000),  # week 2
+        ("2026-01-12", 4000),  # week 3
+        ("2026-01-19", 2000),  # week 4
+    ], project_id=project_id)
+    result = await burn_service.get_receipt(async_session, user_id, project_id)
 
     assert result is not None
     assert result["total_tokens"] == 9000
@@ -152,20 +271,99 @@ async def test_get_receipt_multi_week():
 
 
 @pytest.mark.asyncio
-async def test_get_receipt_peak_week_correct():
+async def test_get_receipt_peak_week_correct(
+    async_session: AsyncSession, user_id: str, project_id: str
+):
     """Peak week is the single week with the highest total."""
-    rows = [
-        _make_row("2026-02-02", 1000),  # week 6
-        _make_row("2026-02-03", 1000),  # week 6
-        _make_row("2026-02-09", 9000),  # week 7
-    ]
-    session = _mock_session(rows)
-    result = await burn_service.get_receipt(session, "user1", "proj1")
+    await _log(async_session, user_id, [
+        ("2026-02-02", 1000),  # week 6
+        ("2026-02-03", 1000),  # week 6
+        ("2026-02-09", 9000),  # week 7
+    ], project_id=project_id)
+    result = await burn_service.get_receipt(async_session, user_id, project_id)
 
     assert result is not None
     assert result["peak_week_tokens"] == 9000
 
 
+@pytest.mark.asyncio
+async def test_get_receipt_peak_week_sums_days(
+    async_session: AsyncSession, user_id: str, project_id: str
+):
+    """Several smaller days in one week can outweigh a single big day."""
+    await _log(async_session, user_id, [
+        ("2026-02-02", 4000),  # week 6
+        ("2026-02-04", 4000),  # week 6
+        ("2026-02-09", 6000),  # week 7
+    ], project_id=project_id)
+    result = await burn_service.get_receipt(async_session, user_id, project_id)
+
+    assert result is not None
+    assert result["peak_week_tokens"] == 8000
+
+
+# ---------------------------------------------------------------------------
+# get_breakdown
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_get_breakdown_splits_every_dimension(
+    async_session: AsyncSession, user_id: str, project_id: str
+):
+    """One grouping-sets query yields per-source, tool, project and verification totals."""
+    day = datetime.date.today()
+    await burn_service.upsert_activities(async_session, [
+        {
+            "id": str(ULID()), "user_id": user_id, "project_id": project,
+            "activity_date": day, "tokens_burned": tokens, "source": source,
+            "verification": verification, "tool": tool, "session_id": None,
+            "token_precision": "approximate", "metadata_": None,
+        }
+        for project, source, tool, verification, tokens in [
+            (project_id, "anthropic", "claude_code", "extension_tracked", 500),
+            (None, "openai", "codex", "self_reported", 200),
+            (None, "anthropic", None, "self_reported", 100),
+        ]
+    ])
+    await async_session.commit()
+
+    result = await burn_service.get_breakdown(async_session, user_id)
+
+    assert result["total_tokens"] == 800
+    assert result["by_source"] == [
+        {"key": "anthropic", "tokens": 600},
+        {"key": "openai", "tokens": 200},
+    ]
+    assert result["by_tool"] == [
+        {"key": "claude_code", "tokens": 500},
+        {"key": "codex", "tokens": 200},
+        {"key": None, "tokens": 100},
+    ]
+    assert result["by_project"] == [
+        {"key": project_id, "tokens": 500},
+        {"key": None, "tokens": 300},
+    ]
+    assert result["by_verification"] == [
+        {"key": "extension_tracked", "tokens": 500},
+        {"key": "self_reported", "tokens": 300},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_breakdown_empty(async_session: AsyncSession, user_id: str):
+    """No rows in the window gives zero totals and empty splits."""
+    result = await burn_service.get_breakdown(async_session, user_id)
+
+    assert result == {
+        "total_tokens": 0,
+        "by_source": [],
+        "by_tool": [],
+        "by_project": [],
+        "by_verification": [],
+    }
+
+
 # ---------------------------------------------------------------------------
 # Burn GraphQL types
 # ---------------------------------------------------------------------------
@@ -177,13 +375,14 @@ def test_burn_types_importable():
 
     day = BurnDayType(date=datetime.date(2026, 2, 10), tokens=5000)
     assert day.tokens == 5000
+    row = {"date": day.date, "tokens": day.tokens}
 
     receipt = BurnReceiptType(
         project_id="p1",
         total_tokens=5000,
         duration_weeks=1,
         peak_week_tokens=5000,
-        daily_activity=[day],
+        _days=[row],
     )
     assert receipt.total_tokens == 5000
 
@@ -193,6 +392,6 @@ def test_burn_types_importable():
         active_weeks=1,
         total_weeks=52,
         weekly_streak=1,
-        daily_activity=[day],
+        _days=[row],
     )
     assert summary.weekly_streak == 1
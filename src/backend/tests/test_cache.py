@@ -0,0 +1,117 @@
+"""Tests for the bounded TTL-LRU cache — expiry, eviction, owner invalidation, metrics."""
+
+import pytest
+
+from app.services.cache import MISSING, TTLCache, cache_metrics
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(**overrides) -> TTLCache:
+    options = {"name": "test", "max_size": 3, "ttl_seconds": 60, "clock": FakeClock()}
+    options.update(overrides)
+    return TTLCache(**options)
+
+
+def test_get_returns_missing_for_absent_key():
+    """An absent key yields MISSING, distinct from a cached None."""
+    cache = _cache()
+    cache.set("none", None)
+
+    assert cache.get("absent") is MISSING
+    assert cache.get("none") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_entries_expire_after_ttl():
+    """Entries are served until their TTL passes, then counted as expired."""
+    clock = FakeClock()
+    cache = _cache(clock=clock)
+    cache.set("k", "v")
+
+    clock.now += 59
+    assert cache.get("k") == "v"
+    clock.now += 1
+    assert cache.get("k") is MISSING
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+
+def test_negative_results_use_their_own_ttl():
+    """A None value lives for negative_ttl_seconds."""
+    clock = FakeClock()
+    cache = _cache(clock=clock, negative_ttl_seconds=5)
+    cache.set("miss", None)
+    cache.set("hit", "v")
+
+    clock.now += 6
+    assert "miss" not in cache
+    assert "hit" in cache
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Beyond max_size the least recently read or written entry goes first."""
+    cache = _cache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.stats.evictions == 1
+
+
+def test_invalidate_owner_drops_only_that_owners_entries():
+    """invalidate_owner uses the owner index and leaves other owners alone."""
+    cache = _cache(max_size=10)
+    cache.set(("u1", "x"), 1, owner="u1")
+    cache.set(("u1", "y"), 2, owner="u1")
+    cache.set(("u2", "x"), 3, owner="u2")
+
+    assert cache.invalidate_owner("u1") == 2
+    assert len(cache) == 1
+    assert ("u2", "x") in cache
+    assert cache.invalidate_owner("u1") == 0
+
+
+def test_evicted_entries_leave_the_owner_index():
+    """Eviction keeps the owner index in step with the entries."""
+    cache = _cache(max_size=1)
+    cache.set(("u1", "x"), 1, owner="u1")
+    cache.set(("u2", "x"), 2, owner="u2")
+
+    assert cache.invalidate_owner("u1") == 0
+    assert cache.invalidate_owner("u2") == 1
+
+
+def test_cache_metrics_reports_registered_caches():
+    """Every cache appears in cache_metrics under its name."""
+    cache = _cache(name="metrics_test")
+    cache.set("k", "v")
+    cache.get("k")
+    cache.get("other")
+
+    stats = cache_metrics()["metrics_test"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+    assert stats["max_size"] == 3
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_cache_counters(async_client):
+    """/metrics renders every registered cache in Prometheus text format."""
+    _cache(name="endpoint_test").get("absent")
+
+    resp = await async_client.get("/metrics")
+
+    assert resp.status_code == 200
+    assert 'fyt_cache_misses_total{cache="endpoint_test"} 1' in resp.text
+    assert 'fyt_cache_max_size{cache="api_token"} ' in resp.text
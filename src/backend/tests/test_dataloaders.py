@@ -0,0 +1,356 @@
+"""Tests for app.graphql.dataloaders — request-scoped batching of per-object lookups."""
+
+import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from ulid import ULID
+
+from app.graphql.context import Context
+from app.graphql.dataloaders import Loaders
+from app.graphql.schema import schema
+from app.models.enums import (
+    CollaboratorStatus,
+    MemberRole,
+    MemberStatus,
+    ProjectStatus,
+    TribeStatus,
+)
+from app.models.project import Project, project_collaborators
+from app.models.tribe import Tribe, TribeOpenRole, tribe_members
+from app.services import burn_service, feed_service
+
+BUILDERS_WITH_BURN_QUERY = """
+query {
+  builders(limit: 10) {
+    username
+    burnSummary(weeks: 520) {
+      totalTokens
+      daysActive
+    }
+  }
+}
+"""
+
+
+_SAVEPOINT_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+@pytest.fixture
+def statements(async_session: AsyncSession):
+    """Record the SQL of every query the session runs.
+
+    The SAVEPOINT statements of the test's nested transaction are left out,
+    so counts reflect only the queries under test.
+    """
+    executed: list[str] = []
+    engine = async_session.bind.sync_engine
+
+    def _record(_conn, _cursor, statement, _params, _context, _executemany):
+        if not statement.lstrip().upper().startswith(_SAVEPOINT_PREFIXES):
+            executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+def _touching(statements: list[str], table: str) -> list[str]:
+    return [s for s in statements if f"FROM {table}" in s or f"JOIN {table}" in s]
+
+
+async def _seed_projects(session: AsyncSession, users: dict) -> list[Project]:
+    """One project per user, each with the next user as a collaborator."""
+    owners = list(users.values())
+    projects = []
+    for owner in owners:
+        project = Project(
+            id=str(ULID()),
+            owner_id=owner.id,
+            title=f"Project {owner.username}",
+            status=ProjectStatus.IN_PROGRESS,
+        )
+        session.add(project)
+        projects.append(project)
+    await session.flush()
+    for i, project in enumerate(projects):
+        await session.execute(
+            project_collaborators.insert().values(
+                project_id=project.id,
+                user_id=owners[(i + 1) % len(owners)].id,
+                role="Reviewer",
+                status=CollaboratorStatus.CONFIRMED if i == 0 else CollaboratorStatus.PENDING,
+            )
+        )
+    await session.commit()
+    return projects
+
+
+@pytest.fixture
+def summaries_calls(monkeypatch) -> list[tuple[list[str], int]]:
+    """Record every burn_service.get_summaries call made through the loader."""
+    calls: list[tuple[list[str], int]] = []
+    original = burn_service.get_summaries
+
+    async def _recording(session, user_ids, weeks=52):
+        calls.append((list(user_ids), weeks))
+        return await original(session, user_ids, weeks=weeks)
+
+    monkeypatch.setattr(burn_service, "get_summaries", _recording)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_builder_list_burn_summaries_use_one_query(
+    async_session: AsyncSession, seed_test_data, summaries_calls
+):
+    """burnSummary on every builder in a list resolves through one batched call."""
+    users = seed_test_data["users"]
+    await burn_service.log_session(
+        async_session, users["testuser1"].id, 1200, "anthropic",
+        activity_date=datetime.date(2026, 2, 10),
+    )
+    await async_session.commit()
+
+    result = await schema.execute(
+        BUILDERS_WITH_BURN_QUERY, context_value=Context(session=async_session)
+    )
+
+    assert result.errors is None, result.errors
+    by_username = {b["username"]: b["burnSummary"] for b in result.data["builders"]}
+    assert by_username["testuser1"] == {"totalTokens": 1200, "daysActive": 1}
+    assert by_username["testuser2"] == {"totalTokens": 0, "daysActive": 0}
+    assert len(summaries_calls) == 1
+    assert sorted(summaries_calls[0][0]) == sorted(u.id for u in users.values())
+
+
+@pytest.mark.asyncio
+async def test_burn_summary_loader_groups_by_window(
+    async_session: AsyncSession, seed_test_data, summaries_calls
+):
+    """Aliased root burnSummary fields batch per distinct weeks argument."""
+    users = seed_test_data["users"]
+    query = """
+    query ($a: ID!, $b: ID!) {
+      a: burnSummary(userId: $a, weeks: 52) { totalWeeks }
+      b: burnSummary(userId: $b, weeks: 52) { totalWeeks }
+      c: burnSummary(userId: $a, weeks: 4) { totalWeeks }
+    }
+    """
+    result = await schema.execute(
+        query,
+        variable_values={"a": users["testuser1"].id, "b": users["testuser2"].id},
+        context_value=Context(session=async_session),
+    )
+
+    assert result.errors is None, result.errors
+    assert result.data == {
+        "a": {"totalWeeks": 52},
+        "b": {"totalWeeks": 52},
+        "c": {"totalWeeks": 4},
+    }
+    assert sorted(weeks for _ids, weeks in summaries_calls) == [4, 52]
+
+
+@pytest.mark.asyncio
+async def test_project_list_collaborators_use_one_query(
+    async_session: AsyncSession, seed_test_data, statements
+):
+    """Owners and collaborators of every listed project load in one batch each."""
+    users = seed_test_data["users"]
+    await _seed_projects(async_session, users)
+    statements.clear()
+
+    query = """
+    query {
+      projects(limit: 10) {
+        title
+        owner { username }
+        collaborators { role status user { username } }
+      }
+    }
+    """
+    result = await schema.execute(query, context_value=Context(session=async_session))
+
+    assert result.errors is None, result.errors
+    by_title = {p["title"]: p for p in result.data["projects"]}
+    assert by_title["Project testuser1"]["owner"] == {"username": "testuser1"}
+    assert by_title["Project testuser1"]["collaborators"] == [
+        {"role": "Reviewer", "status": "CONFIRMED", "user": {"username": "testuser2"}}
+    ]
+    assert by_title["Project testuser2"]["collaborators"][0]["status"] == "PENDING"
+    assert len(_touching(statements, "project_collaborators")) == 1
+
+
+@pytest.mark.asyncio
+async def test_tribe_list_members_and_roles_use_one_query(
+    async_session: AsyncSession, seed_test_data, statements
+):
+    """Membership rows and open roles of every listed tribe load in one batch each."""
+    users = seed_test_data["users"]
+    owner, member = users["testuser1"], users["testuser2"]
+    for name in ("Alpha", "Beta"):
+        tribe = Tribe(id=str(ULID()), owner_id=owner.id, name=name, status=TribeStatus.OPEN)
+        async_session.add(tribe)
+        await async_session.flush()
+        async_session.add(TribeOpenRole(tribe_id=tribe.id, title=f"{name} role"))
+        await async_session.execute(
+            tribe_members.insert().values(
+                [
+                    {"tribe_id": tribe.id, "user_id": owner.id,
+                     "role": MemberRole.OWNER, "status": MemberStatus.ACTIVE},
+                    {"tribe_id": tribe.id, "user_id": member.id,
+                     "role": MemberRole.MEMBER, "status": MemberStatus.PENDING},
+                ]
+            )
+        )
+    await async_session.commit()
+    statements.clear()
+
+    query = """
+    query {
+      tribes(limit: 10) {
+        name
+        owner { username }
+        members { role status user { username } }
+        openRoles { title }
+      }
+    }
+    """
+    result = await schema.execute(query, context_value=Context(session=async_session))
+
+    assert result.errors is None, result.errors
+    by_name = {t["name"]: t for t in result.data["tribes"]}
+    assert by_name["Alpha"]["owner"] == {"username": "testuser1"}
+    assert by_name["Alpha"]["openRoles"] == [{"title": "Alpha role"}]
+    assert sorted(
+        (m["user"]["username"], m["role"], m["status"]) for m in by_name["Beta"]["members"]
+    ) == [("testuser1", "OWNER", "ACTIVE"), ("testuser2", "MEMBER", "PENDING")]
+    assert len(_touching(statements, "tribe_members")) == 1
+    assert len(_touching(statements, "tribe_open_roles")) == 1
+
+
+@pytest.mark.asyncio
+async def test_collaborator_loads_prime_user_loader(
+    async_session: AsyncSession, seed_test_data, statements
+):
+    """Users fetched as collaborators are served from the users loader afterwards."""
+    users = seed_test_data["users"]
+    projects = await _seed_projects(async_session, users)
+    loaders = Loaders(async_session)
+
+    collaborators = await loaders.collaborators_by_project.load(projects[0].id)
+    statements.clear()
+    user = await loaders.users.load(collaborators[0].user.id)
+
+    assert user.username == "testuser2"
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_feed_actors_use_one_query(
+    async_session: AsyncSession, seed_test_data, statements
+):
+    """Actors of a whole feed page resolve through one batched users query."""
+    users = list(seed_test_data["users"].values())
+    for i in range(6):
+        await feed_service.create_event(
+            async_session,
+            event_type="project_created",
+            actor_id=users[i % len(users)].id,
+            target_type="project",
+            target_id=str(ULID()),
+            metadata={"project_title": f"Project {i}"},
+        )
+    await async_session.commit()
+    statements.clear()
+
+    query = "query { feed(limit: 20) { metadata actor { id username } } }"
+    result = await schema.execute(query, context_value=Context(session=async_session))
+
+    assert result.errors is None, result.errors
+    ids = {u.id: u.username for u in users}
+    for feed_event in result.data["feed"]:
+        assert feed_event["actor"]["username"] == ids[feed_event["actor"]["id"]]
+    assert len(_touching(statements, "users")) == 1
+
+
+@pytest.mark.asyncio
+async def test_user_query_loads_only_selected_relationships(
+    async_session: AsyncSession, seed_test_data, statements
+):
+    """A query for a user's display name runs no relationship queries."""
+    await _seed_projects(async_session, seed_test_data["users"])
+    statements.clear()
+
+    result = await schema.execute(
+        '{ user(username: "testuser1") { displayName avatarUrl } }',
+        context_value=Context(session=async_session),
+    )
+
+    assert result.errors is None, result.errors
+    assert result.data["user"]["displayName"]
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_user_query_loads_selected_collaborators(
+    async_session: AsyncSession, seed_test_data, statements
+):
+    """Selecting projects' collaborators loads projects and collaborators, not skills."""
+    await _seed_projects(async_session, seed_test_data["users"])
+    statements.clear()
+
+    result = await schema.execute(
+        """
+        {
+          user(username: "testuser1") {
+            projects { title collaborators { user { username } } }
+          }
+        }
+        """,
+        context_value=Context(session=async_session),
+    )
+
+    assert result.errors is None, result.errors
+    assert result.data["user"]["projects"] == [
+        {"title": "Project testuser1", "collaborators": [{"user": {"username": "testuser2"}}]}
+    ]
+    assert len(_touching(statements, "project_collaborators")) == 1
+    assert _touching(statements, "user_skills") == []
+    assert _touching(statements, "tribe_members") == []
+
+
+@pytest.mark.asyncio
+async def test_nested_lazy_fields_batch_per_level(
+    async_session: AsyncSession, seed_test_data, statements
+):
+    """Relationships nested under a list resolve with one query per relationship."""
+    await _seed_projects(async_session, seed_test_data["users"])
+    statements.clear()
+
+    query = """
+    query {
+      builders(limit: 10) {
+        username
+        projects {
+          title
+          owner { username }
+          milestones { title }
+          collaborators { user { username skills { name } } }
+        }
+      }
+    }
+    """
+    result = await schema.execute(query, context_value=Context(session=async_session))
+
+    assert result.errors is None, result.errors
+    for builder in result.data["builders"]:
+        for project in builder["projects"]:
+            assert project["owner"]["username"] == builder["username"]
+            assert len(project["collaborators"]) == 1
+    # builders, projects, milestones, collaborators, collaborators' skills
+    assert len(statements) == 5
+    for table in ("project_milestones", "project_collaborators", "user_skills"):
+        assert len(_touching(statements, table)) == 1, table
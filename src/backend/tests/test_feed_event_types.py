@@ -2,6 +2,7 @@
 
 from datetime import UTC, datetime
 
+import pytest
 import strawberry
 
 from app.graphql.types.feed_event import FeedEventType
@@ -108,8 +109,9 @@ def test_feed_event_type_with_empty_metadata():
     assert feed_event.created_at == now
 
 
-def test_feed_event_type_actor_returns_none():
-    """Test that actor field returns None (placeholder until dataloaders)."""
+@pytest.mark.asyncio
+async def test_feed_event_type_actor_none_without_actor_id():
+    """Test that actor resolves to None for an event built without an actor id."""
     now = datetime.now(UTC)
 
     feed_event = FeedEventType(
@@ -121,8 +123,7 @@ def test_feed_event_type_actor_returns_none():
         created_at=now,
     )
 
-    # The actor field returns None until proper dataloaders are implemented
-    assert feed_event.actor() is None
+    assert await feed_event.actor(info=None) is None
 
 
 def test_all_event_type_values():
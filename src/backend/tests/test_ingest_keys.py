@@ -0,0 +1,87 @@
+"""Tests for the burn ingest idempotency ledger — claims, replays and the TTL sweep."""
+
+import datetime
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.build_activity import BuildActivity
+from app.models.burn_ingest_key import BurnIngestKey
+from app.models.project import Project
+from app.services import ingest_keys
+
+DAY = datetime.date(2026, 5, 1)
+
+
+@pytest.fixture
+def user_id(seed_test_data) -> str:
+    return seed_test_data["users"]["testuser1"].id
+
+
+def _key(user_id: str, session_id: str, **overrides) -> dict:
+    values = {
+        "user_id": user_id,
+        "session_id": session_id,
+        "burn_id": f"burn_{session_id}",
+        "project_id": None,
+        "activity_date": DAY,
+        "source": "anthropic",
+    }
+    values.update(overrides)
+    return values
+
+
+@pytest.mark.asyncio
+async def test_claim_returns_only_new_session_ids(async_session: AsyncSession, user_id: str):
+    """A second claim of the same session_id returns nothing and keeps the first row."""
+    assert await ingest_keys.claim_keys(async_session, [_key(user_id, "a")]) == {"a"}
+    claimed = await ingest_keys.claim_keys(
+        async_session, [_key(user_id, "a", burn_id="01OTHER"), _key(user_id, "b")]
+    )
+
+    assert claimed == {"b"}
+    replays = await ingest_keys.get_replays(async_session, user_id, ["a", "b"])
+    assert replays["a"][0] == _key(user_id, "a")["burn_id"]
+
+
+@pytest.mark.asyncio
+async def test_replay_resolves_merged_project_row(async_session: AsyncSession, user_id: str):
+    """For project burns the replay reports the row the tokens were added to."""
+    project = Project(owner_id=user_id, title="Ledger")
+    async_session.add(project)
+    await async_session.flush()
+    row = BuildActivity(
+        user_id=user_id,
+        project_id=project.id,
+        activity_date=DAY,
+        tokens_burned=100,
+        source="anthropic",
+    )
+    async_session.add(row)
+    await async_session.flush()
+
+    await ingest_keys.claim_keys(
+        async_session, [_key(user_id, "merged", burn_id="01NEVERWRITTEN", project_id=project.id)]
+    )
+
+    replays = await ingest_keys.get_replays(async_session, user_id, ["merged"])
+    assert replays == {"merged": (row.id, project.id, DAY)}
+
+
+@pytest.mark.asyncio
+async def test_expire_keys_removes_only_old_rows(async_session: AsyncSession, user_id: str):
+    """Keys created before the cutoff are deleted; newer ones stay."""
+    await ingest_keys.claim_keys(async_session, [_key(user_id, "old"), _key(user_id, "new")])
+    await async_session.execute(
+        update(BurnIngestKey)
+        .where(BurnIngestKey.session_id == "old")
+        .values(created_at=func.now() - datetime.timedelta(days=40))
+    )
+    await async_session.commit()
+
+    expired = await ingest_keys.expire_keys(async_session, ingest_keys.expiry_cutoff(30))
+
+    assert expired == 1
+    remaining = (await async_session.execute(select(BurnIngestKey.session_id))).scalars().all()
+    assert remaining == ["new"]
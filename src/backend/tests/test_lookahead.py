@@ -0,0 +1,76 @@
+"""Tests for app.graphql.lookahead — reading a resolver's selected fields."""
+
+import pytest
+import strawberry
+from strawberry.types import Info
+
+from app.graphql.lookahead import Lookahead
+
+
+@strawberry.type
+class Leaf:
+    name: str = "leaf"
+
+
+@strawberry.type
+class Node:
+    name: str = "node"
+    leaf: Leaf = strawberry.field(default_factory=Leaf)
+    other_leaf: Leaf = strawberry.field(default_factory=Leaf)
+
+
+captured: list[Lookahead] = []
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def node(self, info: Info) -> Node:
+        captured.append(Lookahead.from_info(info))
+        return Node()
+
+
+schema = strawberry.Schema(query=Query)
+
+
+async def _lookahead(query: str) -> Lookahead:
+    captured.clear()
+    result = await schema.execute(query)
+    assert result.errors is None, result.errors
+    return captured[0]
+
+
+@pytest.mark.asyncio
+async def test_has_nested_paths():
+    """Selected fields and their nested fields are reported by GraphQL name."""
+    selected = await _lookahead("{ node { name leaf { name } } }")
+
+    assert selected.has("name")
+    assert selected.has("leaf")
+    assert selected.has("leaf", "name")
+    assert not selected.has("otherLeaf")
+    assert not selected.has("leaf", "missing")
+
+
+@pytest.mark.asyncio
+async def test_fragments_are_flattened():
+    """Fields selected through named and inline fragments count as selected."""
+    selected = await _lookahead(
+        """
+        query { node { ...Parts ... on Node { otherLeaf { name } } } }
+        fragment Parts on Node { leaf { name } }
+        """
+    )
+
+    assert selected.has("leaf", "name")
+    assert selected.has("otherLeaf", "name")
+    assert not selected.has("name")
+
+
+@pytest.mark.asyncio
+async def test_aliases_merge_under_the_field_name():
+    """Aliased selections of one field merge their subfields."""
+    selected = await _lookahead("{ node { a: leaf { name } b: leaf { __typename } } }")
+
+    assert selected.has("leaf", "name")
+    assert selected.has("leaf", "__typename")
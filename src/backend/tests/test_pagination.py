@@ -0,0 +1,175 @@
+"""Tests for app.graphql.pagination — keyset-paged connection fields."""
+
+import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ulid import ULID
+
+from app.graphql.context import Context
+from app.graphql.pagination import decode_cursor, encode_cursor, fetch_page
+from app.graphql.schema import schema
+from app.models.enums import EventType, ProjectStatus
+from app.models.feed_event import FeedEvent
+from app.models.project import Project
+from app.models.tribe import Tribe
+from app.models.user import User
+
+FEED_PAGE_QUERY = """
+query ($after: String) {
+  feedConnection(first: 2, after: $after) {
+    edges { cursor node { id } }
+    pageInfo { hasNextPage endCursor }
+  }
+}
+"""
+
+
+async def _execute(session: AsyncSession, query: str, **variables):
+    result = await schema.execute(
+        query, variable_values=variables, context_value=Context(session=session)
+    )
+    assert result.errors is None, result.errors
+    return result.data
+
+
+def test_cursor_round_trips_datetime_and_float():
+    """Cursors decode back to the sort value and id they were made from."""
+    at = datetime.datetime(2026, 10, 16, 12, 30, 0, 123456, tzinfo=datetime.UTC)
+    assert decode_cursor(encode_cursor(at, "01A"), FeedEvent.created_at) == (at, "01A")
+    assert decode_cursor(encode_cursor(42.5, "01B"), User.builder_score) == (42.5, "01B")
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", encode_cursor(42.5, "01B")])
+def test_invalid_cursor_raises(cursor):
+    """Garbage, and cursors of another ordering, are rejected."""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, FeedEvent.created_at)
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_rejects_out_of_range_first(async_session: AsyncSession):
+    with pytest.raises(ValueError, match="first must be between"):
+        await fetch_page(
+            async_session,
+            select(User),
+            sort_column=User.builder_score,
+            id_column=User.id,
+            first=0,
+        )
+
+
+@pytest.mark.asyncio
+async def test_feed_connection_pages_through_ties_by_id(
+    async_session: AsyncSession, seed_test_data
+):
+    """Events sharing a timestamp are neither skipped nor repeated across pages."""
+    actor = next(iter(seed_test_data["users"].values()))
+    created_at = datetime.datetime(2026, 10, 1, tzinfo=datetime.UTC)
+    events = [
+        FeedEvent(
+            id=str(ULID()),
+            event_type=EventType.PROJECT_CREATED,
+            actor_id=actor.id,
+            target_type="project",
+            target_id=str(ULID()),
+            created_at=created_at,
+        )
+        for _ in range(5)
+    ]
+    async_session.add_all(events)
+    await async_session.commit()
+
+    seen: list[str] = []
+    after = None
+    while True:
+        data = await _execute(async_session, FEED_PAGE_QUERY, after=after)
+        connection = data["feedConnection"]
+        seen.extend(edge["node"]["id"] for edge in connection["edges"])
+        assert connection["pageInfo"]["endCursor"] == connection["edges"][-1]["cursor"]
+        if not connection["pageInfo"]["hasNextPage"]:
+            break
+        after = connection["pageInfo"]["endCursor"]
+
+    assert seen == sorted((e.id for e in events), reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_builders_connection_orders_by_score(async_session: AsyncSession, seed_test_data):
+    query = """
+    query ($after: String) {
+      buildersConnection(first: 2, after: $after) {
+        edges { node { username } }
+        pageInfo { hasNextPage endCursor }
+        totalCount
+      }
+    }
+    """
+    first = (await _execute(async_session, query))["buildersConnection"]
+    assert [e["node"]["username"] for e in first["edges"]] == ["testuser3", "testuser1"]
+    assert first["pageInfo"]["hasNextPage"] is True
+    assert first["totalCount"] == 3
+
+    after = first["pageInfo"]["endCursor"]
+    second = (await _execute(async_session, query, after=after))["buildersConnection"]
+    assert [e["node"]["username"] for e in second["edges"]] == ["testuser2"]
+    assert second["pageInfo"]["hasNextPage"] is False
+
+
+@pytest.mark.asyncio
+async def test_projects_connection_filters_by_status(
+    async_session: AsyncSession, seed_test_data
+):
+    owner = next(iter(seed_test_data["users"].values()))
+    for i, status in enumerate([ProjectStatus.SHIPPED, ProjectStatus.IN_PROGRESS] * 2):
+        async_session.add(Project(owner_id=owner.id, title=f"Project {i}", status=status))
+    await async_session.commit()
+
+    query = """
+    query {
+      projectsConnection(first: 10, status: "shipped") {
+        edges { node { title status } }
+        pageInfo { hasNextPage }
+        totalCount
+      }
+    }
+    """
+    connection = (await _execute(async_session, query))["projectsConnection"]
+    assert {e["node"]["status"] for e in connection["edges"]} == {"SHIPPED"}
+    assert connection["totalCount"] == 2
+    assert connection["pageInfo"]["hasNextPage"] is False
+
+
+@pytest.mark.asyncio
+async def test_empty_connection(async_session: AsyncSession):
+    query = "query { tribesConnection { edges { cursor } pageInfo { hasNextPage endCursor } } }"
+    connection = (await _execute(async_session, query))["tribesConnection"]
+    assert connection == {"edges": [], "pageInfo": {"hasNextPage": False, "endCursor": None}}
+
+
+@pytest.mark.asyncio
+async def test_total_count_only_when_selected(async_session: AsyncSession, seed_test_data):
+    page = await fetch_page(
+        async_session,
+        select(User),
+        sort_column=User.builder_score,
+        id_column=User.id,
+        first=1,
+    )
+    assert page.total_count is None
+
+
+@pytest.mark.parametrize(
+    ("model", "name", "columns"),
+    [
+        (FeedEvent, "ix_feed_events_created_at_id", ["created_at", "id"]),
+        (Project, "ix_projects_updated_at_id", ["updated_at", "id"]),
+        (Tribe, "ix_tribes_updated_at_id", ["updated_at", "id"]),
+        (User, "ix_users_builder_score_id", ["builder_score", "id"]),
+    ],
+)
+def test_keyset_indexes(model, name, columns):
+    """Each connection's (sort value, id) order has a matching composite index."""
+    indexes = {idx.name: idx for idx in model.__table__.indexes}
+    assert [col.name for col in indexes[name].columns] == columns
@@ -0,0 +1,154 @@
+"""Tests for the bounded bcrypt thread pool — offloading, queue limit, cost factor."""
+
+import asyncio
+import threading
+
+import bcrypt
+import pytest
+
+from app.graphql.helpers import AuthError
+from app.services import auth_service
+from app.services.password_hashing import PasswordHasher, PasswordHasherBusy
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_round_trip():
+    """A hash made by the pool verifies, at the configured cost factor."""
+    hasher = PasswordHasher(rounds=4, max_workers=2, max_queue=4)
+    hashed = await hasher.hash("correct horse")
+
+    assert hashed.startswith("$2b$04$")
+    assert await hasher.verify("correct horse", hashed)
+    assert not await hasher.verify("wrong horse", hashed)
+    assert hasher.stats.completed == 3
+    assert hasher.stats.in_flight == 0
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_bcrypt_runs_off_the_event_loop():
+    """Hashing runs in a pool thread, not the event loop's thread."""
+    hasher = PasswordHasher(rounds=4, max_workers=1, max_queue=1)
+    threads: list[str] = []
+    result = await hasher._run(lambda: threads.append(threading.current_thread().name))
+
+    assert result is None
+    assert threads[0].startswith("bcrypt")
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failed_calls_are_not_counted_as_completed():
+    """A call that raises counts as failed, not completed."""
+    hasher = PasswordHasher(rounds=4, max_workers=1, max_queue=1)
+
+    with pytest.raises(ZeroDivisionError):
+        await hasher._run(lambda: 1 / 0)
+
+    assert hasher.stats.completed == 0
+    assert hasher.stats.failed == 1
+    assert hasher.stats.in_flight == 0
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_calls_beyond_the_queue_limit_are_refused():
+    """With every thread busy and the queue full, further calls raise PasswordHasherBusy."""
+    hasher = PasswordHasher(rounds=4, max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    running = asyncio.ensure_future(hasher._run(release.wait))
+    queued = asyncio.ensure_future(hasher._run(release.wait))
+    await asyncio.sleep(0)
+    assert hasher.queue_depth == 1
+
+    with pytest.raises(PasswordHasherBusy):
+        await hasher._run(release.wait)
+
+    release.set()
+    await asyncio.gather(running, queued)
+    assert hasher.stats.rejected == 1
+    assert hasher.stats.max_queue_depth == 1
+    hasher.shutdown()
+
+
+def test_needs_rehash_compares_cost_factor():
+    """Only hashes made at a lower cost need rehashing; higher-cost ones are kept."""
+    hasher = PasswordHasher(rounds=5, max_workers=1, max_queue=1)
+    assert not hasher.needs_rehash(bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=5)).decode())
+    assert not hasher.needs_rehash(bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=6)).decode())
+    assert hasher.needs_rehash(bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=4)).decode())
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_at_configured_cost(async_session, monkeypatch):
+    """Logging in with a hash of another cost upgrades it to the configured cost."""
+    hasher = PasswordHasher(rounds=4, max_workers=1, max_queue=4)
+    monkeypatch.setattr(auth_service, "password_hasher", hasher)
+    result = await auth_service.signup(
+        async_session,
+        email="rehash@example.com",
+        password="securepass123",
+        username="rehash",
+        display_name="Rehash",
+    )
+
+    hasher.rounds = 5
+    await auth_service.login(async_session, "rehash@example.com", "securepass123")
+
+    assert result["user"].password_hash.startswith("$2b$05$")
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_login_succeeds_when_rehash_pool_is_busy(async_session, monkeypatch):
+    """A verified login still succeeds if the rehash is refused; the old hash stays."""
+    hasher = PasswordHasher(rounds=4, max_workers=1, max_queue=4)
+    monkeypatch.setattr(auth_service, "password_hasher", hasher)
+    result = await auth_service.signup(
+        async_session,
+        email="rehash-busy@example.com",
+        password="securepass123",
+        username="rehashbusy",
+        display_name="Rehash Busy",
+    )
+
+    async def busy(*_args):
+        raise PasswordHasherBusy("full")
+
+    hasher.rounds = 5
+    monkeypatch.setattr(hasher, "hash", busy)
+    tokens = await auth_service.login(async_session, "rehash-busy@example.com", "securepass123")
+
+    assert tokens["access_token"]
+    assert result["user"].password_hash.startswith("$2b$04$")
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_busy_hasher_surfaces_as_rate_limited(async_session, monkeypatch):
+    """A full hashing queue is reported to clients as RATE_LIMITED."""
+
+    async def busy(*_args):
+        raise PasswordHasherBusy("full")
+
+    monkeypatch.setattr(auth_service.password_hasher, "hash", busy)
+    with pytest.raises(AuthError) as exc_info:
+        await auth_service.signup(
+            async_session,
+            email="busy@example.com",
+            password="securepass123",
+            username="busy",
+            display_name="Busy",
+        )
+    assert exc_info.value.code == "RATE_LIMITED"
+
+
+@pytest.mark.asyncio
+async def test_metrics_export_hasher_counters(async_client):
+    """/metrics reports completed, failed and rejected hashing calls."""
+    resp = await async_client.get("/metrics")
+
+    for counter in ("completed", "failed", "rejected"):
+        assert f"fyt_password_hash_{counter}_total " in resp.text
@@ -1,15 +1,16 @@
 """Tests for project_resolution service — URL parsing, DB matching, caching."""
 
-import time
-
 import pytest
 
 from app.models.project import Project
 from app.services.project_resolution import (
+    _CACHE_TTL_SECONDS,
+    _NEGATIVE_CACHE_TTL_SECONDS,
     _normalize_hint,
     _resolution_cache,
     invalidate_project_cache,
     resolve_project,
+    resolve_projects,
 )
 
 # ---------------------------------------------------------------------------
@@ -176,7 +177,7 @@ async def test_cache_hit(async_session, user_with_project):
 
 
 @pytest.mark.asyncio
-async def test_cache_ttl_expiry(async_session, user_with_project):
+async def test_cache_ttl_expiry(async_session, user_with_project, monkeypatch):
     """Cache entry expires after TTL."""
     user = user_with_project["user"]
 
@@ -184,16 +185,15 @@ async def test_cache_ttl_expiry(async_session, user_with_project):
     cache_key = (user.id, "acme/cli-tool")
     assert cache_key in _resolution_cache
 
-    # Manually backdate the timestamp beyond TTL
-    value, _ = _resolution_cache[cache_key]
-    _resolution_cache[cache_key] = (value, time.monotonic() - 601)
+    # Move the cache clock beyond the TTL
+    now = _resolution_cache.clock()
+    monkeypatch.setattr(_resolution_cache, "clock", lambda: now + _CACHE_TTL_SECONDS + 1)
+    assert cache_key not in _resolution_cache
 
-    # Next call should re-query (cache expired)
+    # Next call should re-query (cache expired) and cache afresh
     result = await resolve_project(async_session, user.id, "acme/cli-tool")
     assert result is not None
-    # Verify the timestamp was refreshed
-    _, ts = _resolution_cache[cache_key]
-    assert time.monotonic() - ts < 5  # freshly cached
+    assert cache_key in _resolution_cache
 
 
 @pytest.mark.asyncio
@@ -205,8 +205,58 @@ async def test_cache_stores_none(async_session, user_with_project):
     )
     assert result is None
     assert (user.id, "nonexistent/repo") in _resolution_cache
-    cached_value, _ = _resolution_cache[(user.id, "nonexistent/repo")]
-    assert cached_value is None
+    assert _resolution_cache.get((user.id, "nonexistent/repo")) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_none_expires_sooner(async_session, user_with_project, monkeypatch):
+    """No-match results use the shorter negative TTL; matches keep the full TTL."""
+    user = user_with_project["user"]
+    await resolve_project(async_session, user.id, "nonexistent/repo")
+    await resolve_project(async_session, user.id, "acme/cli-tool")
+
+    now = _resolution_cache.clock()
+    monkeypatch.setattr(
+        _resolution_cache, "clock", lambda: now + _NEGATIVE_CACHE_TTL_SECONDS + 1
+    )
+
+    assert (user.id, "nonexistent/repo") not in _resolution_cache
+    assert (user.id, "acme/cli-tool") in _resolution_cache
+
+
+# ---------------------------------------------------------------------------
+# resolve_projects — batched resolution
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_resolve_projects_matches_like_resolve_project(async_session, user_with_project):
+    """Batched resolution applies the same exact, partial and no-match rules."""
+    user = user_with_project["user"]
+    project = user_with_project["project"]
+    hints = [
+        "https://github.com/acme/cli-tool",
+        "git@github.com:other-org/CLI-Tool.git",
+        "acme/nonexistent",
+    ]
+
+    result = await resolve_projects(async_session, user.id, hints)
+
+    assert result == {hints[0]: project.id, hints[1]: project.id, hints[2]: None}
+    for hint in hints:
+        assert (user.id, hint) in _resolution_cache
+
+
+@pytest.mark.asyncio
+async def test_resolve_projects_serves_cached_hints(async_session, user_with_project):
+    """Cached hints are returned without being re-resolved."""
+    user = user_with_project["user"]
+    _resolution_cache.set((user.id, "cached/hint"), "proj-cached", owner=user.id)
+
+    result = await resolve_projects(async_session, user.id, ["cached/hint", "acme/cli-tool"])
+
+    assert result["cached/hint"] == "proj-cached"
+    assert result["acme/cli-tool"] == user_with_project["project"].id
 
 
 # ---------------------------------------------------------------------------
@@ -222,16 +272,18 @@ async def test_invalidate_clears_user_entries(async_session, user_with_project):
     # Prime cache with two different hints
     await resolve_project(async_session, user.id, "acme/cli-tool")
     await resolve_project(async_session, user.id, "nonexistent/repo")
-    assert len([k for k in _resolution_cache if k[0] == user.id]) == 2
+    assert len(_resolution_cache) == 2
 
     invalidate_project_cache(user.id)
-    assert len([k for k in _resolution_cache if k[0] == user.id]) == 0
+    assert (user.id, "acme/cli-tool") not in _resolution_cache
+    assert (user.id, "nonexistent/repo") not in _resolution_cache
+    assert len(_resolution_cache) == 0
 
 
 def test_invalidate_only_affects_target_user():
     """invalidate_project_cache does not touch other users' entries."""
-    _resolution_cache[("user-a", "hint1")] = ("proj-1", time.monotonic())
-    _resolution_cache[("user-b", "hint2")] = ("proj-2", time.monotonic())
+    _resolution_cache.set(("user-a", "hint1"), "proj-1", owner="user-a")
+    _resolution_cache.set(("user-b", "hint2"), "proj-2", owner="user-b")
 
     invalidate_project_cache("user-a")
 
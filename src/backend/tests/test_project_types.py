@@ -2,6 +2,7 @@
 
 from datetime import UTC, datetime
 
+import pytest
 import strawberry
 
 from app.graphql.types.project import CollaboratorType, ProjectType
@@ -344,7 +345,8 @@ def test_collaborator_type_with_pending_status():
     assert collaborator.confirmed_at is None
 
 
-def test_project_type_collaborators_returns_empty_list():
+@pytest.mark.asyncio
+async def test_project_type_collaborators_returns_empty_list():
     """Test that collaborators field returns empty list by default."""
     now = datetime.now(UTC)
 
@@ -372,11 +374,12 @@ def test_project_type_collaborators_returns_empty_list():
     )
 
     # The collaborators field should return an empty list
-    collaborators = project.collaborators()
+    collaborators = await project.collaborators(info=None)
     assert collaborators == []
 
 
-def test_project_type_owner_returns_none_when_not_loaded():
+@pytest.mark.asyncio
+async def test_project_type_owner_returns_none_when_not_loaded():
     """Test that owner field returns None when no owner is loaded."""
     now = datetime.now(UTC)
 
@@ -404,4 +407,4 @@ def test_project_type_owner_returns_none_when_not_loaded():
     )
 
     # The owner field returns the stored _owner value (None when not loaded)
-    assert project.owner() is None
+    assert await project.owner(info=None) is None
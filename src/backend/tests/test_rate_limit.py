@@ -0,0 +1,67 @@
+"""Tests for the token-bucket rate limiter — refill, burst, eviction, disabling."""
+
+from app.services.rate_limit import TokenBucketLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_burst_then_throttle():
+    """A fresh bucket allows `burst` requests, then reports the wait for the next token."""
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate_per_minute=60, burst=3, clock=clock)
+
+    assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire("a") == 1.0
+
+
+def test_refills_at_rate_up_to_burst():
+    """Tokens come back at rate_per_minute and never exceed the burst size."""
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate_per_minute=60, burst=2, clock=clock)
+    limiter.acquire("a")
+    limiter.acquire("a")
+
+    clock.now += 0.5
+    assert limiter.acquire("a") == 0.5
+    clock.now += 0.5
+    assert limiter.acquire("a") == 0.0
+
+    clock.now += 3600
+    assert [limiter.acquire("a") for _ in range(3)][-1] > 0
+
+
+def test_keys_are_independent():
+    """Draining one key's bucket does not affect another key."""
+    limiter = TokenBucketLimiter(rate_per_minute=60, burst=1, clock=FakeClock())
+    limiter.acquire("a")
+
+    assert limiter.acquire("a") > 0
+    assert limiter.acquire("b") == 0.0
+
+
+def test_evicts_least_recently_used_keys():
+    """The limiter tracks at most max_keys buckets, dropping the stalest."""
+    limiter = TokenBucketLimiter(rate_per_minute=60, burst=1, max_keys=2, clock=FakeClock())
+    limiter.acquire("a")
+    limiter.acquire("b")
+    limiter.acquire("a")
+    limiter.acquire("c")
+
+    assert len(limiter) == 2
+    assert limiter.acquire("a") > 0
+    assert limiter.acquire("b") == 0.0
+
+
+def test_zero_rate_disables_limit():
+    """A rate of 0 lets every request through and tracks nothing."""
+    limiter = TokenBucketLimiter(rate_per_minute=0, burst=0)
+
+    assert not limiter.enabled
+    assert all(limiter.acquire("a") == 0.0 for _ in range(100))
+    assert len(limiter) == 0
@@ -51,6 +51,10 @@ class TestSchemaQueries:
         """Schema exposes a 'builders' query."""
         assert "builders" in self._query_field_names()
 
+    def test_burn_breakdown_query_exists(self):
+        """Schema exposes a 'burn_breakdown' query."""
+        assert "burn_breakdown" in self._query_field_names()
+
     def test_burn_summary_query_exists(self):
         """Schema exposes a 'burn_summary' query."""
         assert "burn_summary" in self._query_field_names()
@@ -431,11 +431,11 @@ async def test_seed_feed_events_specific_actors():
 
 
 @pytest.mark.asyncio
-async def test_seed_feed_events_actor_metadata_fields():
-    """Test that all feed events have actor identity fields in metadata.
+async def test_seed_feed_events_actor_not_copied_into_metadata():
+    """Test that feed event metadata carries no copies of the actor's identity.
 
-    Every event must have actor_username. Every event except BUILDER_JOINED
-    must have actor_name. BUILDER_JOINED uses user_name instead of actor_name.
+    The actor is resolved from actor_id through FeedEventType.actor, so
+    actor_name and actor_username would only bloat every feed row.
     """
     from app.db.engine import async_session_factory, engine
 
@@ -461,26 +461,8 @@ async def test_seed_feed_events_actor_metadata_fields():
 
             for event in events:
                 metadata = event.event_metadata
-
-                # Every event must have actor_username
-                assert "actor_username" in metadata, (
-                    f"Event {event.event_type} missing actor_username in metadata"
-                )
-                assert isinstance(metadata["actor_username"], str)
-                assert len(metadata["actor_username"]) > 0
-
-                if event.event_type == EventType.BUILDER_JOINED:
-                    # BUILDER_JOINED uses user_name for the display name
-                    assert "user_name" in metadata, (
-                        "BUILDER_JOINED event missing user_name in metadata"
-                    )
-                else:
-                    # All other event types must have actor_name
-                    assert "actor_name" in metadata, (
-                        f"Event {event.event_type} missing actor_name in metadata"
-                    )
-                    assert isinstance(metadata["actor_name"], str)
-                    assert len(metadata["actor_name"]) > 0
+                assert "actor_name" not in metadata
+                assert "actor_username" not in metadata
     finally:
         # Clean up
         async with engine.begin() as conn:
@@ -0,0 +1,112 @@
+"""Tests for write-behind recording of ApiToken.last_used_at."""
+
+import datetime
+import hashlib
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.api_token import ApiToken
+from app.services.token_usage import TokenUsageRecorder
+
+EARLIER = datetime.datetime(2026, 5, 1, 12, 0, tzinfo=datetime.UTC)
+LATER = EARLIER + datetime.timedelta(minutes=5)
+
+
+def _session_factory(session: AsyncSession):
+    """Wrap the transactional test session so flush() can open it like a factory."""
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory
+
+
+async def _create_token(session: AsyncSession, user_id: str, raw: str, **fields) -> ApiToken:
+    token = ApiToken(
+        user_id=user_id,
+        token_hash=hashlib.sha256(raw.encode()).hexdigest(),
+        name="usage test",
+        **fields,
+    )
+    session.add(token)
+    await session.flush()
+    return token
+
+
+async def _last_used(session: AsyncSession, token: ApiToken) -> datetime.datetime | None:
+    result = await session.execute(
+        select(ApiToken.last_used_at).where(ApiToken.id == token.id)
+    )
+    return result.scalar_one()
+
+
+def test_record_keeps_latest_use_per_token():
+    """Repeated uses of a token collapse into its most recent time."""
+    recorder = TokenUsageRecorder()
+    recorder.record("hash-a", LATER)
+    recorder.record("hash-a", EARLIER)
+    recorder.record("hash-b", EARLIER)
+
+    assert len(recorder) == 2
+    assert recorder._pending["hash-a"] == LATER
+
+
+@pytest.mark.asyncio
+async def test_flush_with_nothing_recorded_is_noop(async_session: AsyncSession):
+    """Flushing an empty recorder touches nothing."""
+    assert await TokenUsageRecorder().flush(_session_factory(async_session)) == 0
+
+
+@pytest.mark.asyncio
+async def test_flush_updates_tokens_in_one_batch(async_session: AsyncSession, seed_test_data):
+    """Flush writes each recorded token's last use and empties the recorder."""
+    user = seed_test_data["users"]["testuser1"]
+    first = await _create_token(async_session, user.id, "fyt_usage_first")
+    second = await _create_token(async_session, user.id, "fyt_usage_second")
+    untouched = await _create_token(async_session, user.id, "fyt_usage_untouched")
+
+    recorder = TokenUsageRecorder()
+    recorder.record(first.token_hash, EARLIER)
+    recorder.record(second.token_hash, LATER)
+
+    assert await recorder.flush(_session_factory(async_session)) == 2
+    assert len(recorder) == 0
+    assert await _last_used(async_session, first) == EARLIER
+    assert await _last_used(async_session, second) == LATER
+    assert await _last_used(async_session, untouched) is None
+
+
+@pytest.mark.asyncio
+async def test_flush_never_moves_last_used_backwards(async_session: AsyncSession, seed_test_data):
+    """An older recorded use does not overwrite a newer stored last_used_at."""
+    user = seed_test_data["users"]["testuser1"]
+    token = await _create_token(async_session, user.id, "fyt_usage_newer", last_used_at=LATER)
+
+    recorder = TokenUsageRecorder()
+    recorder.record(token.token_hash, EARLIER)
+    await recorder.flush(_session_factory(async_session))
+
+    assert await _last_used(async_session, token) == LATER
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_uses_for_retry():
+    """A flush that fails puts its uses back for the next flush."""
+
+    @asynccontextmanager
+    async def broken_factory():
+        raise RuntimeError("database unavailable")
+        yield
+
+    recorder = TokenUsageRecorder()
+    recorder.record("hash-a", EARLIER)
+
+    with pytest.raises(RuntimeError):
+        await recorder.flush(broken_factory)
+
+    recorder.record("hash-a", LATER)
+    assert recorder._pending == {"hash-a": LATER}
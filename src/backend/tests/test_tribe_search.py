@@ -1,7 +1,7 @@
 """Tests for tribe search functionality."""
 
 import pytest
-from sqlalchemy import text
+from sqlalchemy import inspect, text
 
 from app.services import tribe_service
 
@@ -172,10 +172,10 @@ async def test_search_pagination_offset(async_session, seed_test_data):
 
 
 @pytest.mark.asyncio
-async def test_search_results_include_eager_loaded_relationships(
+async def test_search_results_leave_relationships_unloaded(
     async_session, seed_test_data
 ):
-    """Results include eager-loaded owner, members, and open_roles."""
+    """Owner, members and open_roles are left for the GraphQL types to load."""
     owner = seed_test_data["users"]["testuser1"]
 
     tribe = await tribe_service.create(
@@ -190,23 +190,13 @@ async def test_search_results_include_eager_loaded_relationships(
         skills_needed=["Figma"],
     )
 
+    async_session.expunge_all()
     results, total = await tribe_service.search(async_session, "Eager")
 
     assert total >= 1
     found = next(t for t in results if t.id == tribe.id)
-
-    # Verify owner is loaded (not a lazy proxy)
-    assert found.owner is not None
-    assert found.owner.id == owner.id
-
-    # Verify members are loaded
-    assert isinstance(found.members, list)
-    assert len(found.members) >= 1
-
-    # Verify open_roles are loaded
-    assert isinstance(found.open_roles, list)
-    assert len(found.open_roles) >= 1
-    assert found.open_roles[0].title == "Designer"
+    assert found.name == "Eager Tribe"
+    assert {"owner", "members", "open_roles"} <= inspect(found).unloaded
 
 
 @pytest.mark.asyncio
@@ -2,6 +2,7 @@
 
 from datetime import UTC, datetime
 
+import pytest
 import strawberry
 
 from app.graphql.types.tribe import OpenRoleType, TribeMemberType, TribeType
@@ -155,7 +156,8 @@ def test_tribe_type_with_minimal_fields():
     assert tribe.max_members == 5
 
 
-def test_tribe_type_owner_returns_none_when_not_loaded():
+@pytest.mark.asyncio
+async def test_tribe_type_owner_returns_none_when_not_loaded():
     """Test that owner field returns None when no owner is loaded."""
     now = datetime.now(UTC)
 
@@ -173,10 +175,11 @@ def test_tribe_type_owner_returns_none_when_not_loaded():
     )
 
     # The owner field returns the stored _owner value (None when not loaded)
-    assert tribe.owner() is None
+    assert await tribe.owner(info=None) is None
 
 
-def test_tribe_type_members_returns_empty_list():
+@pytest.mark.asyncio
+async def test_tribe_type_members_returns_empty_list():
     """Test that members field returns empty list by default."""
     now = datetime.now(UTC)
 
@@ -194,11 +197,12 @@ def test_tribe_type_members_returns_empty_list():
     )
 
     # The members field should return an empty list
-    members = tribe.members()
+    members = await tribe.members(info=None)
     assert members == []
 
 
-def test_tribe_type_open_roles_returns_empty_list():
+@pytest.mark.asyncio
+async def test_tribe_type_open_roles_returns_empty_list():
     """Test that open_roles field returns empty list by default."""
     now = datetime.now(UTC)
 
@@ -216,10 +220,36 @@ def test_tribe_type_open_roles_returns_empty_list():
     )
 
     # The open_roles field should return an empty list
-    open_roles = tribe.open_roles()
+    open_roles = await tribe.open_roles(info=None)
     assert open_roles == []
 
 
+@pytest.mark.asyncio
+async def test_tribe_type_from_model_uses_relationships_passed_in():
+    """Relationships handed to from_model resolve without touching the loaders."""
+    from app.models.tribe import Tribe, TribeOpenRole
+
+    now = datetime.now(UTC)
+    tribe = Tribe(
+        id="01HQZXYZ123456789ABCDEFGH",
+        owner_id="01HQZXYZ123456789ABCDEFGO",
+        name="Test Tribe",
+        mission=None,
+        status=TribeStatus.OPEN,
+        max_members=5,
+        created_at=now,
+        updated_at=now,
+    )
+    role = TribeOpenRole(
+        id="01HQZXYZ123456789ABCDEFGR", title="Designer", skills_needed=[], filled=False
+    )
+
+    tribe_type = TribeType.from_model(tribe, members=[], open_roles=[role])
+
+    assert await tribe_type.members(info=None) == []
+    assert [r.title for r in await tribe_type.open_roles(info=None)] == ["Designer"]
+
+
 def test_tribe_member_type_exists():
     """Test that TribeMemberType exists and is a Strawberry type."""
     assert TribeMemberType is not None
@@ -1,10 +1,17 @@
 """Tests for BurnDayType, BurnReceiptType, and BurnSummaryType GraphQL types."""
 
+import base64
 import datetime
+import struct
 
 import strawberry
 
-from app.graphql.types.burn import BurnDayType, BurnReceiptType, BurnSummaryType
+from app.graphql.types.burn import (
+    BurnDayType,
+    BurnReceiptType,
+    BurnSummaryType,
+    PackedBurnDaysType,
+)
 
 # ---------------------------------------------------------------------------
 # BurnDayType
@@ -71,20 +78,20 @@ class TestBurnReceiptType:
 
     def test_instantiation(self):
         """BurnReceiptType can be constructed with all required fields."""
-        day = BurnDayType(date=datetime.date(2026, 2, 10), tokens=5000)
+        day = {"date": datetime.date(2026, 2, 10), "tokens": 5000}
         receipt = BurnReceiptType(
             project_id=strawberry.ID("proj_001"),
             total_tokens=5000,
             duration_weeks=1,
             peak_week_tokens=5000,
-            daily_activity=[day],
+            _days=[day],
         )
         assert receipt.project_id == "proj_001"
         assert receipt.total_tokens == 5000
         assert receipt.duration_weeks == 1
         assert receipt.peak_week_tokens == 5000
-        assert len(receipt.daily_activity) == 1
-        assert receipt.daily_activity[0].tokens == 5000
+        assert len(receipt.daily_activity()) == 1
+        assert receipt.daily_activity()[0].tokens == 5000
 
     def test_empty_daily_activity(self):
         """BurnReceiptType accepts an empty daily_activity list."""
@@ -93,25 +100,25 @@ class TestBurnReceiptType:
             total_tokens=0,
             duration_weeks=0,
             peak_week_tokens=0,
-            daily_activity=[],
+            _days=[],
         )
-        assert receipt.daily_activity == []
+        assert receipt.daily_activity() == []
 
     def test_multiple_days_activity(self):
         """BurnReceiptType correctly stores multiple daily activity entries."""
         days = [
-            BurnDayType(date=datetime.date(2026, 2, 10), tokens=3000),
-            BurnDayType(date=datetime.date(2026, 2, 11), tokens=2000),
-            BurnDayType(date=datetime.date(2026, 2, 12), tokens=4000),
+            {"date": datetime.date(2026, 2, 10), "tokens": 3000},
+            {"date": datetime.date(2026, 2, 11), "tokens": 2000},
+            {"date": datetime.date(2026, 2, 12), "tokens": 4000},
         ]
         receipt = BurnReceiptType(
             project_id=strawberry.ID("proj_003"),
             total_tokens=9000,
             duration_weeks=1,
             peak_week_tokens=9000,
-            daily_activity=days,
+            _days=days,
         )
-        assert len(receipt.daily_activity) == 3
+        assert len(receipt.daily_activity()) == 3
         assert receipt.total_tokens == 9000
 
 
@@ -141,21 +148,21 @@ class TestBurnSummaryType:
 
     def test_instantiation(self):
         """BurnSummaryType can be constructed with all required fields."""
-        day = BurnDayType(date=datetime.date(2026, 2, 10), tokens=8000)
+        day = {"date": datetime.date(2026, 2, 10), "tokens": 8000}
         summary = BurnSummaryType(
             days_active=5,
             total_tokens=40000,
             active_weeks=2,
             total_weeks=52,
             weekly_streak=2,
-            daily_activity=[day],
+            _days=[day],
         )
         assert summary.days_active == 5
         assert summary.total_tokens == 40000
         assert summary.active_weeks == 2
         assert summary.total_weeks == 52
         assert summary.weekly_streak == 2
-        assert len(summary.daily_activity) == 1
+        assert len(summary.daily_activity()) == 1
 
     def test_zero_summary(self):
         """BurnSummaryType works with all-zero values."""
@@ -165,12 +172,12 @@ class TestBurnSummaryType:
             active_weeks=0,
             total_weeks=0,
             weekly_streak=0,
-            daily_activity=[],
+            _days=[],
         )
         assert summary.days_active == 0
         assert summary.total_tokens == 0
         assert summary.weekly_streak == 0
-        assert summary.daily_activity == []
+        assert summary.daily_activity() == []
 
     def test_field_types(self):
         """Integer fields are int, daily_activity is list[BurnDayType]."""
@@ -182,3 +189,77 @@ class TestBurnSummaryType:
         assert field_map["active_weeks"].type is int
         assert field_map["total_weeks"].type is int
         assert field_map["weekly_streak"].type is int
+
+
+# ---------------------------------------------------------------------------
+# PackedBurnDaysType
+# ---------------------------------------------------------------------------
+
+
+def _unpack(packed: PackedBurnDaysType) -> list[int]:
+    raw = base64.b64decode(packed.data)
+    code = "I" if packed.bytes_per_day == 4 else "Q"
+    return list(struct.unpack(f"<{packed.days}{code}", raw))
+
+
+class TestPackedBurnDaysType:
+    """Tests for the packed daily_activity encoding."""
+
+    def test_empty(self):
+        """No activity packs to an empty array with no start date."""
+        packed = PackedBurnDaysType.from_days([])
+        assert packed.start_date is None
+        assert packed.days == 0
+        assert packed.data == ""
+
+    def test_gaps_are_zero_slots(self):
+        """One slot per calendar day from the first to the last active day."""
+        packed = PackedBurnDaysType.from_days([
+            {"date": datetime.date(2026, 2, 1), "tokens": 100},
+            {"date": datetime.date(2026, 2, 4), "tokens": 250},
+        ])
+        assert packed.start_date == datetime.date(2026, 2, 1)
+        assert packed.days == 4
+        assert packed.bytes_per_day == 4
+        assert _unpack(packed) == [100, 0, 0, 250]
+
+    def test_widens_for_large_days(self):
+        """Days above the 32-bit range switch every slot to 8 bytes."""
+        packed = PackedBurnDaysType.from_days([
+            {"date": datetime.date(2026, 2, 1), "tokens": 5},
+            {"date": datetime.date(2026, 2, 2), "tokens": 2**33},
+        ])
+        assert packed.bytes_per_day == 8
+        assert _unpack(packed) == [5, 2**33]
+
+    def test_summary_and_receipt_expose_packed_field(self):
+        """Both burn aggregates resolve daily_activity_packed from the service's rows."""
+        days = [{"date": datetime.date(2026, 3, 1), "tokens": 7}]
+        summary = BurnSummaryType(
+            days_active=1, total_tokens=7, active_weeks=1,
+            total_weeks=52, weekly_streak=1, _days=days,
+        )
+        receipt = BurnReceiptType(
+            project_id=strawberry.ID("p1"), total_tokens=7, duration_weeks=1,
+            peak_week_tokens=7, _days=days,
+        )
+        for packed in (summary.daily_activity_packed(), receipt.daily_activity_packed()):
+            assert packed.start_date == datetime.date(2026, 3, 1)
+            assert _unpack(packed) == [7]
+
+    def test_packed_field_builds_no_day_objects(self, monkeypatch):
+        """A packed-only selection never creates a BurnDayType per day."""
+
+        def _fail(**_kwargs):
+            raise AssertionError("BurnDayType created")
+
+        monkeypatch.setattr("app.graphql.types.burn.BurnDayType", _fail)
+        summary = BurnSummaryType.from_dict({
+            "days_active": 2, "total_tokens": 9, "active_weeks": 1,
+            "total_weeks": 52, "weekly_streak": 1,
+            "daily_activity": [
+                {"date": datetime.date(2026, 3, 1), "tokens": 4},
+                {"date": datetime.date(2026, 3, 2), "tokens": 5},
+            ],
+        })
+        assert _unpack(summary.daily_activity_packed()) == [4, 5]
@@ -33,6 +33,11 @@ describe('hashString', () => {
 /* ─── getInitials ─── */
 
 describe('getInitials', () => {
+  it('extracts initials from the resolved actor', () => {
+    const actor = { id: 'u1', username: 'mayac', displayName: 'Maya Chen', avatarUrl: null };
+    expect(getInitials({}, actor)).toBe('MC');
+  });
+
   it('extracts initials from actor_name', () => {
     expect(getInitials({ actor_name: 'Maya Chen' })).toBe('MC');
   });
@@ -239,6 +244,16 @@ describe('getLinkTarget', () => {
 /* ─── getActorDisplayName ─── */
 
 describe('getActorDisplayName', () => {
+  const actor = { id: 'u1', username: 'mayac', displayName: 'Maya Chen', avatarUrl: null };
+
+  it('prefers the resolved actor over metadata', () => {
+    expect(getActorDisplayName({ actor_name: 'Old Name' }, actor)).toBe('Maya Chen');
+  });
+
+  it('falls back to metadata when the actor is null', () => {
+    expect(getActorDisplayName({ actor_name: 'Old Name' }, null)).toBe('Old Name');
+  });
+
   it('returns actor_name when present', () => {
     expect(
       getActorDisplayName({
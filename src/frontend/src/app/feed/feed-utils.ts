@@ -1,3 +1,5 @@
+import type { FeedActor } from '@/lib/graphql/types';
+
 /* ─── Types ─── */
 
 export interface FeedEventMetadata {
@@ -73,10 +75,12 @@ export function hashString(str: string): number {
 }
 
 /**
- * Extract initials from metadata name fields.
- * Fallback chain: actor_name → user_name → member_name → actor_username (first 2 chars) → '?'
+ * Extract initials from the resolved actor, else from metadata name fields
+ * (events written before the actor was resolved server-side).
+ * Fallback chain: actor.displayName → actor_name → user_name → member_name →
+ * actor_username (first 2 chars) → '?'
  */
-export function getInitials(metadata: FeedEventMetadata): string {
+export function getInitials(metadata: FeedEventMetadata, actor?: FeedActor | null): string {
   const nameToInitials = (name: string): string => {
     const words = name.trim().split(/\s+/);
     return words
@@ -86,6 +90,7 @@ export function getInitials(metadata: FeedEventMetadata): string {
       .toUpperCase();
   };
 
+  if (actor?.displayName) return nameToInitials(actor.displayName);
   if (metadata.actor_name) return nameToInitials(metadata.actor_name);
   if (metadata.user_name) return nameToInitials(metadata.user_name);
   if (metadata.member_name) return nameToInitials(metadata.member_name);
@@ -141,11 +146,16 @@ export function getLinkTarget(
 }
 
 /**
- * Returns the best available display name from metadata.
- * Fallback chain: actor_name → user_name → member_name → actor_username → 'A builder'
+ * Returns the best available display name: the resolved actor's, else one from metadata.
+ * Fallback chain: actor.displayName → actor_name → user_name → member_name →
+ * actor_username → 'A builder'
  */
-export function getActorDisplayName(metadata: FeedEventMetadata): string {
+export function getActorDisplayName(
+  metadata: FeedEventMetadata,
+  actor?: FeedActor | null,
+): string {
   return (
+    actor?.displayName ??
     metadata.actor_name ??
     metadata.user_name ??
     metadata.member_name ??
@@ -38,6 +38,7 @@ function makeEvent(
     targetId: overrides.targetId ?? `target-${seq}`,
     metadata,
     createdAt: overrides.createdAt ?? '2025-06-15T10:30:00Z',
+    actor: overrides.actor ?? null,
   };
 }
 
@@ -178,7 +179,12 @@ function builderJoined(
 
 function mockFeed(events: FeedEvent[]) {
   mockUseQuery.mockReturnValue({
-    data: { feed: events },
+    data: {
+      feedConnection: {
+        edges: events.map((node) => ({ cursor: node.id, node })),
+        pageInfo: { hasNextPage: false, endCursor: null },
+      },
+    },
     loading: false,
     error: undefined,
     fetchMore: vi.fn(),
@@ -444,6 +450,19 @@ describe('FeedPage', () => {
   /* ── 10. Fallback behavior ── */
 
   describe('fallback behavior', () => {
+    it('prefers the resolved actor over metadata names', () => {
+      mockFeed([
+        projectShipped(
+          { actor_name: undefined, actor_username: undefined },
+          {
+            actor: { id: 'u1', username: 'mayac', displayName: 'Maya Chen', avatarUrl: null },
+          },
+        ),
+      ]);
+      render(<FeedPage />);
+      expect(screen.getByText('Maya Chen')).toBeInTheDocument();
+    });
+
     it('shows actor_username when actor_name is missing', () => {
       mockFeed([
         projectShipped({ actor_name: undefined, actor_username: 'mayac' }),
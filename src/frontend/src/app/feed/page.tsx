@@ -1,6 +1,5 @@
 'use client';
 
-import { useState } from 'react';
 import { useQuery } from '@apollo/client/react';
 import Link from 'next/link';
 import { GET_FEED } from '@/lib/graphql/queries/feed';
@@ -149,7 +148,7 @@ function TextCard({ event }: { event: FeedEvent }) {
 
 function ActivityLine({ event }: { event: FeedEvent }) {
   const meta = event.metadata as FeedEventMetadata;
-  const actorName = getActorDisplayName(meta);
+  const actorName = getActorDisplayName(meta, event.actor);
 
   switch (event.eventType) {
     case 'MEMBER_JOINED_TRIBE': {
@@ -202,9 +201,13 @@ function ActivityLine({ event }: { event: FeedEvent }) {
 
 function TimelineNode({ event }: { event: FeedEvent }) {
   const meta = event.metadata as FeedEventMetadata;
-  const initials = getInitials(meta);
+  const initials = getInitials(meta, event.actor);
   const avatarColor = getAvatarColor(
-    meta.actor_name ?? meta.user_name ?? meta.member_name ?? meta.actor_username,
+    event.actor?.displayName ??
+      meta.actor_name ??
+      meta.user_name ??
+      meta.member_name ??
+      meta.actor_username,
   );
   const actionText = getActionText(event.eventType);
   const time = relativeTime(event.createdAt);
@@ -252,7 +255,7 @@ function TimelineNode({ event }: { event: FeedEvent }) {
       {/* Actor header row */}
       <div className="flex items-baseline gap-2">
         <span className="text-ink text-[14px] font-medium">
-          {getActorDisplayName(meta)}
+          {getActorDisplayName(meta, event.actor)}
         </span>
         <span className="text-ink-tertiary text-[12px]">{actionText}</span>
         <time
@@ -377,27 +380,27 @@ function FeedError() {
 /* ─── Page ─── */
 
 export default function FeedPage() {
-  const [offset, setOffset] = useState(0);
-
   const { data, loading, error, fetchMore } = useQuery<GetFeedData>(GET_FEED, {
-    variables: { limit: PAGE_SIZE, offset: 0 },
+    variables: { first: PAGE_SIZE },
   });
 
-  const events = data?.feed ?? [];
-  const hasMore = events.length > 0 && events.length % PAGE_SIZE === 0;
+  const events = data?.feedConnection.edges.map((edge) => edge.node) ?? [];
+  const pageInfo = data?.feedConnection.pageInfo;
+  const hasMore = pageInfo?.hasNextPage ?? false;
 
   function handleLoadMore() {
-    const nextOffset = offset + PAGE_SIZE;
     fetchMore({
-      variables: { limit: PAGE_SIZE, offset: nextOffset },
+      variables: { first: PAGE_SIZE, after: pageInfo?.endCursor },
       updateQuery(prev, { fetchMoreResult }) {
         if (!fetchMoreResult) return prev;
         return {
-          feed: [...prev.feed, ...fetchMoreResult.feed],
+          feedConnection: {
+            edges: [...prev.feedConnection.edges, ...fetchMoreResult.feedConnection.edges],
+            pageInfo: fetchMoreResult.feedConnection.pageInfo,
+          },
         };
       },
     });
-    setOffset(nextOffset);
   }
 
   return (
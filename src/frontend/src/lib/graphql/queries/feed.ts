@@ -1,14 +1,29 @@
 import { gql } from '@apollo/client';
 
 export const GET_FEED = gql`
-  query GetFeed($limit: Int, $offset: Int) {
-    feed(limit: $limit, offset: $offset) {
-      id
-      eventType
-      targetType
-      targetId
-      metadata
-      createdAt
+  query GetFeed($first: Int, $after: String) {
+    feedConnection(first: $first, after: $after) {
+      edges {
+        cursor
+        node {
+          id
+          eventType
+          targetType
+          targetId
+          metadata
+          createdAt
+          actor {
+            id
+            username
+            displayName
+            avatarUrl
+          }
+        }
+      }
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
     }
   }
 `;
@@ -120,9 +120,11 @@ describe('GraphQL query documents', () => {
       expect(getOperationName(GET_FEED)).toBe('GetFeed');
     });
 
-    it('queries the feed field', () => {
+    it('queries the feed connection by cursor', () => {
       const printed = print(GET_FEED);
-      expect(printed).toContain('feed(');
+      expect(printed).toContain('feedConnection(first: $first, after: $after)');
+      expect(printed).toContain('hasNextPage');
+      expect(printed).toContain('endCursor');
     });
 
     it('requests key event fields', () => {
@@ -133,6 +135,12 @@ describe('GraphQL query documents', () => {
       expect(printed).toContain('metadata');
       expect(printed).toContain('createdAt');
     });
+
+    it('requests the event actor', () => {
+      const printed = print(GET_FEED);
+      expect(printed).toContain('actor {');
+      expect(printed).toContain('displayName');
+    });
   });
 
   describe('GET_PROJECT', () => {
@@ -491,9 +491,12 @@ describe('GraphQL types', () => {
       expect(data.tribes).toHaveLength(0);
     });
 
-    it('GetFeedData holds an array of feed events', () => {
-      const data: GetFeedData = { feed: [] };
-      expect(data.feed).toHaveLength(0);
+    it('GetFeedData holds a page of feed event edges', () => {
+      const data: GetFeedData = {
+        feedConnection: { edges: [], pageInfo: { hasNextPage: false, endCursor: null } },
+      };
+      expect(data.feedConnection.edges).toHaveLength(0);
+      expect(data.feedConnection.pageInfo.hasNextPage).toBe(false);
     });
 
     it('GetPendingInvitationsData holds an array of pending invitations', () => {
@@ -221,6 +221,13 @@ export type EventType =
   | 'MEMBER_JOINED_TRIBE'
   | 'BUILDER_JOINED';
 
+export interface FeedActor {
+  id: string;
+  username: string;
+  displayName: string;
+  avatarUrl: string | null;
+}
+
 export interface FeedEvent {
   id: string;
   eventType: EventType;
@@ -228,6 +235,7 @@ export interface FeedEvent {
   targetId: string;
   metadata: Record<string, unknown>;
   createdAt: string;
+  actor?: FeedActor | null;
 }
 
 export interface AuthPayload {
@@ -294,8 +302,21 @@ export interface SearchTribesData {
   searchTribes: Tribe[];
 }
 
+export interface PageInfo {
+  hasNextPage: boolean;
+  endCursor: string | null;
+}
+
+export interface FeedEventEdge {
+  cursor: string;
+  node: FeedEvent;
+}
+
 export interface GetFeedData {
-  feed: FeedEvent[];
+  feedConnection: {
+    edges: FeedEventEdge[];
+    pageInfo: PageInfo;
+  };
 }
 
 // API token types
@@ -1,6 +1,6 @@
 import { describe, it, expect, vi, beforeEach } from 'vitest';
 import { readConfig } from './config.js';
-import { ingestBurn, verifyToken } from './api-client.js';
+import { ingestBurn, ingestBurnBatch, verifyToken } from './api-client.js';
 
 vi.mock('./config.js', () => ({
   readConfig: vi.fn(() => ({})),
@@ -76,6 +76,29 @@ describe('ingestBurn', () => {
   });
 });
 
+describe('ingestBurnBatch', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    vi.mocked(readConfig).mockReturnValue({});
+    mockFetch.mockResolvedValue(new Response('{}', { status: 200 }));
+  });
+
+  it('POSTs the items to the batch endpoint with a timeout', async () => {
+    const items = [{ tokens_burned: 100, source: 'anthropic', verification: 'v1' }];
+
+    await ingestBurnBatch('tok_test', items);
+
+    expect(mockFetch).toHaveBeenCalledWith(
+      'https://api.findyourtribe.dev/api/burn/ingest/batch',
+      expect.objectContaining({
+        method: 'POST',
+        body: JSON.stringify({ items }),
+        signal: expect.any(AbortSignal),
+      }),
+    );
+  });
+});
+
 describe('verifyToken', () => {
   beforeEach(() => {
     vi.clearAllMocks();
@@ -1,6 +1,9 @@
 import { readConfig } from './config.js';
 
 const DEFAULT_API_URL = 'https://api.findyourtribe.dev';
+// A slow API must not hold up the caller; failed burns are spooled instead
+const INGEST_TIMEOUT_MS = 3_000;
+const BATCH_TIMEOUT_MS = 15_000;
 
 export interface BurnIngestRequest {
   tokens_burned: number;
@@ -39,6 +42,23 @@ export async function ingestBurn(
       'Content-Type': 'application/json',
     },
     body: JSON.stringify(payload),
+    signal: AbortSignal.timeout(INGEST_TIMEOUT_MS),
+  });
+}
+
+export async function ingestBurnBatch(
+  apiToken: string,
+  items: BurnIngestRequest[],
+): Promise<Response> {
+  const apiUrl = getApiUrl();
+  return fetch(`${apiUrl}/api/burn/ingest/batch`, {
+    method: 'POST',
+    headers: {
+      Authorization: `Bearer ${apiToken}`,
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ items }),
+    signal: AbortSignal.timeout(BATCH_TIMEOUT_MS),
   });
 }
 
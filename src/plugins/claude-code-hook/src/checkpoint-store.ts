@@ -0,0 +1,60 @@
+import crypto from 'crypto';
+import fs from 'fs';
+import path from 'path';
+import os from 'os';
+import { resolveTranscriptPath, type TranscriptCheckpoint } from './transcript-parser.js';
+
+const CHECKPOINT_DIR = path.join(os.homedir(), '.fyt', 'checkpoints');
+const CHECKPOINT_MAX_AGE_MS = 30 * 24 * 60 * 60 * 1000;
+
+// One file per transcript, so hooks firing for different sessions never
+// contend for the same file.
+function checkpointPath(transcriptPath: string): string {
+  const key = crypto
+    .createHash('sha256')
+    .update(resolveTranscriptPath(transcriptPath))
+    .digest('hex')
+    .slice(0, 32);
+  return path.join(CHECKPOINT_DIR, `${key}.json`);
+}
+
+export function readCheckpoint(transcriptPath: string): TranscriptCheckpoint | null {
+  try {
+    const content = fs.readFileSync(checkpointPath(transcriptPath), 'utf-8');
+    const checkpoint = JSON.parse(content) as TranscriptCheckpoint;
+    return typeof checkpoint.offset === 'number' ? checkpoint : null;
+  } catch {
+    return null;
+  }
+}
+
+export function writeCheckpoint(transcriptPath: string, checkpoint: TranscriptCheckpoint): void {
+  const target = checkpointPath(transcriptPath);
+  const isNew = !fs.existsSync(target);
+  fs.mkdirSync(CHECKPOINT_DIR, { recursive: true });
+  // Write then rename, so a concurrent reader never sees a partial file
+  const tmp = `${target}.${process.pid}.tmp`;
+  fs.writeFileSync(tmp, JSON.stringify(checkpoint), 'utf-8');
+  fs.renameSync(tmp, target);
+  if (isNew) pruneCheckpoints();
+}
+
+/** Delete checkpoints of transcripts that have not been reported for a month. */
+export function pruneCheckpoints(now: number = Date.now()): void {
+  let entries: string[];
+  try {
+    entries = fs.readdirSync(CHECKPOINT_DIR);
+  } catch {
+    return;
+  }
+  for (const entry of entries) {
+    const file = path.join(CHECKPOINT_DIR, entry);
+    try {
+      if (now - fs.statSync(file).mtimeMs > CHECKPOINT_MAX_AGE_MS) {
+        fs.unlinkSync(file);
+      }
+    } catch {
+      // another hook may have removed it already
+    }
+  }
+}
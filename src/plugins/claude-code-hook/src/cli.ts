@@ -3,6 +3,7 @@ import { installCommand } from './commands/install.js';
 import { reportCommand } from './commands/report.js';
 import { logCommand } from './commands/log.js';
 import { statusCommand } from './commands/status.js';
+import { flushCommand } from './commands/flush.js';
 import type { LogOptions } from './commands/log.js';
 
 const USAGE = `Usage: fyt-burn <command>
@@ -13,6 +14,7 @@ Commands:
   report    Report burn from hook (reads stdin)
   log       Manually log a burn session
   status    Show connection status
+  flush     Upload burns queued while the API was unreachable
 
 Run fyt-burn log --help for log command options`;
 
@@ -78,6 +80,9 @@ async function main(): Promise<void> {
     case 'status':
       await statusCommand();
       break;
+    case 'flush':
+      await flushCommand();
+      break;
     default:
       console.log(USAGE);
       break;
@@ -0,0 +1,12 @@
+import { drainSpool } from '../spool.js';
+
+export async function flushCommand(): Promise<void> {
+  const { sent, dropped, remaining } = await drainSpool();
+  if (sent || dropped || remaining) {
+    console.log(
+      `Uploaded ${sent} queued burns` +
+        (dropped ? `, dropped ${dropped} rejected by the API` : '') +
+        (remaining ? `, ${remaining} still queued` : ''),
+    );
+  }
+}
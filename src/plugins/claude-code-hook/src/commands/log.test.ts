@@ -8,8 +8,16 @@ vi.mock('../api-client.js', () => ({
   ingestBurn: vi.fn(),
 }));
 
+vi.mock('../spool.js', () => ({
+  hasSpooledBurns: vi.fn(() => false),
+  isRetryableStatus: vi.fn((status: number) => status === 429 || status >= 500),
+  spoolBurn: vi.fn(),
+  startBackgroundDrain: vi.fn(),
+}));
+
 import { readConfig } from '../config.js';
 import { ingestBurn } from '../api-client.js';
+import { hasSpooledBurns, spoolBurn, startBackgroundDrain } from '../spool.js';
 import { logCommand } from './log.js';
 
 describe('logCommand', () => {
@@ -223,26 +231,51 @@ describe('logCommand', () => {
   });
 
   describe('error handling', () => {
-    it('exits 1 when ingestBurn throws', async () => {
+    it('queues the burn when ingestBurn throws', async () => {
       vi.mocked(ingestBurn).mockRejectedValue(new Error('Network error'));
 
       await logCommand(1000, {});
 
-      expect(consoleErrorSpy).toHaveBeenCalled();
-      expect(exitSpy).toHaveBeenCalledWith(1);
+      expect(vi.mocked(spoolBurn)).toHaveBeenCalledWith(
+        expect.objectContaining({ tokens_burned: 1000 }),
+      );
+      expect(consoleErrorSpy).toHaveBeenCalledWith(
+        'API unreachable (Network error); queued 1,000 tokens for a later upload',
+      );
+      expect(exitSpy).not.toHaveBeenCalled();
+    });
+
+    it('queues the burn when the API is unavailable', async () => {
+      vi.mocked(ingestBurn).mockResolvedValue(
+        new Response('error', { status: 503, statusText: 'Service Unavailable' }),
+      );
+
+      await logCommand(1000, {});
+
+      expect(vi.mocked(spoolBurn)).toHaveBeenCalled();
+      expect(exitSpy).not.toHaveBeenCalled();
     });
 
     it('exits 1 when response is not ok', async () => {
       vi.mocked(ingestBurn).mockResolvedValue(
-        new Response('error', { status: 500, statusText: 'Internal Server Error' }),
+        new Response('error', { status: 422, statusText: 'Unprocessable Entity' }),
       );
 
       await logCommand(1000, {});
 
       expect(consoleErrorSpy).toHaveBeenCalledWith(
-        'Failed to log burn: Internal Server Error',
+        'Failed to log burn: Unprocessable Entity',
       );
       expect(exitSpy).toHaveBeenCalledWith(1);
+      expect(vi.mocked(spoolBurn)).not.toHaveBeenCalled();
+    });
+
+    it('starts draining queued burns once the API accepts one', async () => {
+      vi.mocked(hasSpooledBurns).mockReturnValueOnce(true);
+
+      await logCommand(1000, {});
+
+      expect(vi.mocked(startBackgroundDrain)).toHaveBeenCalled();
     });
 
     it('prints statusText from response on error', async () => {
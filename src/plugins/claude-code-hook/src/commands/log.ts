@@ -1,5 +1,6 @@
 import { readConfig } from '../config.js';
-import { ingestBurn } from '../api-client.js';
+import { ingestBurn, type BurnIngestRequest } from '../api-client.js';
+import { hasSpooledBurns, isRetryableStatus, spoolBurn, startBackgroundDrain } from '../spool.js';
 
 export interface LogOptions {
   source?: string;
@@ -39,24 +40,35 @@ export async function logCommand(
     token_precision: 'approximate' as const,
   };
 
-  // Call ingestBurn
+  const formattedTokens = tokens.toLocaleString();
+
+  // Call ingestBurn; if the API is down or too slow, queue the burn instead
   let response: Response;
   try {
-    response = await ingestBurn(api_token, payload as Parameters<typeof ingestBurn>[1]);
+    response = await ingestBurn(api_token, payload as BurnIngestRequest);
   } catch (err) {
-    console.error(`Error: ${err instanceof Error ? err.message : 'Unknown error'}`);
-    process.exit(1);
+    spoolBurn(payload as BurnIngestRequest);
+    console.error(
+      `API unreachable (${err instanceof Error ? err.message : 'Unknown error'}); ` +
+        `queued ${formattedTokens} tokens for a later upload`,
+    );
     return;
   }
 
   // Handle response
   if (response.ok) {
-    const formattedTokens = tokens.toLocaleString();
     const forProject = options.project ? ` for ${options.project}` : '';
     const date = options.date || new Date().toISOString().split('T')[0];
     console.log(
       `Logged ${formattedTokens} tokens (self-reported)${forProject} on ${date}`,
     );
+    // The API is back; upload anything queued while it was not
+    if (hasSpooledBurns()) startBackgroundDrain();
+  } else if (isRetryableStatus(response.status)) {
+    spoolBurn(payload as BurnIngestRequest);
+    console.error(
+      `API unavailable (${response.statusText}); queued ${formattedTokens} tokens for a later upload`,
+    );
   } else {
     console.error(`Failed to log burn: ${response.statusText}`);
     process.exit(1);
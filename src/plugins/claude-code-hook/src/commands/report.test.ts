@@ -2,7 +2,13 @@ import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import { PassThrough } from 'stream';
 
 vi.mock('../transcript-parser.js', () => ({
-  parseTranscript: vi.fn(),
+  readTranscriptFrom: vi.fn(),
+  usageDelta: vi.fn(),
+}));
+
+vi.mock('../checkpoint-store.js', () => ({
+  readCheckpoint: vi.fn(),
+  writeCheckpoint: vi.fn(),
 }));
 
 vi.mock('../project-resolver.js', () => ({
@@ -17,11 +23,20 @@ vi.mock('../api-client.js', () => ({
   ingestBurn: vi.fn(),
 }));
 
-import { parseTranscript } from '../transcript-parser.js';
+vi.mock('../spool.js', () => ({
+  hasSpooledBurns: vi.fn(),
+  isRetryableStatus: vi.fn((status: number) => status === 429 || status >= 500),
+  spoolBurn: vi.fn(),
+  startBackgroundDrain: vi.fn(),
+}));
+
+import { readTranscriptFrom, usageDelta } from '../transcript-parser.js';
+import { readCheckpoint, writeCheckpoint } from '../checkpoint-store.js';
 import { resolveProjectHint } from '../project-resolver.js';
 import { readConfig } from '../config.js';
 import { ingestBurn } from '../api-client.js';
-import type { TranscriptUsage } from '../transcript-parser.js';
+import { hasSpooledBurns, spoolBurn, startBackgroundDrain } from '../spool.js';
+import type { TranscriptCheckpoint, TranscriptUsage } from '../transcript-parser.js';
 import { reportCommand } from './report.js';
 
 const MOCK_USAGE: TranscriptUsage = {
@@ -36,6 +51,19 @@ const MOCK_USAGE: TranscriptUsage = {
   version: '1.0.0',
 };
 
+const MOCK_CHECKPOINT: TranscriptCheckpoint = {
+  offset: 4096,
+  input_tokens: 3000,
+  output_tokens: 2000,
+  cache_creation_tokens: 0,
+  cache_read_tokens: 0,
+  message_count: 10,
+  model: 'claude-opus-4-6',
+  version: '1.0.0',
+  first_timestamp: '2024-01-15T10:00:00.000Z',
+  last_timestamp: '2024-01-15T10:02:00.000Z',
+};
+
 const VALID_PAYLOAD = JSON.stringify({
   session_id: 'sess_123',
   transcript_path: '/path/to/transcript.jsonl',
@@ -51,6 +79,9 @@ describe('reportCommand', () => {
 
   beforeEach(() => {
     vi.clearAllMocks();
+    vi.mocked(readCheckpoint).mockReturnValue(null);
+    vi.mocked(usageDelta).mockReturnValue(MOCK_USAGE);
+    vi.mocked(hasSpooledBurns).mockReturnValue(false);
     exitSpy = vi
       .spyOn(process, 'exit')
       .mockImplementation(() => undefined as never);
@@ -81,7 +112,7 @@ describe('reportCommand', () => {
   }
 
   function setupSuccessCase(): void {
-    vi.mocked(parseTranscript).mockResolvedValue(MOCK_USAGE);
+    vi.mocked(readTranscriptFrom).mockResolvedValue(MOCK_CHECKPOINT);
     vi.mocked(resolveProjectHint).mockReturnValue('user/project');
     vi.mocked(readConfig).mockReturnValue({
       api_token: 'test_token',
@@ -99,7 +130,7 @@ describe('reportCommand', () => {
     await reportCommand();
 
     expect(exitSpy).toHaveBeenCalledWith(0);
-    expect(vi.mocked(parseTranscript)).not.toHaveBeenCalled();
+    expect(vi.mocked(readTranscriptFrom)).not.toHaveBeenCalled();
   });
 
   it('exits 0 when stdin is whitespace only', async () => {
@@ -108,7 +139,7 @@ describe('reportCommand', () => {
     await reportCommand();
 
     expect(exitSpy).toHaveBeenCalledWith(0);
-    expect(vi.mocked(parseTranscript)).not.toHaveBeenCalled();
+    expect(vi.mocked(readTranscriptFrom)).not.toHaveBeenCalled();
   });
 
   it('exits 0 when stdin has invalid JSON', async () => {
@@ -117,7 +148,7 @@ describe('reportCommand', () => {
     await reportCommand();
 
     expect(exitSpy).toHaveBeenCalledWith(0);
-    expect(vi.mocked(parseTranscript)).not.toHaveBeenCalled();
+    expect(vi.mocked(readTranscriptFrom)).not.toHaveBeenCalled();
   });
 
   it('exits 0 when transcript_path is missing from payload', async () => {
@@ -126,11 +157,11 @@ describe('reportCommand', () => {
     await reportCommand();
 
     expect(exitSpy).toHaveBeenCalledWith(0);
-    expect(vi.mocked(parseTranscript)).not.toHaveBeenCalled();
+    expect(vi.mocked(readTranscriptFrom)).not.toHaveBeenCalled();
   });
 
-  it('exits 0 when parseTranscript returns null', async () => {
-    vi.mocked(parseTranscript).mockResolvedValue(null);
+  it('exits 0 when the transcript cannot be read', async () => {
+    vi.mocked(readTranscriptFrom).mockResolvedValue(null);
     setStdin(VALID_PAYLOAD);
 
     await reportCommand();
@@ -140,7 +171,7 @@ describe('reportCommand', () => {
   });
 
   it('exits 0 and prints message to stderr when no api_token configured', async () => {
-    vi.mocked(parseTranscript).mockResolvedValue(MOCK_USAGE);
+    vi.mocked(readTranscriptFrom).mockResolvedValue(MOCK_CHECKPOINT);
     vi.mocked(resolveProjectHint).mockReturnValue(null);
     vi.mocked(readConfig).mockReturnValue({});
     setStdin(VALID_PAYLOAD);
@@ -213,13 +244,62 @@ describe('reportCommand', () => {
     expect(vi.mocked(ingestBurn)).toHaveBeenCalledWith(
       'test_token',
       expect.objectContaining({
-        session_id: 'sess_123',
+        session_id: 'sess_123:0',
         tokens_burned: 5000,
         source: 'anthropic',
       }),
     );
   });
 
+  it('keys the delta by the offset it starts at', async () => {
+    setupSuccessCase();
+    vi.mocked(readCheckpoint).mockReturnValue({ ...MOCK_CHECKPOINT, offset: 1024 });
+
+    await reportCommand();
+
+    expect(vi.mocked(readTranscriptFrom)).toHaveBeenCalledWith(
+      '/path/to/transcript.jsonl',
+      expect.objectContaining({ offset: 1024 }),
+    );
+    expect(vi.mocked(ingestBurn)).toHaveBeenCalledWith(
+      'test_token',
+      expect.objectContaining({ session_id: 'sess_123:1024' }),
+    );
+  });
+
+  it('saves the checkpoint after a successful ingest', async () => {
+    setupSuccessCase();
+
+    await reportCommand();
+
+    expect(vi.mocked(writeCheckpoint)).toHaveBeenCalledWith(
+      '/path/to/transcript.jsonl',
+      MOCK_CHECKPOINT,
+    );
+  });
+
+  it('keeps the old checkpoint when the API rejects the delta', async () => {
+    setupSuccessCase();
+    vi.mocked(ingestBurn).mockResolvedValue(new Response('error', { status: 422 }));
+
+    await reportCommand();
+
+    expect(vi.mocked(writeCheckpoint)).not.toHaveBeenCalled();
+  });
+
+  it('advances the checkpoint without sending when nothing new was burned', async () => {
+    setupSuccessCase();
+    vi.mocked(usageDelta).mockReturnValue(null);
+
+    await reportCommand();
+
+    expect(vi.mocked(ingestBurn)).not.toHaveBeenCalled();
+    expect(vi.mocked(writeCheckpoint)).toHaveBeenCalledWith(
+      '/path/to/transcript.jsonl',
+      MOCK_CHECKPOINT,
+    );
+  });
+
   it('sets activity_date to today in YYYY-MM-DD format', async () => {
     setupSuccessCase();
     const today = new Date().toISOString().slice(0, 10);
@@ -245,7 +325,7 @@ describe('reportCommand', () => {
   });
 
   it('exits 0 and prints to stderr when ingestBurn throws', async () => {
-    vi.mocked(parseTranscript).mockResolvedValue(MOCK_USAGE);
+    vi.mocked(readTranscriptFrom).mockResolvedValue(MOCK_CHECKPOINT);
     vi.mocked(resolveProjectHint).mockReturnValue(null);
     vi.mocked(readConfig).mockReturnValue({
       api_token: 'test_token',
@@ -261,8 +341,46 @@ describe('reportCommand', () => {
     expect(vi.mocked(ingestBurn)).toHaveBeenCalled();
   });
 
+  it('queues the burn and advances the checkpoint when the API is unreachable', async () => {
+    setupSuccessCase();
+    vi.mocked(ingestBurn).mockRejectedValue(new Error('timeout'));
+
+    await reportCommand();
+
+    expect(vi.mocked(spoolBurn)).toHaveBeenCalledWith(
+      expect.objectContaining({ session_id: 'sess_123:0', tokens_burned: 5000 }),
+    );
+    expect(vi.mocked(writeCheckpoint)).toHaveBeenCalledWith(
+      '/path/to/transcript.jsonl',
+      MOCK_CHECKPOINT,
+    );
+    expect(exitSpy).toHaveBeenCalledWith(0);
+  });
+
+  it('queues the burn when the API returns a retryable status', async () => {
+    setupSuccessCase();
+    vi.mocked(ingestBurn).mockResolvedValue(new Response('busy', { status: 429 }));
+
+    await reportCommand();
+
+    expect(vi.mocked(spoolBurn)).toHaveBeenCalled();
+    expect(vi.mocked(writeCheckpoint)).toHaveBeenCalled();
+  });
+
+  it('queues behind earlier burns and drains in the background', async () => {
+    setupSuccessCase();
+    vi.mocked(hasSpooledBurns).mockReturnValue(true);
+
+    await reportCommand();
+
+    expect(vi.mocked(ingestBurn)).not.toHaveBeenCalled();
+    expect(vi.mocked(spoolBurn)).toHaveBeenCalled();
+    expect(vi.mocked(startBackgroundDrain)).toHaveBeenCalled();
+    expect(vi.mocked(writeCheckpoint)).toHaveBeenCalled();
+  });
+
   it('exits 0 and prints to stderr when ingestBurn returns non-ok response', async () => {
-    vi.mocked(parseTranscript).mockResolvedValue(MOCK_USAGE);
+    vi.mocked(readTranscriptFrom).mockResolvedValue(MOCK_CHECKPOINT);
     vi.mocked(resolveProjectHint).mockReturnValue(null);
     vi.mocked(readConfig).mockReturnValue({
       api_token: 'test_token',
@@ -282,7 +400,7 @@ describe('reportCommand', () => {
   });
 
   it('uses null project_hint when resolveProjectHint throws', async () => {
-    vi.mocked(parseTranscript).mockResolvedValue(MOCK_USAGE);
+    vi.mocked(readTranscriptFrom).mockResolvedValue(MOCK_CHECKPOINT);
     vi.mocked(resolveProjectHint).mockImplementation(() => {
       throw new Error('Not a git repo');
     });
@@ -305,7 +423,7 @@ describe('reportCommand', () => {
   });
 
   it('exits 0 on any unexpected error', async () => {
-    vi.mocked(parseTranscript).mockRejectedValue(new Error('Unexpected'));
+    vi.mocked(readTranscriptFrom).mockRejectedValue(new Error('Unexpected'));
     vi.mocked(readConfig).mockReturnValue({
       api_token: 'test_token',
       api_url: 'https://api.example.com',
@@ -1,7 +1,9 @@
-import { parseTranscript } from '../transcript-parser.js';
+import { readTranscriptFrom, usageDelta } from '../transcript-parser.js';
+import { readCheckpoint, writeCheckpoint } from '../checkpoint-store.js';
 import { resolveProjectHint } from '../project-resolver.js';
 import { readConfig } from '../config.js';
-import { ingestBurn } from '../api-client.js';
+import { ingestBurn, type BurnIngestRequest } from '../api-client.js';
+import { hasSpooledBurns, isRetryableStatus, spoolBurn, startBackgroundDrain } from '../spool.js';
 
 const STDIN_TIMEOUT_MS = 10_000;
 
@@ -44,8 +46,19 @@ async function doReport(): Promise<void> {
 
   if (!transcript_path) return;
 
-  const usage = await parseTranscript(transcript_path);
-  if (!usage) return;
+  // Only the part of the transcript appended since the last successful
+  // report is parsed and sent.
+  const previous = readCheckpoint(transcript_path);
+  const checkpoint = await readTranscriptFrom(transcript_path, previous);
+  if (!checkpoint) return;
+
+  const usage = usageDelta(previous, checkpoint);
+  if (!usage) {
+    if (checkpoint.offset !== previous?.offset) {
+      writeCheckpoint(transcript_path, checkpoint);
+    }
+    return;
+  }
 
   let project_hint: string | null = null;
   try {
@@ -65,33 +78,54 @@ async function doReport(): Promise<void> {
 
   const activity_date = new Date().toISOString().slice(0, 10);
 
+  const payload: BurnIngestRequest = {
+    // Each delta is keyed by where it starts, so a retried delta is
+    // deduplicated by the API but the next one is not.
+    session_id: session_id && `${session_id}:${previous?.offset ?? 0}`,
+    tokens_burned: usage.total_tokens,
+    source: 'anthropic',
+    tool: 'claude_code',
+    verification: 'extension_tracked',
+    project_hint: project_hint ?? undefined,
+    activity_date,
+    token_precision: 'exact',
+    metadata: {
+      model: usage.model,
+      messages: usage.message_count,
+      duration_s: usage.duration_s,
+      claude_code_version: usage.version,
+    },
+  };
+
+  // While earlier burns are still queued, queue this one behind them so the
+  // backlog goes up in batches rather than one request per hook.
+  if (hasSpooledBurns()) {
+    spoolBurn(payload);
+    writeCheckpoint(transcript_path, checkpoint);
+    startBackgroundDrain();
+    return;
+  }
+
   let response: Response;
   try {
-    response = await ingestBurn(api_token, {
-      session_id,
-      tokens_burned: usage.total_tokens,
-      source: 'anthropic',
-      tool: 'claude_code',
-      verification: 'extension_tracked',
-      project_hint: project_hint ?? undefined,
-      activity_date,
-      token_precision: 'exact',
-      metadata: {
-        model: usage.model,
-        messages: usage.message_count,
-        duration_s: usage.duration_s,
-        claude_code_version: usage.version,
-      },
-    });
+    response = await ingestBurn(api_token, payload);
   } catch (err) {
-    process.stderr.write(`fyt-burn: failed to report: ${err}\n`);
+    spoolBurn(payload);
+    writeCheckpoint(transcript_path, checkpoint);
+    process.stderr.write(`fyt-burn: API unreachable, burn queued: ${err}\n`);
     return;
   }
 
   if (!response.ok) {
+    if (isRetryableStatus(response.status)) {
+      spoolBurn(payload);
+      writeCheckpoint(transcript_path, checkpoint);
+    }
     process.stderr.write(`fyt-burn: API error ${response.status}\n`);
     return;
   }
+
+  writeCheckpoint(transcript_path, checkpoint);
 }
 
 export async function reportCommand(): Promise<void> {
@@ -0,0 +1,191 @@
+import { describe, it, expect, vi, beforeEach, afterAll } from 'vitest';
+import fs from 'fs';
+import path from 'path';
+
+// Runs before the mocks below, so it cannot use (the mocked) os itself
+const { home } = vi.hoisted(() => ({
+  home: `${process.env.TMPDIR ?? '/tmp'}/fyt-spool-${process.pid}-${Date.now()}`,
+}));
+
+vi.mock('os', async (importOriginal) => {
+  const actual = await importOriginal<typeof import('os')>();
+  return { ...actual, default: { ...actual, homedir: () => home } };
+});
+
+vi.mock('./config.js', () => ({
+  readConfig: vi.fn(() => ({ api_token: 'test_token' })),
+}));
+
+vi.mock('./api-client.js', () => ({
+  ingestBurnBatch: vi.fn(),
+}));
+
+vi.mock('child_process', () => ({
+  spawn: vi.fn(() => ({ unref: vi.fn() })),
+}));
+
+import { spawn } from 'child_process';
+import { ingestBurnBatch } from './api-client.js';
+import {
+  MAX_BATCH_SIZE,
+  backoffDelay,
+  drainSpool,
+  hasSpooledBurns,
+  isRetryableStatus,
+  spoolBurn,
+  startBackgroundDrain,
+} from './spool.js';
+
+const SPOOL_DIR = path.join(home, '.fyt');
+const noSleep = async (): Promise<void> => {};
+
+function burn(tokens: number) {
+  return { tokens_burned: tokens, source: 'anthropic', verification: 'extension_tracked' };
+}
+
+describe('spool', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    fs.rmSync(SPOOL_DIR, { recursive: true, force: true });
+    vi.mocked(ingestBurnBatch).mockResolvedValue(new Response('{}', { status: 200 }));
+  });
+
+  afterAll(() => {
+    fs.rmSync(home, { recursive: true, force: true });
+  });
+
+  it('uploads spooled burns in batches of at most MAX_BATCH_SIZE', async () => {
+    for (let i = 1; i <= MAX_BATCH_SIZE + 20; i++) spoolBurn(burn(i));
+    expect(hasSpooledBurns()).toBe(true);
+
+    const result = await drainSpool({ sleep: noSleep });
+
+    expect(result).toEqual({ sent: MAX_BATCH_SIZE + 20, dropped: 0, remaining: 0 });
+    const sizes = vi.mocked(ingestBurnBatch).mock.calls.map(([, items]) => items.length);
+    expect(sizes).toEqual([MAX_BATCH_SIZE, 20]);
+    expect(hasSpooledBurns()).toBe(false);
+  });
+
+  it('retries a batch with backoff before giving up on it', async () => {
+    spoolBurn(burn(1));
+    vi.mocked(ingestBurnBatch)
+      .mockRejectedValueOnce(new Error('ECONNREFUSED'))
+      .mockResolvedValueOnce(new Response('busy', { status: 503 }));
+    const sleep = vi.fn(noSleep);
+
+    const result = await drainSpool({ sleep, random: () => 0.5 });
+
+    expect(result.sent).toBe(1);
+    expect(vi.mocked(ingestBurnBatch)).toHaveBeenCalledTimes(3);
+    // start jitter, then one backoff per retry
+    expect(sleep).toHaveBeenCalledTimes(3);
+  });
+
+  it('puts unsent burns back on the spool when the API stays down', async () => {
+    spoolBurn(burn(1));
+    spoolBurn(burn(2));
+    vi.mocked(ingestBurnBatch).mockRejectedValue(new Error('ECONNREFUSED'));
+
+    const result = await drainSpool({ sleep: noSleep });
+
+    expect(result).toEqual({ sent: 0, dropped: 0, remaining: 2 });
+    expect(hasSpooledBurns()).toBe(true);
+    expect(fs.readdirSync(SPOOL_DIR).filter((f) => f.endsWith('.draining'))).toEqual([]);
+  });
+
+  it('drops a batch the API rejects as invalid', async () => {
+    spoolBurn(burn(1));
+    vi.mocked(ingestBurnBatch).mockResolvedValue(new Response('bad', { status: 422 }));
+
+    const result = await drainSpool({ sleep: noSleep });
+
+    expect(result).toEqual({ sent: 0, dropped: 1, remaining: 0 });
+    expect(vi.mocked(ingestBurnBatch)).toHaveBeenCalledTimes(1);
+    expect(hasSpooledBurns()).toBe(false);
+  });
+
+  it('re-sends a rejected batch one burn at a time, dropping only the bad ones', async () => {
+    for (let i = 1; i <= 3; i++) spoolBurn(burn(i));
+    vi.mocked(ingestBurnBatch).mockImplementation(async (_token, items) =>
+      items.some((item) => item.tokens_burned === 2)
+        ? new Response('bad', { status: 422 })
+        : new Response('{}', { status: 200 }),
+    );
+
+    const result = await drainSpool({ sleep: noSleep });
+
+    expect(result).toEqual({ sent: 2, dropped: 1, remaining: 0 });
+    const sizes = vi.mocked(ingestBurnBatch).mock.calls.map(([, items]) => items.length);
+    expect(sizes).toEqual([3, 1, 1, 1]);
+  });
+
+  it('respools the rest of a rejected batch if the API goes down while splitting it', async () => {
+    for (let i = 1; i <= 3; i++) spoolBurn(burn(i));
+    vi.mocked(ingestBurnBatch)
+      .mockResolvedValueOnce(new Response('bad', { status: 422 }))
+      .mockResolvedValueOnce(new Response('{}', { status: 200 }))
+      .mockRejectedValue(new Error('ECONNREFUSED'));
+
+    const result = await drainSpool({ sleep: noSleep });
+
+    expect(result).toEqual({ sent: 1, dropped: 0, remaining: 2 });
+    expect(hasSpooledBurns()).toBe(true);
+  });
+
+  it('keeps burns queued when the token is rejected', async () => {
+    spoolBurn(burn(1));
+    vi.mocked(ingestBurnBatch).mockResolvedValue(new Response('no', { status: 401 }));
+
+    const result = await drainSpool({ sleep: noSleep });
+
+    expect(result.remaining).toBe(1);
+    expect(vi.mocked(ingestBurnBatch)).toHaveBeenCalledTimes(1);
+  });
+
+  it('does nothing while another drain holds the lock', async () => {
+    spoolBurn(burn(1));
+    fs.writeFileSync(path.join(SPOOL_DIR, 'spool.lock'), '');
+
+    const result = await drainSpool({ sleep: noSleep });
+
+    expect(result).toEqual({ sent: 0, dropped: 0, remaining: 0 });
+    expect(vi.mocked(ingestBurnBatch)).not.toHaveBeenCalled();
+    expect(hasSpooledBurns()).toBe(true);
+  });
+
+  it('starts the background drain with the parent node flags', () => {
+    const { execArgv, argv } = process;
+    Object.defineProperty(process, 'execArgv', { value: ['--experimental-strip-types'] });
+    process.argv = [argv[0], '/opt/fyt-burn/bin/fyt-burn.js'];
+    try {
+      startBackgroundDrain();
+    } finally {
+      Object.defineProperty(process, 'execArgv', { value: execArgv });
+      process.argv = argv;
+    }
+
+    expect(vi.mocked(spawn)).toHaveBeenCalledWith(
+      process.execPath,
+      ['--experimental-strip-types', '/opt/fyt-burn/bin/fyt-burn.js', 'flush'],
+      expect.objectContaining({ detached: true }),
+    );
+  });
+});
+
+describe('isRetryableStatus', () => {
+  it('retries throttling and server errors only', () => {
+    expect(isRetryableStatus(429)).toBe(true);
+    expect(isRetryableStatus(503)).toBe(true);
+    expect(isRetryableStatus(400)).toBe(false);
+    expect(isRetryableStatus(401)).toBe(false);
+  });
+});
+
+describe('backoffDelay', () => {
+  it('grows exponentially up to a cap, scaled by jitter', () => {
+    expect(backoffDelay(1, () => 0.999)).toBeLessThan(1000);
+    expect(backoffDelay(3, () => 0.5)).toBe(2000);
+    expect(backoffDelay(10, () => 0.5)).toBe(4000);
+    expect(backoffDelay(3, () => 0)).toBe(0);
+  });
+});
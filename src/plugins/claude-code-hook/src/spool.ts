@@ -0,0 +1,239 @@
+import { spawn } from 'child_process';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { readConfig } from './config.js';
+import { ingestBurnBatch, type BurnIngestRequest } from './api-client.js';
+
+const SPOOL_DIR = path.join(os.homedir(), '.fyt');
+const SPOOL_PATH = path.join(SPOOL_DIR, 'spool.jsonl');
+const LOCK_PATH = path.join(SPOOL_DIR, 'spool.lock');
+const DRAINING_SUFFIX = '.draining';
+// A lock this old belongs to a drainer that died mid-upload
+const STALE_LOCK_MS = 10 * 60 * 1000;
+
+// Matches MAX_BATCH_SIZE of POST /api/burn/ingest/batch
+export const MAX_BATCH_SIZE = 500;
+const MAX_ATTEMPTS = 4;
+const BACKOFF_BASE_MS = 500;
+const BACKOFF_CAP_MS = 8_000;
+// Spread the drains of many machines coming back after an outage
+const START_JITTER_MS = 1_000;
+
+export interface DrainOptions {
+  sleep?: (ms: number) => Promise<void>;
+  random?: () => number;
+}
+
+export interface DrainResult {
+  sent: number;
+  dropped: number;
+  remaining: number;
+}
+
+function defaultSleep(ms: number): Promise<void> {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+/** Network errors, timeouts, throttling and server errors are worth retrying. */
+export function isRetryableStatus(status: number): boolean {
+  return status === 408 || status === 429 || status >= 500;
+}
+
+/** Full-jitter exponential backoff for the given (zero-based) retry attempt. */
+export function backoffDelay(attempt: number, random: () => number = Math.random): number {
+  return Math.floor(random() * Math.min(BACKOFF_CAP_MS, BACKOFF_BASE_MS * 2 ** attempt));
+}
+
+/** Queue a burn for a later upload. Appends are atomic for a single short line. */
+export function spoolBurn(payload: BurnIngestRequest): void {
+  fs.mkdirSync(SPOOL_DIR, { recursive: true });
+  fs.appendFileSync(SPOOL_PATH, `${JSON.stringify(payload)}\n`, 'utf-8');
+}
+
+export function hasSpooledBurns(): boolean {
+  try {
+    return fs.statSync(SPOOL_PATH).size > 0;
+  } catch {
+    return false;
+  }
+}
+
+function lockIsHeld(): boolean {
+  try {
+    return Date.now() - fs.statSync(LOCK_PATH).mtimeMs < STALE_LOCK_MS;
+  } catch {
+    return false;
+  }
+}
+
+function acquireLock(): boolean {
+  if (!lockIsHeld()) {
+    try {
+      fs.unlinkSync(LOCK_PATH);
+    } catch {
+      // no lock, or a stale one already cleared
+    }
+  }
+  try {
+    fs.mkdirSync(SPOOL_DIR, { recursive: true });
+    fs.closeSync(fs.openSync(LOCK_PATH, 'wx'));
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+function releaseLock(): void {
+  try {
+    fs.unlinkSync(LOCK_PATH);
+  } catch {
+    // already released
+  }
+}
+
+/**
+ * Drain the spool in a detached child process, so the calling hook returns
+ * immediately whatever the API's latency. Does nothing while a drain runs.
+ */
+export function startBackgroundDrain(): void {
+  const cli = process.argv[1];
+  if (!cli || lockIsHeld()) return;
+  // Pass on the parent's node flags (e.g. --experimental-strip-types), which
+  // the child needs to load the same TypeScript entry point
+  const child = spawn(process.execPath, [...process.execArgv, cli, 'flush'], {
+    detached: true,
+    stdio: 'ignore',
+  });
+  child.unref();
+}
+
+// Move the spool aside so new burns start a fresh one while this drain runs.
+// Drain files left behind by a drainer that died are picked up as well.
+function claimSpoolFiles(): string[] {
+  try {
+    fs.renameSync(SPOOL_PATH, `${SPOOL_PATH}.${process.pid}.${Date.now()}${DRAINING_SUFFIX}`);
+  } catch {
+    // nothing spooled since the last drain
+  }
+  try {
+    return fs
+      .readdirSync(SPOOL_DIR)
+      .filter((entry) => entry.endsWith(DRAINING_SUFFIX))
+      .sort()
+      .map((entry) => path.join(SPOOL_DIR, entry));
+  } catch {
+    return [];
+  }
+}
+
+function readSpoolFile(file: string): BurnIngestRequest[] {
+  const items: BurnIngestRequest[] = [];
+  for (const line of fs.readFileSync(file, 'utf-8').split('\n')) {
+    if (!line.trim()) continue;
+    try {
+      items.push(JSON.parse(line) as BurnIngestRequest);
+    } catch {
+      // a torn write; the rest of the spool is still good
+    }
+  }
+  return items;
+}
+
+/**
+ * Upload every spooled burn in batches, retrying each batch with jittered
+ * exponential backoff. If the API stays unavailable, whatever was not sent is
+ * put back on the spool for a later drain. When the API rejects a batch
+ * outright (other than for auth), its burns are re-sent one at a time and
+ * only those rejected on their own are dropped, so one bad burn neither
+ * wedges the queue nor takes the valid burns of its batch with it.
+ * Only one drain runs at a time; others return at once.
+ */
+export async function drainSpool(options: DrainOptions = {}): Promise<DrainResult> {
+  const result: DrainResult = { sent: 0, dropped: 0, remaining: 0 };
+  const apiToken = readConfig().api_token;
+  if (!apiToken || !acquireLock()) return result;
+  try {
+    return await drainClaimed(apiToken, options, result);
+  } finally {
+    releaseLock();
+  }
+}
+
+type Outcome = 'sent' | 'rejected' | 'unavailable';
+
+/** Send one batch, retrying with jittered backoff while the failure is transient. */
+async function sendBatch(
+  apiToken: string,
+  batch: BurnIngestRequest[],
+  sleep: (ms: number) => Promise<void>,
+  random: () => number,
+): Promise<Outcome> {
+  for (let attempt = 0; attempt < MAX_ATTEMPTS; attempt++) {
+    if (attempt > 0) await sleep(backoffDelay(attempt, random));
+    let response: Response;
+    try {
+      response = await ingestBurnBatch(apiToken, batch);
+    } catch {
+      continue;
+    }
+    if (response.ok) return 'sent';
+    if (response.status === 401 || response.status === 403) return 'unavailable';
+    if (!isRetryableStatus(response.status)) return 'rejected';
+  }
+  return 'unavailable';
+}
+
+async function drainClaimed(
+  apiToken: string,
+  options: DrainOptions,
+  result: DrainResult,
+): Promise<DrainResult> {
+  const sleep = options.sleep ?? defaultSleep;
+  const random = options.random ?? Math.random;
+
+  const files = claimSpoolFiles();
+  const items = files.flatMap(readSpoolFile);
+  if (items.length) await sleep(Math.floor(random() * START_JITTER_MS));
+
+  let next = 0;
+  drain: while (next < items.length) {
+    const batch = items.slice(next, next + MAX_BATCH_SIZE);
+    const outcome = await sendBatch(apiToken, batch, sleep, random);
+
+    if (outcome === 'unavailable') break;
+    if (outcome === 'sent') {
+      result.sent += batch.length;
+      next += batch.length;
+      continue;
+    }
+    if (batch.length === 1) {
+      result.dropped += 1;
+      next += 1;
+      continue;
+    }
+
+    // The API rejects a whole batch for a single bad burn, so send them on
+    // their own to tell the bad ones from the rest
+    for (const item of batch) {
+      const itemOutcome = await sendBatch(apiToken, [item], sleep, random);
+      if (itemOutcome === 'unavailable') break drain;
+      if (itemOutcome === 'sent') result.sent += 1;
+      else result.dropped += 1;
+      next += 1;
+    }
+  }
+
+  const unsent = items.slice(next);
+  for (const item of unsent) spoolBurn(item);
+  result.remaining = unsent.length;
+
+  for (const file of files) {
+    try {
+      fs.unlinkSync(file);
+    } catch {
+      // already gone
+    }
+  }
+  return result;
+}
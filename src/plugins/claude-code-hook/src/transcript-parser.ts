@@ -14,84 +14,132 @@ export interface TranscriptUsage {
   version: string | null;
 }
 
-export async function parseTranscript(filePath: string): Promise<TranscriptUsage | null> {
-  const resolvedPath = filePath.startsWith('~')
+/**
+ * Running totals for a transcript up to `offset`, the byte position just past
+ * the last complete line that has been parsed.
+ */
+export interface TranscriptCheckpoint {
+  offset: number;
+  input_tokens: number;
+  output_tokens: number;
+  cache_creation_tokens: number;
+  cache_read_tokens: number;
+  message_count: number;
+  model: string | null;
+  version: string | null;
+  first_timestamp: string | null;
+  last_timestamp: string | null;
+}
+
+const NEWLINE = 0x0a;
+
+export function resolveTranscriptPath(filePath: string): string {
+  return filePath.startsWith('~')
     ? path.join(os.homedir(), filePath.slice(1))
     : filePath;
+}
 
-  let content: string;
+function emptyCheckpoint(): TranscriptCheckpoint {
+  return {
+    offset: 0,
+    input_tokens: 0,
+    output_tokens: 0,
+    cache_creation_tokens: 0,
+    cache_read_tokens: 0,
+    message_count: 0,
+    model: null,
+    version: null,
+    first_timestamp: null,
+    last_timestamp: null,
+  };
+}
+
+function parseLine(line: string): Record<string, unknown> | null {
+  const trimmed = line.trim();
+  if (!trimmed) return null;
   try {
-    content = fs.readFileSync(resolvedPath, 'utf-8');
+    return JSON.parse(trimmed) as Record<string, unknown>;
   } catch {
     return null;
   }
+}
 
-  const lines = content.split('\n');
-
-  let input_tokens = 0;
-  let output_tokens = 0;
-  let cache_creation_tokens = 0;
-  let cache_read_tokens = 0;
-  let message_count = 0;
-  let model: string | null = null;
-  let version: string | null = null;
-  let firstTimestamp: string | null = null;
-  let lastTimestamp: string | null = null;
-
-  for (const line of lines) {
-    const trimmed = line.trim();
-    if (!trimmed) continue;
-
-    let entry: Record<string, unknown>;
-    try {
-      entry = JSON.parse(trimmed) as Record<string, unknown>;
-    } catch {
-      continue;
-    }
+function accumulate(state: TranscriptCheckpoint, entry: Record<string, unknown> | null): void {
+  if (entry === null) return;
+  if (entry.type !== 'assistant') return;
+  if (entry.isSidechain === true) return;
 
-    if (entry.type !== 'assistant') continue;
-    if (entry.isSidechain === true) continue;
-
-    const message = entry.message as Record<string, unknown> | undefined;
-    const usage = message?.usage as Record<string, unknown> | undefined;
-
-    const entryInput = typeof usage?.input_tokens === 'number' ? usage.input_tokens : 0;
-    const entryOutput = typeof usage?.output_tokens === 'number' ? usage.output_tokens : 0;
-    const entryCacheCreation =
-      typeof usage?.cache_creation_input_tokens === 'number'
-        ? usage.cache_creation_input_tokens
-        : 0;
-    const entryCacheRead =
-      typeof usage?.cache_read_input_tokens === 'number' ? usage.cache_read_input_tokens : 0;
-
-    input_tokens += entryInput;
-    output_tokens += entryOutput;
-    cache_creation_tokens += entryCacheCreation;
-    cache_read_tokens += entryCacheRead;
-    message_count += 1;
-
-    if (model === null && typeof message?.model === 'string') {
-      model = message.model;
-    }
+  const message = entry.message as Record<string, unknown> | undefined;
+  const usage = message?.usage as Record<string, unknown> | undefined;
 
-    if (version === null && typeof entry.version === 'string') {
-      version = entry.version;
-    }
+  const entryInput = typeof usage?.input_tokens === 'number' ? usage.input_tokens : 0;
+  const entryOutput = typeof usage?.output_tokens === 'number' ? usage.output_tokens : 0;
+  const entryCacheCreation =
+    typeof usage?.cache_creation_input_tokens === 'number'
+      ? usage.cache_creation_input_tokens
+      : 0;
+  const entryCacheRead =
+    typeof usage?.cache_read_input_tokens === 'number' ? usage.cache_read_input_tokens : 0;
 
-    if (typeof entry.timestamp === 'string') {
-      if (firstTimestamp === null) firstTimestamp = entry.timestamp;
-      lastTimestamp = entry.timestamp;
-    }
+  state.input_tokens += entryInput;
+  state.output_tokens += entryOutput;
+  state.cache_creation_tokens += entryCacheCreation;
+  state.cache_read_tokens += entryCacheRead;
+  state.message_count += 1;
+
+  if (state.model === null && typeof message?.model === 'string') {
+    state.model = message.model;
   }
 
-  const total_tokens = input_tokens + output_tokens + cache_creation_tokens + cache_read_tokens;
+  if (state.version === null && typeof entry.version === 'string') {
+    state.version = entry.version;
+  }
 
-  if (total_tokens === 0) return null;
+  if (typeof entry.timestamp === 'string') {
+    if (state.first_timestamp === null) state.first_timestamp = entry.timestamp;
+    state.last_timestamp = entry.timestamp;
+  }
+}
 
-  const duration_s =
-    firstTimestamp !== null && lastTimestamp !== null
-      ? (new Date(lastTimestamp).getTime() - new Date(firstTimestamp).getTime()) / 1000
-      : 0;
+function totalTokens(state: TranscriptCheckpoint): number {
+  return (
+    state.input_tokens +
+    state.output_tokens +
+    state.cache_creation_tokens +
+    state.cache_read_tokens
+  );
+}
+
+function durationSeconds(state: TranscriptCheckpoint | null): number {
+  if (state === null || state.first_timestamp === null || state.last_timestamp === null) {
+    return 0;
+  }
+  return (
+    (new Date(state.last_timestamp).getTime() - new Date(state.first_timestamp).getTime()) / 1000
+  );
+}
+
+/** Usage accumulated in a checkpoint, or null when it holds no tokens. */
+export function usageFromCheckpoint(state: TranscriptCheckpoint): TranscriptUsage | null {
+  return usageDelta(null, state);
+}
+
+/**
+ * Usage added between two checkpoints of the same transcript, or null when
+ * nothing new was burned. `previous` null means from the start of the file.
+ */
+export function usageDelta(
+  previous: TranscriptCheckpoint | null,
+  current: TranscriptCheckpoint,
+): TranscriptUsage | null {
+  const input_tokens = current.input_tokens - (previous?.input_tokens ?? 0);
+  const output_tokens = current.output_tokens - (previous?.output_tokens ?? 0);
+  const cache_creation_tokens =
+    current.cache_creation_tokens - (previous?.cache_creation_tokens ?? 0);
+  const cache_read_tokens = current.cache_read_tokens - (previous?.cache_read_tokens ?? 0);
+  const total_tokens = totalTokens(current) - (previous ? totalTokens(previous) : 0);
+
+  if (total_tokens <= 0) return null;
 
   return {
     total_tokens,
@@ -99,9 +147,81 @@ export async function parseTranscript(filePath: string): Promise<TranscriptUsage
     output_tokens,
     cache_creation_tokens,
     cache_read_tokens,
-    model,
-    message_count,
-    duration_s,
-    version,
+    model: current.model,
+    message_count: current.message_count - (previous?.message_count ?? 0),
+    duration_s: durationSeconds(current) - durationSeconds(previous),
+    version: current.version,
   };
 }
+
+export async function parseTranscript(filePath: string): Promise<TranscriptUsage | null> {
+  let content: string;
+  try {
+    content = fs.readFileSync(resolveTranscriptPath(filePath), 'utf-8');
+  } catch {
+    return null;
+  }
+
+  const state = emptyCheckpoint();
+  for (const line of content.split('\n')) {
+    accumulate(state, parseLine(line));
+  }
+  return usageFromCheckpoint(state);
+}
+
+/**
+ * Continue parsing a transcript from a checkpoint, stream-reading only the
+ * bytes appended since. Returns the advanced checkpoint, or null if the file
+ * cannot be read.
+ *
+ * A trailing line without a newline is only consumed if it is complete JSON;
+ * otherwise it is probably still being written and is left for the next call.
+ * A file shorter than the checkpoint offset was replaced, so it is re-read
+ * from the start.
+ */
+export async function readTranscriptFrom(
+  filePath: string,
+  checkpoint: TranscriptCheckpoint | null,
+): Promise<TranscriptCheckpoint | null> {
+  const resolvedPath = resolveTranscriptPath(filePath);
+
+  let size: number;
+  try {
+    size = (await fs.promises.stat(resolvedPath)).size;
+  } catch {
+    return null;
+  }
+
+  const state =
+    checkpoint !== null && checkpoint.offset <= size ? { ...checkpoint } : emptyCheckpoint();
+  if (state.offset === size) return state;
+
+  let pending = Buffer.alloc(0);
+  try {
+    const stream = fs.createReadStream(resolvedPath, { start: state.offset });
+    for await (const chunk of stream as AsyncIterable<Buffer>) {
+      pending = pending.length ? Buffer.concat([pending, chunk]) : chunk;
+      let lineStart = 0;
+      let newline = pending.indexOf(NEWLINE, lineStart);
+      while (newline !== -1) {
+        accumulate(state, parseLine(pending.toString('utf-8', lineStart, newline)));
+        lineStart = newline + 1;
+        newline = pending.indexOf(NEWLINE, lineStart);
+      }
+      state.offset += lineStart;
+      pending = pending.subarray(lineStart);
+    }
+  } catch {
+    return null;
+  }
+
+  if (pending.length) {
+    const entry = parseLine(pending.toString('utf-8'));
+    if (entry !== null) {
+      accumulate(state, entry);
+      state.offset += pending.length;
+    }
+  }
+
+  return state;
+}
@@ -1,9 +1,13 @@
-import { describe, it, expect, vi, afterEach } from 'vitest';
+import { describe, it, expect, vi, afterEach, beforeEach } from 'vitest';
 import fs from 'fs';
 import os from 'os';
 import path from 'path';
 import { fileURLToPath } from 'url';
-import { parseTranscript } from '../src/transcript-parser.js';
+import {
+  parseTranscript,
+  readTranscriptFrom,
+  usageDelta,
+} from '../src/transcript-parser.js';
 
 const FIXTURES_DIR = path.join(path.dirname(fileURLToPath(import.meta.url)), 'fixtures');
 
@@ -133,3 +137,91 @@ describe('parseTranscript', () => {
     });
   });
 });
+
+describe('readTranscriptFrom', () => {
+  let dir: string;
+  let file: string;
+
+  function append(...lines: string[]): void {
+    fs.appendFileSync(file, lines.map((line) => `${line}\n`).join(''));
+  }
+
+  beforeEach(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'fyt-transcript-'));
+    file = path.join(dir, 'session.jsonl');
+    fs.writeFileSync(file, '');
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  it('matches parseTranscript when read from the start', async () => {
+    const fixture = path.join(FIXTURES_DIR, 'transcript-v2.1.jsonl');
+    const checkpoint = await readTranscriptFrom(fixture, null);
+    expect(checkpoint!.offset).toBe(fs.statSync(fixture).size);
+    expect(usageDelta(null, checkpoint!)).toEqual(await parseTranscript(fixture));
+  });
+
+  it('parses only the bytes appended since the checkpoint', async () => {
+    append(makeAssistantLine({ input_tokens: 100, output_tokens: 50 }));
+    const first = await readTranscriptFrom(file, null);
+
+    append(
+      makeAssistantLine(
+        { input_tokens: 10, output_tokens: 5 },
+        { timestamp: '2024-01-01T00:00:30.000Z' },
+      ),
+    );
+    const streamSpy = vi.spyOn(fs, 'createReadStream');
+    const second = await readTranscriptFrom(file, first);
+
+    expect(streamSpy).toHaveBeenCalledWith(file, { start: first!.offset });
+    expect(second!.offset).toBe(fs.statSync(file).size);
+    const delta = usageDelta(first, second!);
+    expect(delta!.total_tokens).toBe(15);
+    expect(delta!.message_count).toBe(1);
+    expect(delta!.duration_s).toBe(30);
+  });
+
+  it('returns the checkpoint unchanged when nothing was appended', async () => {
+    append(makeAssistantLine({ input_tokens: 100, output_tokens: 50 }));
+    const first = await readTranscriptFrom(file, null);
+    const second = await readTranscriptFrom(file, first);
+    expect(second).toEqual(first);
+    expect(usageDelta(first, second!)).toBeNull();
+  });
+
+  it('leaves a partially written last line for the next read', async () => {
+    append(makeAssistantLine({ input_tokens: 100, output_tokens: 50 }));
+    const complete = makeAssistantLine({ input_tokens: 7, output_tokens: 3 });
+    fs.appendFileSync(file, complete.slice(0, 20));
+
+    const first = await readTranscriptFrom(file, null);
+    expect(first!.input_tokens).toBe(100);
+
+    fs.appendFileSync(file, `${complete.slice(20)}\n`);
+    const second = await readTranscriptFrom(file, first);
+    expect(second!.input_tokens).toBe(107);
+    expect(second!.offset).toBe(fs.statSync(file).size);
+  });
+
+  it('starts over when the file is shorter than the checkpoint', async () => {
+    append(
+      makeAssistantLine({ input_tokens: 100, output_tokens: 50 }),
+      makeAssistantLine({ input_tokens: 100, output_tokens: 50 }),
+    );
+    const first = await readTranscriptFrom(file, null);
+
+    fs.writeFileSync(file, `${makeAssistantLine({ input_tokens: 1, output_tokens: 1 })}\n`);
+    const second = await readTranscriptFrom(file, first);
+
+    expect(second!.input_tokens).toBe(1);
+    expect(second!.message_count).toBe(1);
+  });
+
+  it('returns null when the file does not exist', async () => {
+    expect(await readTranscriptFrom(path.join(dir, 'missing.jsonl'), null)).toBeNull();
+  });
+});